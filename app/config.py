@@ -0,0 +1,95 @@
+import os
+
+# Names of the CV data sections, matching DataService attribute names
+SECTION_NAMES = ("profile", "experiences", "education", "skills", "projects", "contact_info")
+
+
+class Settings:
+    """Application settings loaded from environment variables"""
+
+    def __init__(self):
+        self.environment = os.getenv("ENVIRONMENT", "development")
+
+        # API docs (/docs, /redoc, /openapi.json) are off by default in production
+        default_docs = "false" if self.environment == "production" else "true"
+        self.enable_docs = os.getenv("ENABLE_DOCS", default_docs).lower() == "true"
+        # OpenAPI document generated at build time (python -m app.docs <path>)
+        self.openapi_schema_path = os.getenv("OPENAPI_SCHEMA_PATH") or None
+
+        # Data backend: "mock" serves the built-in data, "dynamodb" loads it from a table
+        self.data_backend = os.getenv("DATA_BACKEND", "mock").lower()
+        if self.data_backend not in ("mock", "dynamodb"):
+            raise ValueError(f"Invalid DATA_BACKEND: {self.data_backend}")
+        self.cv_id = os.getenv("CV_ID", "default")
+        # Prebuilt snapshot served instead of the mock data, for fast cold starts
+        self.snapshot_path = os.getenv("CV_SNAPSHOT_PATH") or None
+        self.dynamodb_region = os.getenv("DYNAMODB_REGION", "us-east-1")
+        self.dynamodb_table_name = os.getenv("DYNAMODB_TABLE_NAME", "cv-data")
+        self.dynamodb_endpoint_url = os.getenv("DYNAMODB_ENDPOINT_URL") or None
+        # Size of the thread pool that runs blocking repository calls
+        self.repository_max_workers = int(os.getenv("REPOSITORY_MAX_WORKERS", "8"))
+        # How long a request waits for a section load (shared by concurrent requests)
+        self.load_timeout_seconds = float(os.getenv("LOAD_TIMEOUT_SECONDS", "10"))
+
+        # Freshness of repository-backed sections: after the TTL a section is
+        # served stale while it refreshes in the background, and after the
+        # stale window as well it is reloaded before being served.
+        # SECTION_TTL_SECONDS / SECTION_STALE_SECONDS set the defaults and
+        # e.g. SECTION_TTL_SKILLS overrides them for one section.
+        default_ttl = float(os.getenv("SECTION_TTL_SECONDS", "300"))
+        default_stale = float(os.getenv("SECTION_STALE_SECONDS", "3600"))
+        self.section_ttl = {
+            section: float(os.getenv(f"SECTION_TTL_{section.upper()}", default_ttl))
+            for section in SECTION_NAMES
+        }
+        self.section_stale = {
+            section: float(os.getenv(f"SECTION_STALE_{section.upper()}", default_stale))
+            for section in SECTION_NAMES
+        }
+
+        # "live" stamps each response with the time it was served (default),
+        # "stable" stamps it with the time its data last changed so bodies are
+        # byte-identical between edits and can be cached downstream
+        self.envelope_mode = os.getenv("ENVELOPE_MODE", "live").lower()
+        if self.envelope_mode not in ("live", "stable"):
+            raise ValueError(f"Invalid ENVELOPE_MODE: {self.envelope_mode}")
+
+        # JSON encoder backend: "auto" uses orjson when installed, else stdlib
+        self.json_encoder = os.getenv("JSON_ENCODER", "auto").lower()
+        if self.json_encoder not in ("auto", "orjson", "stdlib"):
+            raise ValueError(f"Invalid JSON_ENCODER: {self.json_encoder}")
+
+        # Admin write endpoints (PUT /admin/{section}) are off unless enabled
+        self.admin_enabled = os.getenv("ADMIN_ENABLED", "false").lower() == "true"
+        # Admin requests need a bearer JWT signed with JWT_SECRET_KEY; up to
+        # JWT_CACHE_SIZE verified tokens are remembered until they expire
+        self.jwt_secret_key = os.getenv("JWT_SECRET_KEY") or None
+        self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256").upper()
+        if self.jwt_algorithm not in ("HS256", "HS384", "HS512"):
+            raise ValueError(f"Invalid JWT_ALGORITHM: {self.jwt_algorithm}")
+        self.jwt_expiration_hours = float(os.getenv("JWT_EXPIRATION_HOURS", "24"))
+        self.jwt_cache_size = int(os.getenv("JWT_CACHE_SIZE", "1024"))
+
+        # Maximum number of encoded responses (including per-query variants) kept
+        self.response_cache_size = int(os.getenv("RESPONSE_CACHE_SIZE", "256"))
+
+        # Multi-tenant hosting: other CVs are served under /api/v1/{handle}/...
+        # and at most MAX_TENANTS of them are held in memory at once, each
+        # caching up to TENANT_RESPONSE_CACHE_SIZE encoded responses
+        self.max_tenants = int(os.getenv("MAX_TENANTS", "100"))
+        self.tenant_response_cache_size = int(os.getenv("TENANT_RESPONSE_CACHE_SIZE", "32"))
+
+        # Per-client rate limit (0 disables it): clients may burst up to
+        # RATE_LIMIT_BURST requests (default: one minute's worth) and buckets
+        # of at most RATE_LIMIT_MAX_CLIENTS clients are held in memory
+        self.rate_limit_requests_per_minute = int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "100"))
+        self.rate_limit_burst = int(os.getenv("RATE_LIMIT_BURST", "0")) or None
+        self.rate_limit_max_clients = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+
+        # Response compression: bodies below the minimum size are sent as-is
+        self.compression_min_size = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))
+        self.compression_cache_size = int(os.getenv("COMPRESSION_CACHE_SIZE", "256"))
+
+
+# Create singleton instance
+settings = Settings()
@@ -0,0 +1,73 @@
+"""API documentation routes
+
+The OpenAPI document is served as bytes held in memory. They come from a
+file generated at build time when OPENAPI_SCHEMA_PATH points at one, and
+are otherwise generated and encoded once, on the first request. The routes
+are only mounted when docs are enabled, which they are not by default in
+production.
+
+Generate the document at build time with:
+
+    python -m app.docs build/openapi.json
+"""
+import os
+import sys
+
+from fastapi import FastAPI, Request
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import Response
+
+from app.config import settings
+from app.utils.serializers import encode_json
+
+OPENAPI_URL = "/openapi.json"
+
+
+def openapi_body(app: FastAPI) -> bytes:
+    """Get the app's encoded OpenAPI document, loading or generating it on first use
+
+    The bytes are kept on app.state, so each app serves its own document.
+    """
+    body = getattr(app.state, "openapi_body", None)
+    if body is None:
+        path = settings.openapi_schema_path
+        if path and os.path.exists(path):
+            with open(path, "rb") as schema_file:
+                body = schema_file.read()
+        else:
+            body = encode_json(app.openapi())
+        app.state.openapi_body = body
+    return body
+
+
+def mount_docs(app: FastAPI) -> None:
+    """Add the OpenAPI, Swagger UI and ReDoc routes to app"""
+
+    @app.get(OPENAPI_URL, include_in_schema=False)
+    async def openapi_json(request: Request):
+        return Response(content=openapi_body(request.app), media_type="application/json")
+
+    @app.get("/docs", include_in_schema=False)
+    async def swagger_ui():
+        return get_swagger_ui_html(openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI")
+
+    @app.get("/redoc", include_in_schema=False)
+    async def redoc():
+        return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+
+
+def write_openapi(app: FastAPI, path: str) -> None:
+    """Write the app's OpenAPI document to path"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as schema_file:
+        schema_file.write(encode_json(app.openapi()))
+
+
+if __name__ == "__main__":
+    from app.main import app as main_app
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else "openapi.json"
+    write_openapi(main_app, output_path)
+    print(f"Wrote OpenAPI document to {output_path}")
@@ -0,0 +1,12 @@
+"""AWS Lambda entry point
+
+Configure the function handler as ``app.lambda_handler.handler``. Setting
+CV_SNAPSHOT_PATH to a snapshot shipped in the package skips building and
+validating the CV models during the cold start.
+"""
+from mangum import Mangum
+
+from app.main import app
+
+# Created at import so warm invocations reuse the app and its caches
+handler = Mangum(app, lifespan="off")
@@ -2,18 +2,41 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 
-from app.routes.cv_routes import router as cv_router
+from app.config import settings
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.rate_limit import InMemoryRateLimitStore, RateLimitMiddleware
+from app.routes.cv_routes import router as cv_router, tenant_not_found_handler
+from app.services.tenants import TenantNotFound, tenants
 from app.models.cv_models import HealthResponse
+from app.utils.serializers import APIJSONResponse
 
 # Create FastAPI instance
 app = FastAPI(
     title="CV Portfolio API",
     description="A serverless API providing information about my professional background",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
+    # Docs routes are mounted below, serving a precomputed OpenAPI document
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=APIJSONResponse
 )
 
+# Docs and admin modules are only imported when enabled, keeping them out of
+# production cold starts
+if settings.enable_docs:
+    from app.docs import mount_docs
+    mount_docs(app)
+
+# Limit requests per client; added before CORS so refusals carry CORS headers
+if settings.rate_limit_requests_per_minute > 0:
+    app.add_middleware(
+        RateLimitMiddleware,
+        requests_per_minute=settings.rate_limit_requests_per_minute,
+        burst=settings.rate_limit_burst,
+        store=InMemoryRateLimitStore(max_keys=settings.rate_limit_max_clients),
+    )
+
 # Add CORS middleware for web access
 app.add_middleware(
     CORSMiddleware,
@@ -23,15 +46,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include CV routes
-app.include_router(cv_router)
+# Compress responses, serving precompressed bodies for unchanged data
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    cache_size=settings.compression_cache_size,
+)
+
+# Include CV routes, for this deployment's CV and for other CVs by handle
+app.include_router(cv_router, prefix="/api/v1")
+app.include_router(cv_router, prefix="/api/v1/{handle}", tags=["Tenants"])
+app.add_exception_handler(TenantNotFound, tenant_not_found_handler)
+
+# Include admin routes when ADMIN_ENABLED is set; they refuse requests again if it is unset later
+if settings.admin_enabled:
+    from app.routes.admin_routes import AdminAccessError, admin_access_handler, bulk_router, router as admin_router
+    app.include_router(bulk_router)
+    app.include_router(admin_router, prefix="/admin")
+    app.include_router(admin_router, prefix="/admin/{handle}")
+    app.add_exception_handler(AdminAccessError, admin_access_handler)
 
 # Basic health check endpoint
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     return HealthResponse(
         status="healthy",
-        message="CV Portfolio API is running"
+        message="CV Portfolio API is running",
+        memory=tenants.memory_usage()
     )
 
 @app.get("/")
@@ -49,10 +90,13 @@ async def root():
             "skills": "/api/v1/skills",
             "projects": "/api/v1/projects",
             "contact": "/api/v1/contact",
-            "summary": "/api/v1/summary"
+            "summary": "/api/v1/summary",
+            "search": "/api/v1/search?q=",
+            "timeline": "/api/v1/timeline",
+            "other_cvs": "/api/v1/{handle}/summary"
         },
         "features": [
-            "JSON and XML response formats (use Accept header)",
+            "JSON, XML, MessagePack and CBOR response formats (use Accept header)",
             "Comprehensive API documentation",
             "Professional CV data endpoints",
             "Serverless-ready architecture"
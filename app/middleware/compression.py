@@ -0,0 +1,162 @@
+import gzip
+import importlib.util
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output deterministic for identical input
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _brotli(data: bytes) -> bytes:
+    import brotli
+
+    return brotli.compress(data, quality=5)
+
+
+def _zstd(data: bytes) -> bytes:
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+# Supported codecs in server preference order; optional ones only when installed
+CODECS: Dict[str, Callable[[bytes], bytes]] = {}
+if importlib.util.find_spec("zstandard") is not None:
+    CODECS["zstd"] = _zstd
+if importlib.util.find_spec("brotli") is not None:
+    CODECS["br"] = _brotli
+CODECS["gzip"] = _gzip
+
+
+def _parse_accept_encoding(accept_encoding: str) -> List[Tuple[str, float]]:
+    """Split an Accept-Encoding header into (coding, quality) pairs"""
+    codings = []
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        codings.append((coding, quality))
+    return codings
+
+
+def select_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported content coding for an Accept-Encoding header
+
+    The client's quality values win; ties go to the server's preference
+    order in CODECS. Returns None when no supported coding is acceptable.
+    """
+    if not accept_encoding:
+        return None
+    qualities = dict(_parse_accept_encoding(accept_encoding))
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in CODECS:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """Compresses response bodies according to Accept-Encoding
+
+    Bodies smaller than minimum_size, streamed bodies and responses that are
+    already encoded pass through untouched. Responses with a strong ETag are
+    byte-identical for as long as the ETag holds, so their compressed variants
+    are kept in a bounded LRU keyed by ETag and coding and only computed once
+    per body. This relies on strong ETags hashing every byte of the body
+    (including any timestamp), as the response cache's do. Compressed
+    responses get a weak ETag, as their bytes differ from the identity
+    representation.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, cache_size: int = 256):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, body: bytes, encoding: str, etag: Optional[str] = None) -> bytes:
+        """Compress body, reusing the cached variant when it has a strong ETag"""
+        if etag is None or etag.startswith("W/"):
+            return CODECS[encoding](body)
+
+        key = (etag, encoding)
+        compressed = self._cache.get(key)
+        if compressed is not None:
+            self._cache.move_to_end(key)
+            return compressed
+
+        compressed = CODECS[encoding](body)
+        self._cache[key] = compressed
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return compressed
+
+
+class _CompressionResponder:
+    """Buffers the start of one response and compresses its body if eligible"""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str):
+        self.middleware = middleware
+        self.downstream = send
+        self.encoding = encoding
+        self.initial_message: Optional[Message] = None
+        self.started = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.initial_message = message
+            return
+        if message["type"] != "http.response.body" or self.started:
+            await self.downstream(message)
+            return
+
+        self.started = True
+        body = message.get("body", b"")
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        if (
+            message.get("more_body", False)
+            or len(body) < self.middleware.minimum_size
+            or "content-encoding" in headers
+        ):
+            await self.downstream(self.initial_message)
+            await self.downstream(message)
+            return
+
+        etag = headers.get("etag")
+        compressed = self.middleware.compress(body, self.encoding, etag)
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        await self.downstream(self.initial_message)
+        await self.downstream({"type": "http.response.body", "body": compressed})
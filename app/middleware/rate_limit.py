@@ -0,0 +1,159 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.routes.cv_routes import create_error_response
+from app.utils.serializers import APIJSONResponse
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of taking a token from a client's bucket"""
+
+    allowed: bool
+    remaining: int
+    # Seconds until a token is available (0 when allowed) and until the bucket is full again
+    retry_after: float
+    reset_after: float
+
+
+class RateLimitStore(ABC):
+    """Token buckets by client key
+
+    The in-memory store limits each instance on its own; a store shared
+    between instances (e.g. Redis, running the same arithmetic in a script)
+    enforces one limit across all of them.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, rate: float, capacity: int) -> RateLimitDecision:
+        """Take one token from key's bucket, which refills at rate tokens per second up to capacity"""
+
+
+def refill(tokens: float, elapsed: float, rate: float, capacity: int) -> float:
+    """Tokens in a bucket after elapsed seconds of refilling"""
+    return min(capacity, tokens + elapsed * rate)
+
+
+def take(tokens: float, rate: float, capacity: int):
+    """Take one token if available, returning the decision and the tokens left"""
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    decision = RateLimitDecision(
+        allowed=allowed,
+        remaining=int(tokens),
+        retry_after=0.0 if allowed else (1 - tokens) / rate,
+        reset_after=(capacity - tokens) / rate,
+    )
+    return decision, tokens
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Token buckets held in this process, in an LRU of at most max_keys
+
+    Each bucket is a (tokens, updated) pair refilled lazily when touched, so
+    a request costs O(1). A bucket left idle long enough to refill is
+    indistinguishable from a new one and is dropped as soon as it reaches
+    the LRU's end; past max_keys the least recently used bucket is dropped
+    even if not yet full.
+    """
+
+    def __init__(self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def consume(self, key: str, rate: float, capacity: int) -> RateLimitDecision:
+        now = self.clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(capacity)
+        else:
+            tokens = refill(bucket[0], now - bucket[1], rate, capacity)
+            self._buckets.move_to_end(key)
+        decision, tokens = take(tokens, rate, capacity)
+        self._buckets[key] = [tokens, now]
+        self._evict(now, rate, capacity)
+        return decision
+
+    def _evict(self, now: float, rate: float, capacity: int) -> None:
+        """Drop idle buckets that have refilled, and the oldest ones past max_keys"""
+        while self._buckets:
+            tokens, updated = next(iter(self._buckets.values()))
+            if len(self._buckets) <= self.max_keys and refill(tokens, now - updated, rate, capacity) < capacity:
+                return
+            self._buckets.popitem(last=False)
+
+
+def client_key(scope: Scope) -> str:
+    """Rate limit key of a request: the client address
+
+    Behind API Gateway the adapter fills this in from the request's source
+    IP, which clients cannot spoof the way they can X-Forwarded-For.
+    """
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """Limits each client to requests_per_minute requests with token buckets
+
+    Clients may burst up to burst requests (requests_per_minute by default)
+    and then get one more request per 60 / requests_per_minute seconds.
+    Responses carry RateLimit-Limit, RateLimit-Remaining and RateLimit-Reset
+    headers; refused requests get a 429 with Retry-After.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests_per_minute: int = 100,
+        burst: Optional[int] = None,
+        store: Optional[RateLimitStore] = None,
+        key_func: Callable[[Scope], str] = client_key,
+        exempt_paths: Iterable[str] = ("/health",),
+    ):
+        self.app = app
+        self.capacity = burst or requests_per_minute
+        self.rate = requests_per_minute / 60
+        self.store = store or InMemoryRateLimitStore()
+        self.key_func = key_func
+        self.exempt_paths = frozenset(exempt_paths)
+        self.policy = f"{requests_per_minute};w=60"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        decision = await self.store.consume(self.key_func(scope), self.rate, self.capacity)
+        headers = {
+            "RateLimit-Limit": str(self.capacity),
+            "RateLimit-Remaining": str(decision.remaining),
+            "RateLimit-Reset": str(math.ceil(decision.reset_after)),
+            "RateLimit-Policy": self.policy,
+        }
+        if not decision.allowed:
+            headers["Retry-After"] = str(math.ceil(decision.retry_after))
+            response = APIJSONResponse(
+                content=create_error_response(message="Too many requests", error_code="RATE_LIMITED"),
+                status_code=429,
+                headers=headers
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,5 +1,5 @@
 from datetime import date, datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from pydantic import BaseModel, HttpUrl, Field
 from enum import Enum
 
@@ -92,9 +92,12 @@ class HealthResponse(BaseModel):
     message: str
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     version: str = "1.0.0"
+    memory: Optional[Dict[str, Any]] = Field(None, description="Approximate memory held by loaded CVs")
 
 
-# Admin Models (for later)
+# Admin Models
 class AdminUpdateRequest(BaseModel):
     section: str = Field(..., description="Section to update (profile, experience, etc.)")
-    data: Dict[str, Any] = Field(..., description="Data to update")
\ No newline at end of file
+    data: Union[Dict[str, Any], List[Dict[str, Any]]] = Field(
+        ..., description="Replacement data: an object for profile, a list of entries for the other sections"
+    )
\ No newline at end of file
@@ -0,0 +1,266 @@
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import APIRouter, Body, Depends, Header, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from app.config import settings
+from app.models.cv_models import AdminUpdateRequest
+from app.routes.cv_routes import create_error_response, create_success_response, get_tenant
+from app.services.auth import TokenError, token_verifier
+from app.services.bulk import BulkImport, aiter_lines, iter_ndjson, iter_repository_records, iter_service_records
+from app.services.data_service import VersionConflict
+from app.services.repository import as_async_repository
+from app.services.tenants import Tenant, tenants
+from app.utils.conditional import parse_if_match
+from app.utils.json_patch import PatchError, PatchTestFailed
+from app.utils.serializers import APIJSONResponse
+
+# Admin section names, matching the public endpoints, and the data sections they update
+ADMIN_SECTIONS = {
+    "profile": "profile",
+    "experience": "experiences",
+    "education": "education",
+    "skills": "skills",
+    "projects": "projects",
+    "contact": "contact_info",
+}
+
+
+class AdminAccessError(Exception):
+    """Raised when a request may not use the admin endpoints"""
+
+    def __init__(self, message: str, status_code: int = 403, error_code: str = "ADMIN_DISABLED", headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_code = error_code
+        self.headers = headers
+
+
+async def admin_access_handler(request: Request, error: AdminAccessError) -> APIJSONResponse:
+    """Create the error response for a refused admin request"""
+    return APIJSONResponse(
+        content=create_error_response(message=str(error), error_code=error.error_code),
+        status_code=error.status_code,
+        headers=error.headers
+    )
+
+
+def unauthorized(message: str, error: Optional[str] = None) -> AdminAccessError:
+    """Create a 401 error asking for a bearer token"""
+    challenge = "Bearer" if error is None else f'Bearer error="{error}", error_description="{message}"'
+    return AdminAccessError(message, status_code=401, error_code="UNAUTHORIZED", headers={"WWW-Authenticate": challenge})
+
+
+async def require_admin(authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
+    """Refuse admin requests unless the admin endpoints are enabled and a valid bearer token is sent"""
+    if not settings.admin_enabled:
+        raise AdminAccessError("Admin endpoints are disabled")
+    if token_verifier.secret is None:
+        raise AdminAccessError("Admin endpoints need JWT_SECRET_KEY", status_code=503, error_code="AUTH_NOT_CONFIGURED")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        raise unauthorized("Missing bearer token")
+    try:
+        return token_verifier.verify(token.strip())
+    except TokenError as e:
+        raise unauthorized(str(e), "invalid_token") from None
+
+
+# Create router for admin endpoints; like the CV router it is mounted both
+# for this deployment's CV and for other CVs by handle
+router = APIRouter(tags=["Admin"], dependencies=[Depends(require_admin)])
+
+# Bulk endpoints span every CV, so they are only mounted once, under /admin
+bulk_router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+def section_etag(digest: str) -> str:
+    """ETag of a section's content, for If-Match on later writes"""
+    return f'"{digest}"'
+
+
+def expected_digests(if_match: Optional[str]) -> Optional[Set[str]]:
+    """Section digests an If-Match header accepts, or None to accept any"""
+    return parse_if_match(if_match)
+
+
+def check_section(section: str) -> Optional[APIJSONResponse]:
+    """Create a 404 response for unknown admin sections"""
+    if section in ADMIN_SECTIONS:
+        return None
+    return APIJSONResponse(
+        content=create_error_response(message=f"Unknown section '{section}'", error_code="UNKNOWN_SECTION"),
+        status_code=404
+    )
+
+
+def create_update_response(tenant: Tenant, section: str, data_section: str, message: str) -> APIJSONResponse:
+    """Create the response for a successful section update"""
+    version = tenant.service.get_versions((data_section,))[0]
+    data = {
+        "section": section,
+        "version": version,
+        "updated_at": tenant.service.get_last_modified((data_section,)).isoformat(),
+    }
+    etag = section_etag(tenant.service.section_digest(data_section))
+    return APIJSONResponse(content=create_success_response(data, message), headers={"ETag": etag})
+
+
+def create_conflict_response(error: VersionConflict) -> APIJSONResponse:
+    """Create a 412 response for a write made against outdated section content"""
+    return APIJSONResponse(
+        content=create_error_response(message=str(error), error_code="VERSION_CONFLICT"),
+        status_code=412,
+        headers={"ETag": section_etag(error.current_digest)}
+    )
+
+
+@router.put("/{section}")
+async def update_section(
+    section: str,
+    update: AdminUpdateRequest,
+    tenant: Tenant = Depends(get_tenant),
+    if_match: Optional[str] = Header(None)
+):
+    """Replace one CV section
+
+    Only that section's model is validated, and only the cached responses
+    and indexes built from it are dropped. Send the ETag of a previous
+    write as If-Match to only update the section if it is still unchanged.
+    """
+    not_found = check_section(section)
+    if not_found is not None:
+        return not_found
+    if update.section != section:
+        return APIJSONResponse(
+            content=create_error_response(
+                message=f"Request body is for section '{update.section}', not '{section}'",
+                error_code="SECTION_MISMATCH"
+            ),
+            status_code=400
+        )
+
+    data_section = ADMIN_SECTIONS[section]
+    try:
+        await tenant.update_section(data_section, update.data, expected_digests(if_match))
+    except VersionConflict as e:
+        return create_conflict_response(e)
+    except ValidationError as e:
+        return APIJSONResponse(
+            content=create_error_response(message=f"Invalid {section} data: {e}", error_code="VALIDATION_ERROR"),
+            status_code=422
+        )
+    except Exception as e:
+        error_response = create_error_response(
+            message=f"Failed to update {section}: {str(e)}",
+            error_code="UPDATE_ERROR"
+        )
+        return APIJSONResponse(content=error_response, status_code=500)
+
+    return create_update_response(tenant, section, data_section, f"Updated {section}")
+
+
+@router.patch("/{section}")
+async def patch_section(
+    section: str,
+    operations: List[Any] = Body(..., media_type="application/json-patch+json"),
+    tenant: Tenant = Depends(get_tenant),
+    if_match: Optional[str] = Header(None)
+):
+    """Apply a JSON Patch (RFC 6902) to one CV section
+
+    Paths address entries by position, e.g. /2/name in skills. Only the
+    entries the patch touches are revalidated. Send the ETag of a previous
+    write as If-Match to only patch the section if it is still unchanged.
+    """
+    not_found = check_section(section)
+    if not_found is not None:
+        return not_found
+
+    data_section = ADMIN_SECTIONS[section]
+    try:
+        await tenant.patch_section(data_section, operations, expected_digests(if_match))
+    except VersionConflict as e:
+        return create_conflict_response(e)
+    except PatchTestFailed as e:
+        return APIJSONResponse(
+            content=create_error_response(message=str(e), error_code="PATCH_TEST_FAILED"),
+            status_code=409
+        )
+    except PatchError as e:
+        return APIJSONResponse(
+            content=create_error_response(message=f"Invalid patch: {e}", error_code="INVALID_PATCH"),
+            status_code=400
+        )
+    except ValidationError as e:
+        return APIJSONResponse(
+            content=create_error_response(message=f"Invalid {section} data: {e}", error_code="VALIDATION_ERROR"),
+            status_code=422
+        )
+    except Exception as e:
+        error_response = create_error_response(
+            message=f"Failed to patch {section}: {str(e)}",
+            error_code="PATCH_ERROR"
+        )
+        return APIJSONResponse(content=error_response, status_code=500)
+
+    return create_update_response(tenant, section, data_section, f"Patched {section}")
+
+
+@bulk_router.get("/export")
+def export_cvs():
+    """Stream every section of every CV as NDJSON
+
+    Each line is {"cv_id": ..., "section": ..., "data": ...}. CVs are read
+    from the repository one at a time, so the export is never held in
+    memory as a whole.
+    """
+    if tenants.repository is None:
+        records = iter_service_records(tenants.default.service)
+    else:
+        records = iter_repository_records(tenants.repository)
+    return StreamingResponse(iter_ndjson(records), media_type="application/x-ndjson")
+
+
+@bulk_router.post("/import")
+async def import_cvs(request: Request):
+    """Import NDJSON records as produced by /admin/export
+
+    The body is read as a stream and validated and written in batches, so
+    memory use stays flat however many records are sent. Invalid records
+    are skipped and reported. Imported CVs that are loaded are dropped and
+    reloaded on next use; this deployment's own CV picks the changes up on
+    its next refresh.
+    """
+    if tenants.repository is None:
+        return APIJSONResponse(
+            content=create_error_response(message="Importing needs a repository", error_code="NO_REPOSITORY"),
+            status_code=400
+        )
+
+    repository = as_async_repository(tenants.repository)
+    importer = BulkImport()
+
+    async def write(batch):
+        if batch:
+            await repository.save_items(batch)
+            importer.written(batch)
+            for cv_id in {cv_id for cv_id, _, _ in batch}:
+                tenants.evict(cv_id)
+
+    try:
+        async for line in aiter_lines(request.stream()):
+            await write(importer.add_line(line))
+        await write(importer.flush())
+    except Exception as e:
+        error_response = create_error_response(
+            message=f"Import stopped after {importer.imported} records: {str(e)}",
+            error_code="IMPORT_ERROR"
+        )
+        return APIJSONResponse(content=error_response, status_code=500)
+
+    report = importer.report()
+    return APIJSONResponse(content=create_success_response(
+        report, f"Imported {report['imported']} records, skipped {report['failed']} invalid records"
+    ))
@@ -1,12 +1,31 @@
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
-from typing import Any
+import heapq
+from fastapi import APIRouter, Depends, Query, Request
+from typing import Any, Optional, Tuple
 from datetime import datetime, timezone
 
-from app.services.data_service import data_service
+from app.config import SECTION_NAMES
+from app.models.cv_models import Profile, Experience, Education, Skill, SkillLevel, Project, ContactInfo
+from app.services.indexes import category_key, filter_key, group_positions, intersect, partition_positions
+from app.services.search import tokenize
+from app.services.tenants import Tenant, TenantNotFound, tenants
+from app.utils.projection import (
+    InvalidQueryError, parse_fields, parse_include, parse_section_fields, projection_key
+)
+from app.utils.intervals import Period, parse_period
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Ordering
+from app.utils.serializers import APIJSONResponse
 
-# Create router for CV endpoints
-router = APIRouter(prefix="/api/v1", tags=["CV"])
+# Create router for CV endpoints; it is mounted both at /api/v1 for this
+# deployment's CV and at /api/v1/{handle} for other CVs
+router = APIRouter(tags=["CV"])
+
+
+async def get_tenant(request: Request) -> Tenant:
+    """Resolve the CV a request is for: the handle in its path, or this deployment's own"""
+    handle = request.path_params.get("handle")
+    if handle is None:
+        return tenants.default
+    return await tenants.get(handle)
 
 
 def create_success_response(data: Any, message: str = "Success") -> dict:
@@ -30,244 +49,707 @@ def create_error_response(message: str, error_code: str = "INTERNAL_ERROR") -> d
     }
 
 
+async def tenant_not_found_handler(request: Request, error: TenantNotFound) -> APIJSONResponse:
+    """Create a 404 response for handles without a CV"""
+    return APIJSONResponse(
+        content=create_error_response(message=f"No CV found for '{error}'", error_code="TENANT_NOT_FOUND"),
+        status_code=404
+    )
+
+
+def create_invalid_query_response(error: InvalidQueryError) -> APIJSONResponse:
+    """Create a 400 response for unusable query parameters"""
+    return APIJSONResponse(
+        content=create_error_response(message=str(error), error_code="INVALID_QUERY"),
+        status_code=400
+    )
+
+
+# Payload builders - only run when the response cache misses.
+# Optional field sets are applied by model_dump, so unrequested fields are
+# never serialized.
+
+# Summary sections, the model of their entries and the stats keys
+SUMMARY_SECTIONS = ("profile", "recent_experience", "top_skills", "recent_projects", "primary_contact", "stats")
+SUMMARY_FIELDS = {
+    "profile": Profile.model_fields,
+    "recent_experience": Experience.model_fields,
+    "top_skills": Skill.model_fields,
+    "recent_projects": Project.model_fields,
+    "primary_contact": ContactInfo.model_fields,
+    "stats": ("total_experience_entries", "total_skills", "total_projects", "years_experience"),
+}
+
+# Data sections each summary section is built from
+SUMMARY_DATA_SECTIONS = {
+    "profile": ("profile",),
+    "recent_experience": ("experiences",),
+    "top_skills": ("skills",),
+    "recent_projects": ("projects",),
+    "primary_contact": ("contact_info",),
+    "stats": ("profile", "experiences", "skills", "projects"),
+}
+
+
+def summary_data_sections(include) -> Tuple[str, ...]:
+    """Data sections behind the summary sections in include (all when None)"""
+    needed = set()
+    for section in SUMMARY_SECTIONS if include is None else include:
+        needed.update(SUMMARY_DATA_SECTIONS[section])
+    return tuple(section for section in SECTION_NAMES if section in needed)
+
+
+def select(items, positions):
+    """Items at positions, or all of them when positions is None"""
+    return items if positions is None else [items[position] for position in positions]
+
+
+def filter_part(value: Optional[Any]):
+    """Cache key part for an optional, already normalized filter value"""
+    return None if value is None else [str(value)]
+
+
+def filtered(ordering: Ordering, positions):
+    """Restrict an ordering to positions, unless positions is None"""
+    return ordering if positions is None else ordering.restrict(set(positions))
+
+
+# Filters - answered by intersecting precomputed membership sets. Each
+# returns the matching positions, or None when no filter was given.
+
+def period_part(period: Optional[Period]):
+    """Cache key part for an optional date period"""
+    if period is None:
+        return None
+    start, end = period
+    return [f"{start or ''}..{end or ''}"]
+
+
+def filter_period(tenant: Tenant, section: str, filters: list, period: Optional[Period]) -> None:
+    """Add the positions of entries of section overlapping period to filters"""
+    if period is not None:
+        filters.append(tenant.views.interval_index(section).overlapping(*period))
+
+
+def filter_experiences(tenant: Tenant, technology: Optional[str] = None, period: Optional[Period] = None):
+    """Positions of experiences using technology and/or overlapping period"""
+    filters = []
+    filter_period(tenant, "experiences", filters, period)
+    if technology is not None:
+        filters.append(tenant.views.technology_index("experiences").get(technology, frozenset()))
+    return intersect(filters) if filters else None
+
+
+def filter_education(tenant: Tenant, period: Optional[Period] = None):
+    """Positions of education entries overlapping period"""
+    filters = []
+    filter_period(tenant, "education", filters, period)
+    return intersect(filters) if filters else None
+
+
+def filter_projects(
+    tenant: Tenant,
+    technology: Optional[str] = None,
+    current: Optional[bool] = None,
+    period: Optional[Period] = None
+):
+    """Positions of projects using technology, with the given current flag and/or overlapping period"""
+    filters = []
+    filter_period(tenant, "projects", filters, period)
+    if technology is not None:
+        filters.append(tenant.views.technology_index("projects").get(technology, frozenset()))
+    if current is not None:
+        current_positions, past_positions = tenant.views.project_partitions()
+        filters.append(current_positions if current else past_positions)
+    return intersect(filters) if filters else None
+
+
+def filter_skills(tenant: Tenant, level: Optional[str] = None, category: Optional[str] = None):
+    """Positions of skills at level and/or in category"""
+    filters = []
+    if level is not None:
+        filters.append(tenant.views.skill_level_index().get(level, []))
+    if category is not None:
+        filters.append(tenant.views.skill_category_index().get(category, []))
+    return intersect(filters) if filters else None
+
+
+def parse_skill_level(value: Optional[str]) -> Optional[str]:
+    """Normalize a level= filter, rejecting unknown levels"""
+    if value is None:
+        return None
+    level = filter_key(value)
+    if level not in {member.value for member in SkillLevel}:
+        raise InvalidQueryError(
+            f"Unknown skill level '{value}', expected one of: {', '.join(member.value for member in SkillLevel)}"
+        )
+    return level
+
+
+def build_page_payload(ordering: Ordering, cursor: Optional[str], limit: Optional[int], fields, noun: str):
+    """Build one page of a precomputed ordering and its message"""
+    page, next_cursor = ordering.page(cursor, limit or DEFAULT_PAGE_SIZE)
+    items = [item.model_dump(mode='json', include=fields) for item in page]
+    data = {
+        "items": items,
+        "next_cursor": next_cursor,
+        "limit": limit or DEFAULT_PAGE_SIZE,
+        "total": len(ordering)
+    }
+    return data, f"Retrieved {len(items)} of {len(ordering)} {noun}"
+
+
+def build_profile_payload(tenant: Tenant, fields=None):
+    """Build the profile payload and message"""
+    profile = tenant.service.get_profile()
+    # Convert Pydantic model to dict for consistent JSON serialization
+    profile_dict = profile.model_dump(mode='json', include=fields) if hasattr(profile, 'dict') else profile
+    return profile_dict, "Profile retrieved successfully"
+
+
+def build_experience_payload(tenant: Tenant, fields=None, positions=None):
+    """Build the work experience payload and message, limited to positions if given"""
+    experiences = select(tenant.service.get_experiences(), positions)
+    # Convert list of Pydantic models to list of dicts
+    experiences_dict = [
+        exp.model_dump(mode='json', include=fields) if hasattr(exp, 'dict') else exp
+        for exp in experiences
+    ]
+    return experiences_dict, f"Retrieved {len(experiences_dict)} work experience entries"
+
+
+def build_education_payload(tenant: Tenant, fields=None, positions=None):
+    """Build the education payload and message, limited to positions if given"""
+    education = select(tenant.service.get_education(), positions)
+    education_dict = [
+        edu.model_dump(mode='json', include=fields) if hasattr(edu, 'dict') else edu
+        for edu in education
+    ]
+    return education_dict, f"Retrieved {len(education_dict)} education entries"
+
+
+def build_skills_payload(tenant: Tenant, fields=None, positions=None):
+    """Build the skills payload and message, limited to positions if given"""
+    skills = select(tenant.service.get_skills(), positions)
+    skills_dict = [
+        skill.model_dump(mode='json', include=fields) if hasattr(skill, 'dict') else skill
+        for skill in skills
+    ]
+
+    # Group skills by category using the precomputed index; filtered
+    # selections are small enough to group directly
+    if positions is None:
+        category_index = tenant.views.skill_category_index()
+    else:
+        category_index = group_positions(skills, lambda skill: category_key(skill.category or 'Other'))
+    skills_by_category = {
+        category: [skills_dict[position] for position in category_positions]
+        for category, category_positions in category_index.items()
+    }
+
+    data = {
+        "all_skills": skills_dict,
+        "skills_by_category": skills_by_category,
+        "total_skills": len(skills_dict),
+        "categories": list(skills_by_category.keys())
+    }
+    return data, f"Retrieved {len(skills_dict)} skills across {len(skills_by_category)} categories"
+
+
+def build_projects_payload(tenant: Tenant, fields=None, positions=None):
+    """Build the projects payload and message, limited to positions if given"""
+    projects = select(tenant.service.get_projects(), positions)
+    projects_dict = [
+        project.model_dump(mode='json', include=fields) if hasattr(project, 'dict') else project
+        for project in projects
+    ]
+
+    # Separate current and past projects using the precomputed partition
+    if positions is None:
+        current_positions, past_positions = tenant.views.project_partitions()
+    else:
+        current_positions, past_positions = partition_positions(projects, lambda project: project.current)
+    current_projects = [projects_dict[position] for position in current_positions]
+    past_projects = [projects_dict[position] for position in past_positions]
+
+    data = {
+        "all_projects": projects_dict,
+        "current_projects": current_projects,
+        "past_projects": past_projects,
+        "total_projects": len(projects_dict)
+    }
+    return data, f"Retrieved {len(projects_dict)} projects ({len(current_projects)} current, {len(past_projects)} past)"
+
+
+def build_contact_payload(tenant: Tenant, fields=None):
+    """Build the contact payload and message"""
+    contact_info = tenant.service.get_contact_info()
+    contact_dict = [
+        contact.model_dump(mode='json', include=fields) if hasattr(contact, 'dict') else contact
+        for contact in contact_info
+    ]
+
+    # Separate primary and secondary contact methods using the precomputed partition
+    primary_positions, secondary_positions = tenant.views.contact_partitions()
+    primary_contacts = [contact_dict[position] for position in primary_positions]
+    secondary_contacts = [contact_dict[position] for position in secondary_positions]
+
+    data = {
+        "primary_contacts": primary_contacts,
+        "secondary_contacts": secondary_contacts,
+        "all_contacts": contact_dict
+    }
+    return data, f"Retrieved {len(contact_dict)} contact methods"
+
+
+def build_summary_payload(tenant: Tenant, include=None, fields=None):
+    """Build the CV summary payload and message
+
+    Only the sections in include (all when None) are built, and sections
+    with an entry in fields only dump those fields.
+    """
+    include = SUMMARY_SECTIONS if include is None else include
+    fields = fields or {}
+
+    # Fetch only the data the included sections are built from
+    needed = summary_data_sections(include)
+    profile = tenant.service.get_profile() if "profile" in needed else None
+    all_experiences = tenant.service.get_experiences() if "experiences" in needed else None
+    all_skills = tenant.service.get_skills() if "skills" in needed else None
+    all_projects = tenant.service.get_projects() if "projects" in needed else None
+    contact_info = tenant.service.get_contact_info() if "contact_info" in needed else None
+
+    summary_data = {}
+
+    if "profile" in include:
+        # Convert to dict
+        summary_data["profile"] = profile.model_dump(mode='json', include=fields.get("profile"))
+
+    if "recent_experience" in include:
+        # Get recent experience (last 2 positions)
+        summary_data["recent_experience"] = [
+            exp.model_dump(mode='json', include=fields.get("recent_experience"))
+            for exp in all_experiences[:2]
+        ]
+
+    if "top_skills" in include:
+        # Get top skills (advanced/expert level, max 8) from the precomputed index
+        summary_data["top_skills"] = [
+            all_skills[position].model_dump(mode='json', include=fields.get("top_skills"))
+            for position in tenant.views.top_skill_positions()
+        ]
+
+    if "recent_projects" in include:
+        # Get recent projects (last 3)
+        summary_data["recent_projects"] = [
+            project.model_dump(mode='json', include=fields.get("recent_projects"))
+            for project in all_projects[:3]
+        ]
+
+    if "primary_contact" in include:
+        # Get primary contact info from the precomputed partition
+        primary_positions, _ = tenant.views.contact_partitions()
+        summary_data["primary_contact"] = [
+            contact_info[position].model_dump(mode='json', include=fields.get("primary_contact"))
+            for position in primary_positions
+        ]
+
+    if "stats" in include:
+        stats = {
+            "total_experience_entries": len(all_experiences),
+            "total_skills": len(all_skills),
+            "total_projects": len(all_projects),
+            "years_experience": profile.years_experience
+        }
+        if "stats" in fields:
+            stats = {key: value for key, value in stats.items() if key in fields["stats"]}
+        summary_data["stats"] = stats
+
+    return summary_data, "CV summary retrieved successfully"
+
+
+# Sections merged into the timeline and the entry type reported for each
+TIMELINE_SECTIONS = {"experiences": "experience", "education": "education", "projects": "project"}
+
+
+def build_timeline_payload(tenant: Tenant, period: Optional[Period] = None):
+    """Build the timeline payload and message
+
+    Each section's interval index already lists its entries (and its
+    overlap matches) by start date, so the sections are merged rather than
+    sorted together.
+    """
+    streams = []
+    for order, (section, kind) in enumerate(TIMELINE_SECTIONS.items()):
+        index = tenant.views.interval_index(section)
+        positions = index.chronological() if period is None else index.overlapping(*period)
+        items = getattr(tenant.service, section)
+        streams.append([
+            ((items[position].start_date, order, position), kind, items[position])
+            for position in positions
+        ])
+    entries = [
+        {
+            "type": kind,
+            "start_date": item.start_date.isoformat(),
+            "end_date": item.end_date.isoformat() if item.end_date else None,
+            "current": item.current,
+            "item": item.model_dump(mode='json')
+        }
+        for _, kind, item in heapq.merge(*streams, key=lambda entry: entry[0])
+    ]
+    return entries, f"Retrieved {len(entries)} timeline entries"
+
+
+def build_search_payload(tenant: Tenant, query: str, limit: int):
+    """Build the search results payload and message"""
+    results = [
+        {"type": kind, "score": score, "item": item.model_dump(mode='json')}
+        for score, kind, item in tenant.search.search(query, limit)
+    ]
+    data = {
+        "query": query,
+        "results": results,
+        "total": len(results)
+    }
+    return data, f"Found {len(results)} results for '{query}'"
+
+
 @router.get("/me")
-async def get_profile():
-    """Get basic profile information"""
+async def get_profile(request: Request, tenant: Tenant = Depends(get_tenant), fields: Optional[str] = None):
+    """Get basic profile information
+
+    Use fields=name,title to return only some profile fields.
+    """
     try:
-        profile = data_service.get_profile()
-        # Convert Pydantic model to dict for consistent JSON serialization
-        profile_dict = profile.model_dump(mode='json') if hasattr(profile, 'dict') else profile
-        
-        response_data = create_success_response(
-            data=profile_dict,
-            message="Profile retrieved successfully"
+        field_set = parse_fields(fields, Profile.model_fields)
+        return await tenant.cache.render(
+            request,
+            projection_key("profile", fields=field_set),
+            ("profile",),
+            lambda: build_profile_payload(tenant, field_set)
         )
-        return JSONResponse(content=response_data)
-        
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
     except Exception as e:
         error_response = create_error_response(
             message=f"Failed to retrieve profile: {str(e)}",
             error_code="PROFILE_FETCH_ERROR"
         )
-        return JSONResponse(content=error_response, status_code=500)
+        return APIJSONResponse(content=error_response, status_code=500)
 
 
 @router.get("/experience")
-async def get_experience():
-    """Get work experience information"""
+async def get_experience(
+    request: Request,
+    tenant: Tenant = Depends(get_tenant),
+    fields: Optional[str] = None,
+    technology: Optional[str] = None,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """Get work experience information
+
+    Use fields=company,title to return only some fields of each entry and
+    technology=Next.js to return only entries using a technology
+    (case-insensitive). Use from=2022&to=2023 (YYYY, YYYY-MM or YYYY-MM-DD)
+    to return only entries overlapping that period. Pass limit (and then the returned next_cursor as
+    cursor) to page through entries, most recent first.
+    """
     try:
-        experiences = data_service.get_experiences()
-        # Convert list of Pydantic models to list of dicts
-        experiences_dict = [
-            exp.model_dump(mode='json') if hasattr(exp, 'dict') else exp 
-            for exp in experiences
-        ]
-        
-        response_data = create_success_response(
-            data=experiences_dict,
-            message=f"Retrieved {len(experiences_dict)} work experience entries"
+        field_set = parse_fields(fields, Experience.model_fields)
+        technology = None if technology is None else filter_key(technology)
+        period = parse_period(date_from, date_to)
+        key = projection_key(
+            "experience", fields=field_set, technology=filter_part(technology), period=period_part(period)
+        )
+        if limit is not None or cursor is not None:
+            return await tenant.cache.render(
+                request,
+                key + f"|limit={limit}|cursor={cursor}",
+                ("experiences",),
+                lambda: build_page_payload(
+                    filtered(tenant.views.experience_ordering(), filter_experiences(tenant, technology, period)),
+                    cursor, limit, field_set, "work experience entries"
+                )
+            )
+        return await tenant.cache.render(
+            request,
+            key,
+            ("experiences",),
+            lambda: build_experience_payload(tenant, field_set, filter_experiences(tenant, technology, period))
         )
-        return JSONResponse(content=response_data)
-        
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
     except Exception as e:
         error_response = create_error_response(
             message=f"Failed to retrieve experience: {str(e)}",
             error_code="EXPERIENCE_FETCH_ERROR"
         )
-        return JSONResponse(content=error_response, status_code=500)
+        return APIJSONResponse(content=error_response, status_code=500)
 
 
 @router.get("/education")
-async def get_education():
-    """Get education information"""
+async def get_education(
+    request: Request,
+    tenant: Tenant = Depends(get_tenant),
+    fields: Optional[str] = None,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to")
+):
+    """Get education information
+
+    Use fields=institution,degree to return only some fields of each entry
+    and from=2022&to=2023 to return only entries overlapping that period.
+    """
     try:
-        education = data_service.get_education()
-        education_dict = [
-            edu.model_dump(mode='json') if hasattr(edu, 'dict') else edu 
-            for edu in education
-        ]
-        
-        response_data = create_success_response(
-            data=education_dict,
-            message=f"Retrieved {len(education_dict)} education entries"
+        field_set = parse_fields(fields, Education.model_fields)
+        period = parse_period(date_from, date_to)
+        return await tenant.cache.render(
+            request,
+            projection_key("education", fields=field_set, period=period_part(period)),
+            ("education",),
+            lambda: build_education_payload(tenant, field_set, filter_education(tenant, period))
         )
-        return JSONResponse(content=response_data)
-        
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
     except Exception as e:
         error_response = create_error_response(
             message=f"Failed to retrieve education: {str(e)}",
             error_code="EDUCATION_FETCH_ERROR"
         )
-        return JSONResponse(content=error_response, status_code=500)
+        return APIJSONResponse(content=error_response, status_code=500)
 
 
 @router.get("/skills")
-async def get_skills():
-    """Get skills information"""
+async def get_skills(
+    request: Request,
+    tenant: Tenant = Depends(get_tenant),
+    fields: Optional[str] = None,
+    level: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """Get skills information
+
+    Use fields=name,level to return only some fields of each skill, and
+    level=advanced and/or category=Databases to return only matching skills
+    (case-insensitive). Pass limit (and then the returned next_cursor as
+    cursor) to page through skills by category and name.
+    """
     try:
-        skills = data_service.get_skills()
-        skills_dict = [
-            skill.model_dump(mode='json') if hasattr(skill, 'dict') else skill 
-            for skill in skills
-        ]
-        
-        # Group skills by category for better organization
-        skills_by_category = {}
-        for skill in skills_dict:
-            category = skill.get('category', 'Other')
-            # Convert category to snake_case for consistency
-            category_key = category.lower().replace(' ', '_').replace('&', 'and')
-            if category_key not in skills_by_category:
-                skills_by_category[category_key] = []
-            skills_by_category[category_key].append(skill)
-        
-        response_data = create_success_response(
-            data={
-                "all_skills": skills_dict,
-                "skills_by_category": skills_by_category,
-                "total_skills": len(skills_dict),
-                "categories": list(skills_by_category.keys())
-            },
-            message=f"Retrieved {len(skills_dict)} skills across {len(skills_by_category)} categories"
+        field_set = parse_fields(fields, Skill.model_fields)
+        level = parse_skill_level(level)
+        category = None if category is None else category_key(filter_key(category))
+        key = projection_key("skills", fields=field_set, level=filter_part(level), category=filter_part(category))
+        if limit is not None or cursor is not None:
+            return await tenant.cache.render(
+                request,
+                key + f"|limit={limit}|cursor={cursor}",
+                ("skills",),
+                lambda: build_page_payload(
+                    filtered(tenant.views.skill_ordering(), filter_skills(tenant, level, category)),
+                    cursor, limit, field_set, "skills"
+                )
+            )
+        return await tenant.cache.render(
+            request,
+            key,
+            ("skills",),
+            lambda: build_skills_payload(tenant, field_set, filter_skills(tenant, level, category))
         )
-        return JSONResponse(content=response_data)
-        
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
     except Exception as e:
         error_response = create_error_response(
             message=f"Failed to retrieve skills: {str(e)}",
             error_code="SKILLS_FETCH_ERROR"
         )
-        return JSONResponse(content=error_response, status_code=500)
+        return APIJSONResponse(content=error_response, status_code=500)
 
 
 @router.get("/projects")
-async def get_projects():
-    """Get projects information"""
+async def get_projects(
+    request: Request,
+    tenant: Tenant = Depends(get_tenant),
+    fields: Optional[str] = None,
+    technology: Optional[str] = None,
+    current: Optional[bool] = None,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """Get projects information
+
+    Use fields=name,url to return only some fields of each project, and
+    technology=Supabase and/or current=true to return only matching
+    projects (technology is case-insensitive). Use from=2022&to=2023 to
+    return only projects overlapping that period. Pass limit (and then the
+    returned next_cursor as cursor) to page through projects, most recent
+    first.
+    """
     try:
-        projects = data_service.get_projects()
-        projects_dict = [
-            project.model_dump(mode='json') if hasattr(project, 'dict') else project 
-            for project in projects
-        ]
-        
-        # Separate current and past projects
-        current_projects = [p for p in projects_dict if p.get('current', False)]
-        past_projects = [p for p in projects_dict if not p.get('current', False)]
-        
-        response_data = create_success_response(
-            data={
-                "all_projects": projects_dict,
-                "current_projects": current_projects,
-                "past_projects": past_projects,
-                "total_projects": len(projects_dict)
-            },
-            message=f"Retrieved {len(projects_dict)} projects ({len(current_projects)} current, {len(past_projects)} past)"
+        field_set = parse_fields(fields, Project.model_fields)
+        technology = None if technology is None else filter_key(technology)
+        period = parse_period(date_from, date_to)
+        key = projection_key(
+            "projects", fields=field_set, technology=filter_part(technology),
+            current=filter_part(current), period=period_part(period)
+        )
+        if limit is not None or cursor is not None:
+            return await tenant.cache.render(
+                request,
+                key + f"|limit={limit}|cursor={cursor}",
+                ("projects",),
+                lambda: build_page_payload(
+                    filtered(tenant.views.project_ordering(), filter_projects(tenant, technology, current, period)),
+                    cursor, limit, field_set, "projects"
+                )
+            )
+        return await tenant.cache.render(
+            request,
+            key,
+            ("projects",),
+            lambda: build_projects_payload(tenant, field_set, filter_projects(tenant, technology, current, period))
         )
-        return JSONResponse(content=response_data)
-        
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
     except Exception as e:
         error_response = create_error_response(
             message=f"Failed to retrieve projects: {str(e)}",
             error_code="PROJECTS_FETCH_ERROR"
         )
-        return JSONResponse(content=error_response, status_code=500)
+        return APIJSONResponse(content=error_response, status_code=500)
 
 
 @router.get("/contact")
-async def get_contact():
-    """Get contact information"""
+async def get_contact(request: Request, tenant: Tenant = Depends(get_tenant), fields: Optional[str] = None):
+    """Get contact information
+
+    Use fields=method,value to return only some fields of each contact.
+    """
     try:
-        contact_info = data_service.get_contact_info()
-        contact_dict = [
-            contact.model_dump(mode='json') if hasattr(contact, 'dict') else contact 
-            for contact in contact_info
-        ]
-        
-        # Separate primary and secondary contact methods
-        primary_contacts = [c for c in contact_dict if c.get('primary', False)]
-        secondary_contacts = [c for c in contact_dict if not c.get('primary', False)]
-        
-        response_data = create_success_response(
-            data={
-                "primary_contacts": primary_contacts,
-                "secondary_contacts": secondary_contacts,
-                "all_contacts": contact_dict
-            },
-            message=f"Retrieved {len(contact_dict)} contact methods"
+        field_set = parse_fields(fields, ContactInfo.model_fields)
+        return await tenant.cache.render(
+            request,
+            projection_key("contact", fields=field_set),
+            ("contact_info",),
+            lambda: build_contact_payload(tenant, field_set)
         )
-        return JSONResponse(content=response_data)
-        
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
     except Exception as e:
         error_response = create_error_response(
             message=f"Failed to retrieve contact info: {str(e)}",
             error_code="CONTACT_FETCH_ERROR"
         )
-        return JSONResponse(content=error_response, status_code=500)
+        return APIJSONResponse(content=error_response, status_code=500)
 
 
 @router.get("/summary")
-async def get_summary():
-    """Get a comprehensive summary of key CV information"""
+async def get_summary(
+    request: Request,
+    tenant: Tenant = Depends(get_tenant),
+    include: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """Get a comprehensive summary of key CV information
+
+    Use include=profile,top_skills to return only some sections and
+    fields=profile.name,top_skills.name to return only some fields of them.
+    """
     try:
-        # Fetch all data
-        profile = data_service.get_profile()
-        all_experiences = data_service.get_experiences()
-        all_skills = data_service.get_skills()
-        all_projects = data_service.get_projects()
-        contact_info = data_service.get_contact_info()
-        
-        # Convert to dicts
-        profile_dict = profile.model_dump(mode='json') if hasattr(profile, 'dict') else profile
-        
-        # Get recent experience (last 2 positions)
-        recent_experience = [
-            exp.model_dump(mode='json') if hasattr(exp, 'dict') else exp 
-            for exp in all_experiences[:2]
-        ]
-        
-        # Get top skills (advanced/expert level, max 8)
-        top_skills = [
-            skill.model_dump(mode='json') if hasattr(skill, 'dict') else skill
-            for skill in all_skills 
-            if skill.level.value in ["expert", "advanced"]
-        ][:8]
-        
-        # Get recent projects (last 3)
-        recent_projects = [
-            project.model_dump(mode='json') if hasattr(project, 'dict') else project
-            for project in all_projects[:3]
-        ]
-        
-        # Get primary contact info
-        primary_contact = [
-            contact.model_dump() if hasattr(contact, 'dict') else contact
-            for contact in contact_info
-            if contact.primary
-        ]
-        
-        summary_data = {
-            "profile": profile_dict,
-            "recent_experience": recent_experience,
-            "top_skills": top_skills,
-            "recent_projects": recent_projects,
-            "primary_contact": primary_contact,
-            "stats": {
-                "total_experience_entries": len(all_experiences),
-                "total_skills": len(all_skills),
-                "total_projects": len(all_projects),
-                "years_experience": profile_dict.get("years_experience", 0)
-            }
-        }
-        
-        response_data = create_success_response(
-            data=summary_data,
-            message="CV summary retrieved successfully"
+        include_set = parse_include(include, SUMMARY_SECTIONS)
+        section_fields = parse_section_fields(fields, SUMMARY_FIELDS)
+        field_paths = [f"{section}.{field}" for section, names in section_fields.items() for field in names]
+        return await tenant.cache.render(
+            request,
+            projection_key("summary", include=include_set, fields=field_paths or None),
+            summary_data_sections(include_set),
+            lambda: build_summary_payload(tenant, include_set, section_fields)
         )
-        return JSONResponse(content=response_data)
-        
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
     except Exception as e:
         error_response = create_error_response(
             message=f"Failed to retrieve summary: {str(e)}",
             error_code="SUMMARY_FETCH_ERROR"
         )
-        return JSONResponse(content=error_response, status_code=500)
\ No newline at end of file
+        return APIJSONResponse(content=error_response, status_code=500)
+
+
+@router.get("/search")
+async def search(
+    request: Request,
+    tenant: Tenant = Depends(get_tenant),
+    q: str = Query(..., min_length=1, description="Search terms; the last characters of each term may be left off"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """Search experiences, projects and skills
+
+    Every term must match, either exactly or as the start of a word.
+    Results are ranked by where the terms were found, technologies and
+    skill names weighing most.
+    """
+    try:
+        # Normalize the query so equivalent ones share a cache entry
+        terms = sorted(set(tokenize(q)))
+        if not terms:
+            raise InvalidQueryError("Search query contains no searchable terms")
+        return await tenant.cache.render(
+            request,
+            projection_key("search", q=terms, limit=[str(limit)]),
+            ("experiences", "projects", "skills"),
+            lambda: build_search_payload(tenant, " ".join(terms), limit)
+        )
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
+    except Exception as e:
+        error_response = create_error_response(
+            message=f"Failed to search CV: {str(e)}",
+            error_code="SEARCH_ERROR"
+        )
+        return APIJSONResponse(content=error_response, status_code=500)
+
+
+@router.get("/timeline")
+async def get_timeline(
+    request: Request,
+    tenant: Tenant = Depends(get_tenant),
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to")
+):
+    """Get experience, education and projects merged in order of start date
+
+    Use from=2022&to=2023 (YYYY, YYYY-MM or YYYY-MM-DD) to return only
+    entries overlapping that period.
+    """
+    try:
+        period = parse_period(date_from, date_to)
+        return await tenant.cache.render(
+            request,
+            projection_key("timeline", period=period_part(period)),
+            tuple(TIMELINE_SECTIONS),
+            lambda: build_timeline_payload(tenant, period)
+        )
+
+    except InvalidQueryError as e:
+        return create_invalid_query_response(e)
+    except Exception as e:
+        error_response = create_error_response(
+            message=f"Failed to retrieve timeline: {str(e)}",
+            error_code="TIMELINE_FETCH_ERROR"
+        )
+        return APIJSONResponse(content=error_response, status_code=500)
@@ -0,0 +1,192 @@
+"""Admin authentication with HMAC-signed JSON Web Tokens (RFC 7519)
+
+Admin requests carry "Authorization: Bearer <token>", signed with
+JWT_SECRET_KEY using JWT_ALGORITHM. Tokens for admin tools can be issued
+from the command line:
+
+    python -m app.services.auth <subject> [hours]
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.config import settings
+
+# Supported signing algorithms and their digests
+ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+class TokenError(ValueError):
+    """Raised when a token is malformed, wrongly signed, expired or revoked"""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+    except (binascii.Error, ValueError):
+        raise TokenError("Malformed token") from None
+
+
+def _sign(signing_input: bytes, secret: bytes, algorithm: str) -> bytes:
+    return hmac.new(secret, signing_input, ALGORITHMS[algorithm]).digest()
+
+
+def encode_token(claims: Dict[str, Any], secret: str, algorithm: str = "HS256") -> str:
+    """Sign claims into a compact JWT"""
+    header = _b64encode(json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":")).encode())
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = f"{header}.{payload}".encode("ascii")
+    return f"{header}.{payload}.{_b64encode(_sign(signing_input, secret.encode(), algorithm))}"
+
+
+def decode_token(token: str, secret: str, algorithm: str = "HS256", now: Optional[float] = None) -> Dict[str, Any]:
+    """Verify a JWT's signature and time claims and return its claims
+
+    Only the configured algorithm is accepted, whatever the header asks
+    for, and tokens must carry an exp claim.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise TokenError("Malformed token")
+    header_part, payload_part, signature_part = parts
+    try:
+        header = json.loads(_b64decode(header_part))
+    except ValueError:
+        raise TokenError("Malformed token") from None
+    if not isinstance(header, dict) or header.get("alg") != algorithm:
+        raise TokenError("Unexpected signing algorithm")
+
+    expected = _sign(f"{header_part}.{payload_part}".encode("ascii"), secret.encode(), algorithm)
+    if not hmac.compare_digest(expected, _b64decode(signature_part)):
+        raise TokenError("Invalid signature")
+
+    try:
+        claims = json.loads(_b64decode(payload_part))
+    except ValueError:
+        raise TokenError("Malformed token") from None
+    if not isinstance(claims, dict):
+        raise TokenError("Malformed token")
+    now = time.time() if now is None else now
+    if not isinstance(claims.get("exp"), (int, float)):
+        raise TokenError("Token has no expiry")
+    if claims["exp"] <= now:
+        raise TokenError("Token has expired")
+    if isinstance(claims.get("nbf"), (int, float)) and claims["nbf"] > now:
+        raise TokenError("Token is not valid yet")
+    return claims
+
+
+def token_hash(token: str) -> bytes:
+    """Cache key of a token, so raw tokens are not kept in memory"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+class TokenVerifier:
+    """Verifies bearer tokens, remembering verified ones in a bounded LRU
+
+    An admin tool sends the same token with every request, so after its
+    first verification a token costs one hash and a dict lookup until its
+    exp. Cached claims are shared between requests and must not be
+    modified.
+
+    Revoked tokens are dropped from the cache and refused until they
+    expire. is_revoked, when set, is called with the claims of every
+    token, cached or not, so it can consult a shared denylist (e.g. by
+    jti).
+    """
+
+    def __init__(
+        self,
+        secret: Optional[str],
+        algorithm: str = "HS256",
+        cache_size: int = 1024,
+        is_revoked: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.secret = secret
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        self.is_revoked = is_revoked
+        self.clock = clock
+        self._cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._revoked: Dict[bytes, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Claims of a valid token, from the cache when it was verified before"""
+        if self.secret is None:
+            raise TokenError("No signing key is configured")
+        now = self.clock()
+        key = token_hash(token)
+        cached = self._cache.get(key)
+        if cached is not None and cached[1] > now:
+            self._cache.move_to_end(key)
+            claims = cached[0]
+        else:
+            if cached is not None:
+                del self._cache[key]
+            if key in self._revoked:
+                raise TokenError("Token has been revoked")
+            claims = decode_token(token, self.secret, self.algorithm, now)
+            self._cache[key] = (claims, claims["exp"])
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        if self.is_revoked is not None and self.is_revoked(claims):
+            raise TokenError("Token has been revoked")
+        return claims
+
+    def revoke(self, token: str) -> None:
+        """Refuse a token from now on, until it expires"""
+        now = self.clock()
+        key = token_hash(token)
+        self._cache.pop(key, None)
+        if self.secret is None:
+            return
+        try:
+            expires = decode_token(token, self.secret, self.algorithm, now)["exp"]
+        except TokenError:
+            # Tokens that don't verify are refused anyway
+            return
+        self._revoked = {k: exp for k, exp in self._revoked.items() if exp > now}
+        self._revoked[key] = expires
+
+    def clear(self) -> None:
+        """Forget every verified token, e.g. after rotating the signing key"""
+        self._cache.clear()
+
+    def issue(self, subject: str, hours: Optional[float] = None) -> str:
+        """Sign a token for subject, valid for hours (JWT_EXPIRATION_HOURS by default)"""
+        if self.secret is None:
+            raise TokenError("No signing key is configured")
+        now = int(self.clock())
+        hours = settings.jwt_expiration_hours if hours is None else hours
+        claims = {"sub": subject, "iat": now, "exp": now + int(hours * 3600)}
+        return encode_token(claims, self.secret, self.algorithm)
+
+
+# Create singleton instance
+token_verifier = TokenVerifier(settings.jwt_secret_key, settings.jwt_algorithm, settings.jwt_cache_size)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python -m app.services.auth <subject> [hours]")
+    if token_verifier.secret is None:
+        sys.exit("Set JWT_SECRET_KEY to issue tokens")
+    print(token_verifier.issue(sys.argv[1], float(sys.argv[2]) if len(sys.argv) > 2 else None))
@@ -0,0 +1,186 @@
+"""Streaming NDJSON export and import of CV data
+
+Each line is one section of one CV:
+
+    {"cv_id": "default", "section": "skills", "data": [...]}
+
+Exports read one CV at a time and imports validate and write fixed-size
+batches, so memory use stays flat however many records are moved.
+
+    python -m app.services.bulk export backup.ndjson
+    python -m app.services.bulk import backup.ndjson
+"""
+import json
+import sys
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.services.data_service import SECTIONS, dump_section, parse_section
+from app.services.repository import SectionItem
+from app.services.tenants import HANDLE_PATTERN
+from app.utils.serializers import encode_json
+
+# Records validated and written together
+IMPORT_BATCH_SIZE = 100
+
+# Import errors kept for the report; later ones are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+# Export
+
+def iter_repository_records(repository, cv_ids: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Yield a record per section of every stored CV (or of cv_ids), one CV at a time"""
+    for cv_id in repository.list_cv_ids() if cv_ids is None else cv_ids:
+        sections = repository.load_sections(cv_id)
+        for section in SECTIONS:
+            if section in sections:
+                yield {"cv_id": cv_id, "section": section, "data": sections[section]}
+
+
+def iter_service_records(service) -> Iterator[Dict[str, Any]]:
+    """Yield a record per section of the CV held by a DataService"""
+    for section in SECTIONS:
+        yield {"cv_id": service.cv_id, "section": section, "data": dump_section(section, getattr(service, section))}
+
+
+def iter_ndjson(records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode records as NDJSON lines"""
+    for record in records:
+        yield encode_json(record) + b"\n"
+
+
+# Import
+
+class RecordError(ValueError):
+    """Raised when an import line is not a valid section record"""
+
+
+def parse_record(line: str) -> SectionItem:
+    """Parse and validate one NDJSON record, normalizing its data"""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise RecordError(f"Invalid JSON: {e}") from None
+    if not isinstance(record, dict):
+        raise RecordError("Record must be an object")
+    cv_id, section = record.get("cv_id"), record.get("section")
+    if not isinstance(cv_id, str) or not cv_id:
+        raise RecordError("Record needs a cv_id")
+    if not HANDLE_PATTERN.match(cv_id):
+        raise RecordError(f"Invalid cv_id: {cv_id!r}")
+    if section not in SECTIONS:
+        raise RecordError(f"Unknown section: {section!r}")
+    if "data" not in record:
+        raise RecordError("Record needs data")
+    try:
+        value = parse_section(section, record["data"])
+    except (TypeError, ValueError) as e:
+        raise RecordError(f"Invalid {section} data: {e}") from None
+    return cv_id, section, dump_section(section, value)
+
+
+class BulkImport:
+    """Collects NDJSON lines and validates them a batch at a time
+
+    add_line returns a batch of valid (cv_id, section, data) items whenever
+    batch_size lines have been collected, and flush returns the rest; the
+    caller writes each batch and reports it with written. Invalid lines are
+    counted and skipped.
+    """
+
+    def __init__(self, batch_size: int = IMPORT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[Tuple[int, str]] = []
+        self._line_number = 0
+        self._pending: List[Tuple[int, str]] = []
+
+    def add_line(self, line: str) -> Optional[List[SectionItem]]:
+        """Queue a line, returning a validated batch once one is full"""
+        self._line_number += 1
+        if line.strip():
+            self._pending.append((self._line_number, line))
+        if len(self._pending) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self) -> List[SectionItem]:
+        """Validate the queued lines and return the valid items"""
+        batch = []
+        for line_number, line in self._pending:
+            try:
+                batch.append(parse_record(line))
+            except RecordError as e:
+                self.failed += 1
+                if len(self.errors) < MAX_REPORTED_ERRORS:
+                    self.errors.append((line_number, str(e)))
+        self._pending = []
+        return batch
+
+    def written(self, batch: List[SectionItem]) -> None:
+        """Record that a batch was written"""
+        self.imported += len(batch)
+
+    def report(self) -> Dict[str, Any]:
+        """Counts and the first errors of the import"""
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": [{"line": line_number, "error": error} for line_number, error in self.errors],
+        }
+
+
+def import_lines(repository, lines: Iterable[str], batch_size: int = IMPORT_BATCH_SIZE) -> BulkImport:
+    """Validate NDJSON lines and write them to a repository in batches"""
+    importer = BulkImport(batch_size)
+    for line in lines:
+        batch = importer.add_line(line)
+        if batch:
+            repository.save_items(batch)
+            importer.written(batch)
+    batch = importer.flush()
+    if batch:
+        repository.save_items(batch)
+        importer.written(batch)
+    return importer
+
+
+async def aiter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a stream of byte chunks into lines without buffering the whole stream"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8")
+    if buffer:
+        yield buffer.decode("utf-8")
+
+
+if __name__ == "__main__":
+    from app.config import settings
+    from app.services.data_service import DataService
+    from app.services.repository import create_repository
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("export", "import"):
+        sys.exit("usage: python -m app.services.bulk export|import [path]")
+    command = sys.argv[1]
+    path = sys.argv[2] if len(sys.argv) > 2 else "-"
+    repository = create_repository()
+
+    if command == "export":
+        if repository is None:
+            records = iter_service_records(DataService(cv_id=settings.cv_id, snapshot_path=settings.snapshot_path))
+        else:
+            records = iter_repository_records(repository)
+        output = sys.stdout.buffer if path == "-" else open(path, "wb")
+        with output:
+            for line in iter_ndjson(records):
+                output.write(line)
+    else:
+        if repository is None:
+            sys.exit("Importing needs a repository (set DATA_BACKEND)")
+        with (sys.stdin if path == "-" else open(path, encoding="utf-8")) as lines:
+            result = import_lines(repository, lines)
+        print(json.dumps(result.report(), indent=2))
@@ -1,16 +1,344 @@
-from datetime import date
-from typing import List
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Collection, Dict, List, Optional, Tuple
 from app.models.cv_models import (
     Profile, Experience, Education, Skill, Project, ContactInfo,
     SkillLevel, ContactMethod
 )
+from app.config import SECTION_NAMES, settings
+from app.services.repository import (
+    StoredSection, WriteConflict, as_async_repository, create_repository, section_digest
+)
+from app.services.snapshot import load_snapshot
+from app.utils.json_patch import PatchError, apply_patch
+from app.utils.metrics import metrics
+from app.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+# Names of the data sections held by the service, matching its attribute names
+SECTIONS = SECTION_NAMES
+
+# Model of each section and whether the section holds a list of them
+SECTION_MODELS = {
+    "profile": (Profile, False),
+    "experiences": (Experience, True),
+    "education": (Education, True),
+    "skills": (Skill, True),
+    "projects": (Project, True),
+    "contact_info": (ContactInfo, True),
+}
+
+
+# Change time of the built-in mock data; move it on whenever the data is edited
+MOCK_DATA_UPDATED_AT = datetime(2026, 10, 16, tzinfo=timezone.utc)
+
+# Change time of stored sections written without one (or missing), the same on every instance
+UNKNOWN_UPDATED_AT = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Times a patch is recomputed when other instances keep changing its section
+PATCH_MAX_ATTEMPTS = 3
+
+
+class VersionConflict(Exception):
+    """Raised when a conditional write finds the section with other content"""
+    
+    def __init__(self, section: str, current_digest: str):
+        super().__init__(f"Section '{section}' has changed (now {current_digest})")
+        self.section = section
+        self.current_digest = current_digest
+
+
+def parse_section(section: str, raw: Any):
+    """Validate raw section data into its Pydantic model(s)"""
+    model, many = SECTION_MODELS[section]
+    if many:
+        return [model.model_validate(item) for item in raw]
+    return model.model_validate(raw)
+
+
+def dump_section(section: str, value: Any) -> Any:
+    """Convert a section's model(s) to JSON-compatible data"""
+    _, many = SECTION_MODELS[section]
+    if many:
+        return [item.model_dump(mode='json') for item in value]
+    return value.model_dump(mode='json')
 
 
 class DataService:
-    """Mock data service for CV information - will be replaced with DynamoDB later"""
+    """CV data service - serves the built-in mock data, or loads it from a repository
+    
+    A repository-backed service loads every section in one round trip on
+    creation, unless preload is False; then each section is loaded on first
+    use through the async interface. Concurrent loads of the same section
+    share a single repository call.
+    
+    Without a repository the data comes from a prebuilt snapshot when
+    snapshot_path is given, or from the built-in mock data otherwise.
+    
+    Each section's change time comes with its data (from the repository,
+    the snapshot or MOCK_DATA_UPDATED_AT), not from when it was loaded, so
+    every instance serving the same data reports the same Last-Modified.
+    
+    Repository-backed sections are kept with a TTL. Past it, the last good
+    value is still served while a background task refreshes it; only once
+    the stale window has passed as well does a request wait for a reload.
+    A load that finishes after a write to its section is discarded, so a
+    refresh never puts back data the write replaced.
+    """
+    
+    def __init__(
+        self,
+        repository=None,
+        cv_id: str = "default",
+        preload: bool = True,
+        load_timeout: Optional[float] = None,
+        ttl: Optional[Dict[str, float]] = None,
+        stale: Optional[Dict[str, float]] = None,
+        snapshot_path: Optional[str] = None,
+    ):
+        self.repository = repository
+        self.cv_id = cv_id
+        self._async_repository = None if repository is None else as_async_repository(repository)
+        self._loads = SingleFlight(timeout=settings.load_timeout_seconds if load_timeout is None else load_timeout)
+        self._ttl = {**settings.section_ttl, **(ttl or {})}
+        self._stale = {**settings.section_stale, **(stale or {})}
+        self._versions: Dict[str, int] = {}
+        self._updated_at: Dict[str, datetime] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._raw_digests: Dict[str, str] = {}
+        self._refresh_tasks = set()
+        self._write_lock = asyncio.Lock()
+        if repository is None:
+            if snapshot_path:
+                # Snapshot models were validated when it was built
+                sections, updated_at = load_snapshot(snapshot_path)
+                for section, value in sections.items():
+                    setattr(self, section, value)
+            else:
+                self._initialize_mock_data()
+                updated_at = dict.fromkeys(SECTIONS, MOCK_DATA_UPDATED_AT)
+            for section in SECTIONS:
+                self.mark_updated(section, updated_at[section])
+        elif preload:
+            self._load_from_repository()
+    
+    def _load_from_repository(self):
+        """Load every section with a single repository round trip"""
+        stored_sections = self.repository.load_stored_sections(self.cv_id)
+        if "profile" not in stored_sections:
+            raise LookupError(f"No CV data found for '{self.cv_id}'")
+        for section in SECTIONS:
+            self._store_raw_section(section, stored_sections.get(section, StoredSection([], None)))
+    
+    def _store_section(self, section: str, value: Any, updated_at: Optional[datetime] = None):
+        """Replace a section's value and record the change"""
+        setattr(self, section, value)
+        self._loaded_at[section] = time.monotonic()
+        self.mark_updated(section, updated_at)
+    
+    def _store_raw_section(self, section: str, stored: StoredSection):
+        """Validate and store raw section data, unless it is unchanged"""
+        digest = section_digest(stored.data)
+        if self.is_loaded(section) and self._raw_digests.get(section) == digest:
+            # Same data as before: keep the version so caches and ETags stay valid
+            self._loaded_at[section] = time.monotonic()
+            return
+        self._store_section(section, parse_section(section, stored.data), stored.updated_at or UNKNOWN_UPDATED_AT)
+        self._raw_digests[section] = digest
+    
+    def is_loaded(self, section: str) -> bool:
+        """Whether a section is held in memory"""
+        return section in self._versions
     
-    def __init__(self):
-        self._initialize_mock_data()
+    def _age(self, section: str) -> float:
+        return time.monotonic() - self._loaded_at[section]
+    
+    def _needs_load(self, section: str) -> bool:
+        """Whether a section must be (re)loaded before it can be served"""
+        if not self.is_loaded(section):
+            return True
+        if self._async_repository is None:
+            return False
+        return self._age(section) >= self._ttl[section] + self._stale[section]
+    
+    def _is_stale(self, section: str) -> bool:
+        """Whether a loaded section is past its TTL and due a background refresh"""
+        if self._async_repository is None or not self.is_loaded(section):
+            return False
+        return self._age(section) >= self._ttl[section]
+    
+    # Async access
+    async def load_section(self, section: str) -> Any:
+        """Get a section, loading it from the repository when missing or expired"""
+        if self._needs_load(section):
+            await self._loads.do(section, lambda: self._fetch_section(section))
+        elif self._is_stale(section):
+            self._schedule_refresh(section)
+        return getattr(self, section)
+    
+    async def load_sections(self, *sections: str) -> Dict[str, Any]:
+        """Get several sections, loading any missing or expired ones concurrently"""
+        missing = [section for section in sections if self._needs_load(section)]
+        if missing:
+            await asyncio.gather(*(self.load_section(section) for section in missing))
+        for section in sections:
+            if self._is_stale(section):
+                self._schedule_refresh(section)
+        return {section: getattr(self, section) for section in sections}
+    
+    async def _fetch_section(self, section: str):
+        """Fetch one section from the repository and store it, unless it was written meanwhile"""
+        version = self._versions.get(section)
+        stored_sections = await self._async_repository.load_stored_sections(self.cv_id, [section])
+        if self._versions.get(section) != version:
+            # A write landed while the load was in flight; what was read may predate it
+            return
+        if section == "profile" and section not in stored_sections:
+            raise LookupError(f"No CV data found for '{self.cv_id}'")
+        self._store_raw_section(section, stored_sections.get(section, StoredSection([], None)))
+    
+    def _schedule_refresh(self, section: str):
+        """Start a background refresh of a section unless one is running"""
+        if self._loads.in_flight(section):
+            return
+        task = asyncio.ensure_future(self._refresh(section))
+        # Hold a reference so the task isn't garbage collected mid-flight
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _refresh(self, section: str):
+        """Refresh a section in the background, recording failures instead of raising"""
+        try:
+            await self._loads.do(section, lambda: self._fetch_section(section))
+            metrics.increment("section_refreshes", section=section)
+        except Exception:
+            metrics.increment("section_refresh_failures", section=section)
+            logger.warning("Background refresh of '%s' failed", section, exc_info=True)
+    
+    # Writes
+    def section_digest(self, section: str) -> str:
+        """Content hash of a loaded section, the same on every instance holding that content"""
+        digest = self._raw_digests.get(section)
+        if digest is None:
+            # Mock and snapshot data weren't loaded from raw sections
+            digest = self._raw_digests[section] = section_digest(dump_section(section, getattr(self, section)))
+        return digest
+    
+    def _check_digest(self, section: str, expected_digests: Optional[Collection[str]]):
+        """Raise VersionConflict unless the in-memory section's digest is one of the expected ones
+        
+        Only meaningful without a repository; with one, this instance's copy
+        may be stale and the repository's conditional write decides.
+        """
+        if expected_digests is not None and self.section_digest(section) not in expected_digests:
+            raise VersionConflict(section, self.section_digest(section))
+    
+    async def _write_section(self, section: str, value: Any, expected_digests: Optional[Collection[str]] = None):
+        """Write a new section value to the repository, if there is one, then swap it in
+        
+        The repository checks expected_digests against what it holds, so a
+        write made on another instance since this one loaded the section is
+        caught too; the section is then reloaded before raising.
+        """
+        raw = dump_section(section, value)
+        updated_at = datetime.now(timezone.utc)
+        if self._async_repository is not None:
+            try:
+                await self._async_repository.save_section(self.cv_id, section, raw, expected_digests, updated_at)
+            except WriteConflict:
+                await self._fetch_section(section)
+                raise VersionConflict(section, self.section_digest(section)) from None
+        self._raw_digests[section] = section_digest(raw)
+        self._store_section(section, value, updated_at)
+    
+    async def update_section(
+        self,
+        section: str,
+        raw: Any,
+        expected_digests: Optional[Collection[str]] = None,
+    ) -> Any:
+        """Validate and replace one section, writing it to the repository first if there is one
+        
+        Only the section's own model is validated. The new value is built in
+        full and then swapped in, so readers see either the old section or
+        the new one, and only this section's version changes. When
+        expected_digests is given the section must have one of them, in the
+        repository if there is one.
+        """
+        value = parse_section(section, raw)
+        async with self._write_lock:
+            if self._async_repository is None:
+                self._check_digest(section, expected_digests)
+            await self._write_section(section, value, expected_digests)
+        return value
+    
+    async def patch_section(
+        self,
+        section: str,
+        operations: Any,
+        expected_digests: Optional[Collection[str]] = None,
+    ) -> Any:
+        """Apply a JSON Patch to one section, revalidating only the entries it touches
+        
+        The patch works on a copy of the section list in which entries stay
+        models until a path descends into them. Untouched entries are reused
+        as they are and only dumped or newly added entries are validated.
+        
+        With a repository the result is written on condition that the
+        section is still the one it was computed from; if another instance
+        changed it, the section is reloaded and the patch applied again.
+        """
+        async with self._write_lock:
+            if self._async_repository is None:
+                self._check_digest(section, expected_digests)
+                value = self._apply_patch(section, operations)
+                await self._write_section(section, value)
+                return value
+            
+            if self._needs_load(section):
+                await self._fetch_section(section)
+            reloaded = False
+            for _ in range(PATCH_MAX_ATTEMPTS):
+                base = self.section_digest(section)
+                if expected_digests is not None and base not in expected_digests:
+                    if reloaded:
+                        raise VersionConflict(section, base)
+                    # This copy may predate the one the client saw
+                    await self._fetch_section(section)
+                    reloaded = True
+                    continue
+                value = self._apply_patch(section, operations)
+                try:
+                    await self._write_section(section, value, {base})
+                    return value
+                except VersionConflict:
+                    reloaded = True
+            raise VersionConflict(section, self.section_digest(section))
+    
+    def _apply_patch(self, section: str, operations: Any) -> Any:
+        """New value of a section with a JSON Patch applied to its current value"""
+        model, many = SECTION_MODELS[section]
+        
+        def materialize(value):
+            if isinstance(value, model):
+                return value.model_dump(mode='json')
+            raise PatchError("Path does not exist")
+        
+        current = getattr(self, section)
+        if many:
+            patched = apply_patch(list(current), operations, materialize)
+            if not isinstance(patched, list):
+                raise PatchError(f"Section '{section}' must remain a list")
+            return [item if isinstance(item, model) else model.model_validate(item) for item in patched]
+        return model.model_validate(apply_patch(current.model_dump(mode='json'), operations))
+    
+    def export_sections(self) -> Dict[str, Any]:
+        """Get every section as JSON-compatible data, e.g. to seed a repository"""
+        return {section: dump_section(section, getattr(self, section)) for section in SECTIONS}
     
     def _initialize_mock_data(self):
         """Initialize mock CV data - replace with your actual information"""
@@ -178,6 +506,23 @@ class DataService:
             )
         ]
     
+    # Change tracking
+    def mark_updated(self, section: str, updated_at: Optional[datetime] = None) -> int:
+        """Record that a data section changed (at updated_at, or now) and return its new version"""
+        if section not in SECTIONS:
+            raise ValueError(f"Unknown data section: {section}")
+        self._versions[section] = self._versions.get(section, 0) + 1
+        self._updated_at[section] = updated_at or datetime.now(timezone.utc)
+        return self._versions[section]
+    
+    def get_versions(self, sections: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Get the current version of each of the given sections"""
+        return tuple(self._versions[section] for section in sections)
+    
+    def get_last_modified(self, sections: Tuple[str, ...]) -> datetime:
+        """Get the most recent change time across the given sections"""
+        return max(self._updated_at[section] for section in sections)
+    
     # Service methods
     def get_profile(self) -> Profile:
         """Get profile information"""
@@ -205,4 +550,8 @@ class DataService:
 
 
 # Create singleton instance
-data_service = DataService()
\ No newline at end of file
+data_service = DataService(
+    repository=create_repository(),
+    cv_id=settings.cv_id,
+    snapshot_path=settings.snapshot_path,
+)
\ No newline at end of file
@@ -0,0 +1,161 @@
+from typing import Any, Callable, Collection, Dict, FrozenSet, Iterable, List, Set, Tuple, TypeVar
+
+from app.services.data_service import data_service
+from app.utils.intervals import IntervalIndex
+from app.utils.pagination import Ordering
+
+T = TypeVar("T")
+
+# Skill levels that count towards the summary's top skills, and how many
+TOP_SKILL_LEVELS = ("expert", "advanced")
+TOP_SKILLS_LIMIT = 8
+
+
+def category_key(category: str) -> str:
+    """Convert a skill category to the snake_case key used in responses"""
+    return category.lower().replace(' ', '_').replace('&', 'and')
+
+
+def group_positions(items, key: Callable[[Any], str]) -> Dict[str, List[int]]:
+    """Positions of items grouped by key, in first-seen key order"""
+    groups: Dict[str, List[int]] = {}
+    for position, item in enumerate(items):
+        groups.setdefault(key(item), []).append(position)
+    return groups
+
+
+def partition_positions(items, predicate: Callable[[Any], bool]) -> Tuple[List[int], List[int]]:
+    """Positions of items for which predicate holds, and of the rest"""
+    matching, rest = [], []
+    for position, item in enumerate(items):
+        (matching if predicate(item) else rest).append(position)
+    return matching, rest
+
+
+def filter_key(value: str) -> str:
+    """Normalize a filter value so matching is case-insensitive"""
+    return value.strip().lower()
+
+
+def membership_index(items, keys: Callable[[Any], Iterable[Any]]) -> Dict[Any, FrozenSet[int]]:
+    """Positions of the items carrying each key, as sets to intersect"""
+    index: Dict[Any, Set[int]] = {}
+    for position, item in enumerate(items):
+        for key in keys(item):
+            index.setdefault(key, set()).add(position)
+    return {key: frozenset(positions) for key, positions in index.items()}
+
+
+def intersect(sets: List[Collection[int]]) -> List[int]:
+    """Sorted positions present in every collection, starting from the smallest"""
+    sets = sorted(sets, key=len)
+    return sorted(frozenset(sets[0]).intersection(*sets[1:]))
+
+
+class DerivedViews:
+    """Views derived from a data section, rebuilt only when that section changes
+
+    Each view is built from one section and tagged with the section version
+    it was built from, so an edit rebuilds just the views of the edited
+    section and routes otherwise only read precomputed structures. Views
+    are rebuilt whole and on first use after the edit, rather than patched
+    in place: a section holds tens of entries, so a rebuild costs about as
+    much as working out which entries an edit moved.
+    """
+
+    def __init__(self, service):
+        self._service = service
+        self._views: Dict[str, Tuple[str, Tuple[int, ...], Any]] = {}
+
+    def get(self, name: str, section: str, builder: Callable[[Any], T]) -> T:
+        """Get a view, building it from the section's current value if stale"""
+        version = self._service.get_versions((section,))
+        cached = self._views.get(name)
+        if cached is not None and cached[1] == version:
+            return cached[2]
+        value = builder(getattr(self._service, section))
+        self._views[name] = (section, version, value)
+        return value
+
+    def invalidate_section(self, section: str) -> None:
+        """Drop the views built from section, leaving the others in place"""
+        for name in [name for name, cached in self._views.items() if cached[0] == section]:
+            del self._views[name]
+
+    # Indexes hold ascending positions into the section list, so routes can
+    # pick entries from a list they dumped once and filters can intersect them
+    def skill_category_index(self) -> Dict[str, List[int]]:
+        """Skill positions by snake_case category key, in first-seen category order"""
+        return self.get(
+            "skills_by_category", "skills",
+            lambda items: group_positions(items, lambda skill: category_key(skill.category or 'Other')),
+        )
+
+    def skill_level_index(self) -> Dict[str, List[int]]:
+        """Skill positions by level"""
+        return self.get(
+            "skills_by_level", "skills",
+            lambda items: group_positions(items, lambda skill: skill.level.value),
+        )
+
+    def top_skill_positions(self) -> List[int]:
+        """Positions of the summary's top skills (advanced/expert, in data order)"""
+        return self.get(
+            "top_skills", "skills",
+            lambda items: [
+                position for position, skill in enumerate(items)
+                if skill.level.value in TOP_SKILL_LEVELS
+            ][:TOP_SKILLS_LIMIT],
+        )
+
+    def project_partitions(self) -> Tuple[List[int], List[int]]:
+        """Positions of current and of past projects"""
+        return self.get(
+            "projects_by_current", "projects",
+            lambda items: partition_positions(items, lambda project: project.current),
+        )
+
+    def contact_partitions(self) -> Tuple[List[int], List[int]]:
+        """Positions of primary and of secondary contact methods"""
+        return self.get(
+            "contacts_by_primary", "contact_info",
+            lambda items: partition_positions(items, lambda contact: contact.primary),
+        )
+
+    # Membership indexes answering filters by set intersection
+    def technology_index(self, section: str) -> Dict[str, FrozenSet[int]]:
+        """Positions of experiences or projects by lowercase technology"""
+        return self.get(
+            f"{section}_by_technology", section,
+            lambda items: membership_index(items, lambda item: {filter_key(tech) for tech in item.technologies}),
+        )
+
+    def interval_index(self, section: str) -> IntervalIndex:
+        """Date intervals of experiences, education or projects"""
+        return self.get(f"{section}_by_interval", section, IntervalIndex)
+
+    # Orderings used for cursor pagination
+    def experience_ordering(self) -> Ordering:
+        """Experiences, most recent start first"""
+        return self.get(
+            "experiences_by_start", "experiences",
+            lambda items: Ordering(items, lambda exp: (-exp.start_date.toordinal(), exp.id)),
+        )
+
+    def project_ordering(self) -> Ordering:
+        """Projects, most recent start first"""
+        return self.get(
+            "projects_by_start", "projects",
+            lambda items: Ordering(items, lambda project: (-project.start_date.toordinal(), project.id)),
+        )
+
+    def skill_ordering(self) -> Ordering:
+        """Skills by category, then name"""
+        return self.get(
+            "skills_by_category_name", "skills",
+            lambda items: Ordering(items, lambda skill: (skill.category.lower(), skill.name.lower())),
+        )
+
+
+# Create singleton instance
+views = DerivedViews(data_service)
@@ -0,0 +1,395 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.config import settings
+
+# Partition/sort key layout: one item per CV section
+#   pk = "CV#<cv_id>", sk = "SECTION#<section>", data = <section as a JSON string>,
+#   digest = <content hash of the section, checked by conditional writes>,
+#   updated_at = <ISO 8601 time the section was last written>
+PK_PREFIX = "CV#"
+SK_PREFIX = "SECTION#"
+
+# BatchGetItem / BatchWriteItem request limits
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+
+# Unprocessed batch items are retried with exponential backoff (and jitter),
+# starting at BATCH_BACKOFF_SECONDS and capped at BATCH_BACKOFF_MAX_SECONDS
+BATCH_MAX_ATTEMPTS = 8
+BATCH_BACKOFF_SECONDS = 0.05
+BATCH_BACKOFF_MAX_SECONDS = 2.0
+
+# (cv_id, section, data) - one stored section of one CV
+SectionItem = Tuple[str, str, Any]
+
+
+class StoredSection(NamedTuple):
+    """Raw data of a stored section and when it was last written
+
+    updated_at is None for sections written before write times were kept.
+    """
+
+    data: Any
+    updated_at: Optional[datetime]
+
+
+def section_digest(raw: Any) -> str:
+    """Content hash of raw section data, the same wherever the data is held"""
+    return hashlib.blake2b(json.dumps(raw, sort_keys=True).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class WriteConflict(Exception):
+    """Raised when a conditional write finds the stored section has another digest"""
+
+
+class BatchIncomplete(RuntimeError):
+    """Raised when part of a batch request is still unprocessed after every retry"""
+
+
+class CVRepository(ABC):
+    """Storage backend holding the raw (JSON-compatible) data of CV sections
+
+    Every section is stored with the time it was written, so all instances
+    serving it report the same change time.
+    """
+
+    @abstractmethod
+    def load_stored_sections(self, cv_id: str, sections: Optional[Iterable[str]] = None) -> Dict[str, StoredSection]:
+        """Load sections of a CV and their write times in one round trip; all of them when sections is None"""
+
+    def load_sections(self, cv_id: str, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Load the raw data of sections of a CV in one round trip; all of them when sections is None"""
+        return {section: stored.data for section, stored in self.load_stored_sections(cv_id, sections).items()}
+
+    @abstractmethod
+    def save_sections(self, cv_id: str, data: Dict[str, Any]) -> None:
+        """Write the given sections of a CV, replacing what was stored"""
+
+    @abstractmethod
+    def save_section(
+        self,
+        cv_id: str,
+        section: str,
+        raw: Any,
+        expected_digests: Optional[Collection[str]] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        """Write one section, raising WriteConflict unless the stored digest is one of expected_digests
+
+        The check and the write are one atomic operation of the backend, so
+        instances holding different copies of the section can't overwrite
+        each other's changes. expected_digests of None writes unconditionally.
+        updated_at defaults to the current time.
+        """
+
+    def save_items(self, items: Iterable[SectionItem]) -> None:
+        """Write sections of any number of CVs, batching them where the backend allows"""
+        for cv_id, section, value in items:
+            self.save_sections(cv_id, {section: value})
+
+    @abstractmethod
+    def list_cv_ids(self) -> Iterator[str]:
+        """Yield the id of every stored CV"""
+
+
+class AsyncCVRepository(ABC):
+    """Async counterpart of CVRepository, so loads never block the event loop"""
+
+    @abstractmethod
+    async def load_stored_sections(
+        self, cv_id: str, sections: Optional[Iterable[str]] = None
+    ) -> Dict[str, StoredSection]:
+        """Load sections of a CV and their write times in one round trip; all of them when sections is None"""
+
+    @abstractmethod
+    async def save_sections(self, cv_id: str, data: Dict[str, Any]) -> None:
+        """Write the given sections of a CV, replacing what was stored"""
+
+    @abstractmethod
+    async def save_section(
+        self,
+        cv_id: str,
+        section: str,
+        raw: Any,
+        expected_digests: Optional[Collection[str]] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        """Write one section, raising WriteConflict unless the stored digest is one of expected_digests"""
+
+    @abstractmethod
+    async def save_items(self, items: Iterable[SectionItem]) -> None:
+        """Write sections of any number of CVs, batching them where the backend allows"""
+
+
+class ThreadPoolRepository(AsyncCVRepository):
+    """Runs a synchronous repository's calls in a bounded thread pool
+
+    The pool is shared by every wrapped repository, so the number of
+    blocking backend calls in flight never exceeds its size.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, repository: CVRepository):
+        self.repository = repository
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.repository_max_workers,
+                thread_name_prefix="cv-repository",
+            )
+        return cls._executor
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor(), func, *args)
+
+    async def load_stored_sections(
+        self, cv_id: str, sections: Optional[Iterable[str]] = None
+    ) -> Dict[str, StoredSection]:
+        if sections is not None:
+            sections = list(sections)
+        return await self._run(self.repository.load_stored_sections, cv_id, sections)
+
+    async def save_sections(self, cv_id: str, data: Dict[str, Any]) -> None:
+        await self._run(self.repository.save_sections, cv_id, data)
+
+    async def save_section(
+        self,
+        cv_id: str,
+        section: str,
+        raw: Any,
+        expected_digests: Optional[Collection[str]] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        await self._run(self.repository.save_section, cv_id, section, raw, expected_digests, updated_at)
+
+    async def save_items(self, items: Iterable[SectionItem]) -> None:
+        await self._run(self.repository.save_items, list(items))
+
+
+def as_async_repository(repository) -> AsyncCVRepository:
+    """Wrap a synchronous repository for async use; async ones are returned as-is"""
+    if isinstance(repository, AsyncCVRepository):
+        return repository
+    return ThreadPoolRepository(repository)
+
+
+class InMemoryRepository(CVRepository):
+    """In-memory stand-in for DynamoDBRepository, for tests and offline development
+
+    Sections are stored as JSON strings, like in DynamoDB, so callers never
+    share mutable state with the store.
+    """
+
+    def __init__(self):
+        self._items: Dict[Tuple[str, str], str] = {}
+        self._digests: Dict[Tuple[str, str], str] = {}
+        self._updated_at: Dict[Tuple[str, str], datetime] = {}
+        self.load_calls = 0
+
+    def load_stored_sections(self, cv_id: str, sections: Optional[Iterable[str]] = None) -> Dict[str, StoredSection]:
+        self.load_calls += 1
+        wanted = None if sections is None else set(sections)
+        return {
+            section: StoredSection(json.loads(raw), self._updated_at[(item_cv_id, section)])
+            for (item_cv_id, section), raw in self._items.items()
+            if item_cv_id == cv_id and (wanted is None or section in wanted)
+        }
+
+    def save_sections(self, cv_id: str, data: Dict[str, Any]) -> None:
+        for section, value in data.items():
+            self._put(cv_id, section, value, datetime.now(timezone.utc))
+
+    def save_section(
+        self,
+        cv_id: str,
+        section: str,
+        raw: Any,
+        expected_digests: Optional[Collection[str]] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        if expected_digests is not None and self._digests.get((cv_id, section)) not in expected_digests:
+            raise WriteConflict(f"Section '{section}' of '{cv_id}' has changed")
+        self._put(cv_id, section, raw, updated_at or datetime.now(timezone.utc))
+
+    def _put(self, cv_id: str, section: str, raw: Any, updated_at: datetime) -> None:
+        self._items[(cv_id, section)] = json.dumps(raw)
+        self._digests[(cv_id, section)] = section_digest(raw)
+        self._updated_at[(cv_id, section)] = updated_at
+
+    def list_cv_ids(self) -> Iterator[str]:
+        for cv_id, section in list(self._items):
+            if section == "profile":
+                yield cv_id
+
+
+@lru_cache(maxsize=None)
+def get_dynamodb_client(region: str, endpoint_url: Optional[str] = None):
+    """Get a DynamoDB client, created once per process and reused across invocations
+
+    Lambda keeps module state between invocations of a warm container, so
+    this saves the client setup and lets connections be kept alive.
+    """
+    import boto3
+
+    return boto3.client("dynamodb", region_name=region, endpoint_url=endpoint_url or None)
+
+
+class DynamoDBRepository(CVRepository):
+    """CV sections stored in a DynamoDB table, one item per section"""
+
+    def __init__(self, table_name: str, client=None, sleep: Callable[[float], None] = time.sleep):
+        self.table_name = table_name
+        self._client = client
+        self._sleep = sleep
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_dynamodb_client(settings.dynamodb_region, settings.dynamodb_endpoint_url)
+        return self._client
+
+    def load_stored_sections(self, cv_id: str, sections: Optional[Iterable[str]] = None) -> Dict[str, StoredSection]:
+        if sections is None:
+            items = self._query_all(cv_id)
+        else:
+            items = self._batch_get(cv_id, list(sections))
+        return {
+            item["sk"]["S"][len(SK_PREFIX):]: StoredSection(
+                json.loads(item["data"]["S"]),
+                datetime.fromisoformat(item["updated_at"]["S"]) if "updated_at" in item else None,
+            )
+            for item in items
+        }
+
+    def save_sections(self, cv_id: str, data: Dict[str, Any]) -> None:
+        self.save_items((cv_id, section, value) for section, value in data.items())
+
+    def save_section(
+        self,
+        cv_id: str,
+        section: str,
+        raw: Any,
+        expected_digests: Optional[Collection[str]] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        """Write one section with PutItem, conditional on its stored digest when expected_digests is given"""
+        item = self._item(cv_id, section, raw, updated_at or datetime.now(timezone.utc))
+        kwargs = {"TableName": self.table_name, "Item": item}
+        if expected_digests is not None:
+            values = {f":digest{i}": {"S": digest} for i, digest in enumerate(sorted(expected_digests))}
+            if not values:
+                raise WriteConflict(f"Section '{section}' of '{cv_id}' has changed")
+            kwargs["ConditionExpression"] = f"#digest IN ({', '.join(values)})"
+            kwargs["ExpressionAttributeNames"] = {"#digest": "digest"}
+            kwargs["ExpressionAttributeValues"] = values
+        try:
+            self.client.put_item(**kwargs)
+        except self.client.exceptions.ConditionalCheckFailedException:
+            raise WriteConflict(f"Section '{section}' of '{cv_id}' has changed") from None
+
+    def save_items(self, items: Iterable[SectionItem]) -> None:
+        """Write items with BatchWriteItem, keeping only the last of any repeated (cv_id, section)
+
+        DynamoDB rejects a whole batch that puts the same key twice.
+        """
+        latest: Dict[Tuple[str, str], Any] = {}
+        for cv_id, section, value in items:
+            latest[(cv_id, section)] = value
+        updated_at = datetime.now(timezone.utc)
+        requests = [
+            {"PutRequest": {"Item": self._item(cv_id, section, value, updated_at)}}
+            for (cv_id, section), value in latest.items()
+        ]
+        for start in range(0, len(requests), BATCH_WRITE_LIMIT):
+            pending = {self.table_name: requests[start:start + BATCH_WRITE_LIMIT]}
+            for _ in self._batch_requests(self.client.batch_write_item, pending, "UnprocessedItems"):
+                pass
+
+    def list_cv_ids(self) -> Iterator[str]:
+        """Yield CV ids from a paginated Scan for profile items"""
+        kwargs = {
+            "TableName": self.table_name,
+            "ProjectionExpression": "pk",
+            "FilterExpression": "sk = :sk",
+            "ExpressionAttributeValues": {":sk": {"S": SK_PREFIX + "profile"}},
+        }
+        while True:
+            response = self.client.scan(**kwargs)
+            for item in response.get("Items", []):
+                yield item["pk"]["S"][len(PK_PREFIX):]
+            if "LastEvaluatedKey" not in response:
+                return
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _item(self, cv_id: str, section: str, raw: Any, updated_at: datetime) -> Dict[str, Any]:
+        """DynamoDB item holding one section, its digest and its write time"""
+        return {
+            "pk": {"S": PK_PREFIX + cv_id},
+            "sk": {"S": SK_PREFIX + section},
+            "data": {"S": json.dumps(raw)},
+            "digest": {"S": section_digest(raw)},
+            "updated_at": {"S": updated_at.isoformat()},
+        }
+
+    def _query_all(self, cv_id: str) -> List[Dict[str, Any]]:
+        """Fetch every section item of a CV with a single (paginated) Query"""
+        items = []
+        kwargs = {
+            "TableName": self.table_name,
+            "KeyConditionExpression": "pk = :pk AND begins_with(sk, :sk)",
+            "ExpressionAttributeValues": {":pk": {"S": PK_PREFIX + cv_id}, ":sk": {"S": SK_PREFIX}},
+        }
+        while True:
+            response = self.client.query(**kwargs)
+            items.extend(response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return items
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _batch_get(self, cv_id: str, sections: List[str]) -> List[Dict[str, Any]]:
+        """Fetch specific section items with BatchGetItem, retrying unprocessed keys"""
+        items = []
+        keys = [{"pk": {"S": PK_PREFIX + cv_id}, "sk": {"S": SK_PREFIX + section}} for section in sections]
+        for start in range(0, len(keys), BATCH_GET_LIMIT):
+            pending = {self.table_name: {"Keys": keys[start:start + BATCH_GET_LIMIT]}}
+            for response in self._batch_requests(self.client.batch_get_item, pending, "UnprocessedKeys"):
+                items.extend(response.get("Responses", {}).get(self.table_name, []))
+        return items
+
+    def _batch_requests(self, operation, pending: Dict[str, Any], unprocessed_key: str) -> Iterator[Dict[str, Any]]:
+        """Send a batch request and yield its responses, retrying the unprocessed part
+
+        Retries back off exponentially with jitter, so a throttled table is
+        not hammered, and give up with BatchIncomplete after
+        BATCH_MAX_ATTEMPTS requests.
+        """
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            if attempt:
+                delay = min(BATCH_BACKOFF_MAX_SECONDS, BATCH_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                self._sleep(random.uniform(delay / 2, delay))
+            response = operation(RequestItems=pending)
+            yield response
+            pending = response.get(unprocessed_key) or {}
+            if not pending:
+                return
+        raise BatchIncomplete(f"{unprocessed_key} left after {BATCH_MAX_ATTEMPTS} attempts")
+
+
+def create_repository() -> Optional[CVRepository]:
+    """Create the repository selected by DATA_BACKEND, or None for the built-in mock data"""
+    if settings.data_backend == "dynamodb":
+        return DynamoDBRepository(settings.dynamodb_table_name)
+    return None
@@ -0,0 +1,204 @@
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.config import settings
+from app.services.data_service import data_service
+from app.utils.conditional import format_http_date, is_not_modified
+from app.utils.serializers import ResponseFormat, negotiate_format
+
+
+class EncodedPayload:
+    """A cached payload encoded for one response format"""
+
+    __slots__ = ("format", "data", "message", "last_modified", "_stable_body", "_digest", "_stable_digest")
+
+    def __init__(self, fmt: ResponseFormat, data: bytes, message: bytes, last_modified: datetime):
+        self.format = fmt
+        self.data = data
+        self.message = message
+        self.last_modified = last_modified
+        self._stable_body: Optional[bytes] = None
+        self._digest: Optional[str] = None
+        self._stable_digest: Optional[str] = None
+
+    @property
+    def digest(self) -> str:
+        """Content hash of the encoded message and data"""
+        if self._digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            hasher.update(self.format.media_type.encode("ascii"))
+            hasher.update(self.message)
+            hasher.update(self.data)
+            self._digest = hasher.hexdigest()
+        return self._digest
+
+    @property
+    def stable_digest(self) -> str:
+        """Content hash of the full stable body, including its timestamp"""
+        if self._stable_digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            hasher.update(self.format.media_type.encode("ascii"))
+            hasher.update(self.stable_body)
+            self._stable_digest = hasher.hexdigest()
+        return self._stable_digest
+
+    @property
+    def stable_body(self) -> bytes:
+        """Full response body timestamped with the last data change"""
+        if self._stable_body is None:
+            self._stable_body = self.render(self.last_modified)
+        return self._stable_body
+
+    def render(self, timestamp: datetime) -> bytes:
+        """Full response body with the given envelope timestamp"""
+        return self.format.render_envelope(self.message, self.data, timestamp.isoformat())
+
+    def size_bytes(self) -> int:
+        """Bytes held by the encoded parts and the cached stable body"""
+        return len(self.data) + len(self.message) + len(self._stable_body or b"")
+
+
+class CachedPayload:
+    """Payload of a success response and the data versions it was built from
+
+    The built content is kept so each response format is encoded from it at
+    most once, without going back to the Pydantic models.
+    """
+
+    __slots__ = ("content", "message", "sections", "versions", "last_modified", "_encoded")
+
+    def __init__(
+        self,
+        content: Any,
+        message: str,
+        sections: Tuple[str, ...],
+        versions: Tuple[int, ...],
+        last_modified: datetime,
+    ):
+        self.content = content
+        self.message = message
+        self.sections = sections
+        self.versions = versions
+        self.last_modified = last_modified
+        self._encoded: Dict[str, EncodedPayload] = {}
+
+    def encoded(self, fmt: ResponseFormat) -> EncodedPayload:
+        """Get the payload encoded for fmt, encoding it on first use"""
+        encoded = self._encoded.get(fmt.name)
+        if encoded is None:
+            encoded = EncodedPayload(
+                fmt,
+                fmt.encode_data(self.content),
+                fmt.encode_message(self.message),
+                self.last_modified,
+            )
+            self._encoded[fmt.name] = encoded
+        return encoded
+
+    def size_bytes(self) -> int:
+        """Bytes held by every encoding of the payload"""
+        return sum(encoded.size_bytes() for encoded in self._encoded.values())
+
+
+class ResponseCache:
+    """Caches encoded response payloads until the data sections behind them change
+
+    Each entry holds the already-encoded ``data`` member of the success envelope
+    for every format requested so far, so serving a hit only needs the envelope
+    to be stitched around it. In the "stable" envelope mode the whole body is
+    cached as well. At most max_entries payloads are kept, evicting the least
+    recently used, so per-query variants cannot grow the cache without bound.
+    """
+
+    def __init__(self, service, max_entries: Optional[int] = None):
+        self._service = service
+        self.max_entries = settings.response_cache_size if max_entries is None else max_entries
+        self._entries: "OrderedDict[str, CachedPayload]" = OrderedDict()
+
+    def get_or_build(
+        self,
+        key: str,
+        sections: Tuple[str, ...],
+        builder: Callable[[], Tuple[Any, str]],
+    ) -> CachedPayload:
+        """Return the cached payload for key, rebuilding it if its sections changed"""
+        # Read versions before building so a concurrent edit leaves the entry stale
+        versions = self._service.get_versions(sections)
+        entry = self._entries.get(key)
+        if entry is None or entry.versions != versions:
+            last_modified = self._service.get_last_modified(sections)
+            content, message = builder()
+            entry = CachedPayload(content, message, sections, versions, last_modified)
+            self._entries[key] = entry
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def size_bytes(self) -> int:
+        """Bytes held by the encoded payloads in the cache"""
+        return sum(entry.size_bytes() for entry in self._entries.values())
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one cached payload, or every payload when no key is given"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def invalidate_section(self, section: str) -> None:
+        """Drop the payloads built from section, leaving the others in place"""
+        for key in [key for key, entry in self._entries.items() if section in entry.sections]:
+            del self._entries[key]
+
+    async def render(
+        self,
+        request: Request,
+        key: str,
+        sections: Tuple[str, ...],
+        builder: Callable[[], Tuple[Any, str]],
+    ) -> Response:
+        """Build a success response for key, serving the payload from cache
+
+        The backing sections are loaded first (concurrently, if any are not
+        yet in memory), so the builder only reads in-memory data. The format
+        is negotiated from the Accept header.
+
+        Responses carry an ETag derived from the encoded payload hash and a
+        Last-Modified date from the backing sections. Matching conditional
+        requests get an empty 304. The ETag is strong in the stable envelope
+        mode, where bodies are byte-identical, and hashes the whole body
+        including its timestamp; it is weak in the live mode, where only the
+        timestamp differs between bodies.
+        """
+        await self._service.load_sections(*sections)
+        fmt = negotiate_format(request.headers.get("accept"))
+        payload = self.get_or_build(key, sections, builder).encoded(fmt)
+        stable = settings.envelope_mode == "stable"
+        etag = f'"{payload.stable_digest}"' if stable else f'W/"{payload.digest}"'
+        headers = {
+            "ETag": etag,
+            "Last-Modified": format_http_date(payload.last_modified),
+            "Vary": "Accept",
+        }
+
+        if is_not_modified(request.headers, etag, payload.last_modified):
+            return Response(status_code=304, headers=headers)
+
+        if stable:
+            body = payload.stable_body
+        else:
+            body = payload.render(datetime.now(timezone.utc))
+        return Response(content=body, media_type=fmt.media_type, headers=headers)
+
+
+# Create singleton instance
+response_cache = ResponseCache(data_service)
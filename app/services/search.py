@@ -0,0 +1,120 @@
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Tuple
+
+from app.services.data_service import data_service
+from app.services.indexes import DerivedViews, views
+
+# Terms keep the punctuation of names like "C#", "C++" and "Node.js";
+# a trailing full stop is not part of the term
+_TERM = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+# Prefix matches count for this fraction of an exact match
+PREFIX_WEIGHT = 0.5
+
+# Searchable fields of each section and the weight of a term found in them
+SEARCH_FIELDS: Dict[str, Dict[str, float]] = {
+    "experiences": {"technologies": 3.0, "description": 1.0, "achievements": 1.0},
+    "projects": {"technologies": 3.0, "description": 1.0, "highlights": 1.0},
+    "skills": {"name": 3.0},
+}
+
+# Result type reported for each section
+RESULT_TYPES = {"experiences": "experience", "projects": "project", "skills": "skill"}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms"""
+    return _TERM.findall(text.lower())
+
+
+def _field_texts(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        return (value,)
+    return value or ()
+
+
+class InvertedIndex:
+    """Maps terms to the weighted positions of the items containing them
+
+    Terms are also kept sorted, so every term starting with a prefix is
+    found with a binary search.
+    """
+
+    def __init__(self, items, fields: Dict[str, float]):
+        self.postings: Dict[str, Dict[int, float]] = {}
+        for position, item in enumerate(items):
+            for field, weight in fields.items():
+                for text in _field_texts(getattr(item, field)):
+                    for term in tokenize(text):
+                        scores = self.postings.setdefault(term, {})
+                        scores[position] = scores.get(position, 0.0) + weight
+        self.terms = sorted(self.postings)
+
+    def prefixed(self, prefix: str) -> List[str]:
+        """Indexed terms starting with prefix"""
+        start = bisect_left(self.terms, prefix)
+        end = start
+        while end < len(self.terms) and self.terms[end].startswith(prefix):
+            end += 1
+        return self.terms[start:end]
+
+    def match(self, term: str) -> Dict[int, float]:
+        """Score of each item for one query term, counting prefix matches"""
+        scores: Dict[int, float] = {}
+        for indexed in self.prefixed(term):
+            factor = 1.0 if indexed == term else PREFIX_WEIGHT
+            for position, weight in self.postings[indexed].items():
+                scores[position] = max(scores.get(position, 0.0), weight * factor)
+        return scores
+
+    def search(self, terms: Iterable[str]) -> Dict[int, float]:
+        """Score of each item matching every term"""
+        results = None
+        for term in terms:
+            scores = self.match(term)
+            if results is None:
+                results = scores
+            else:
+                results = {
+                    position: score + scores[position]
+                    for position, score in results.items()
+                    if position in scores
+                }
+            if not results:
+                return {}
+        return results or {}
+
+
+class SearchIndex:
+    """Full-text search over experiences, projects and skills
+
+    Each section gets its own inverted index, held as a derived view so an
+    edit only re-indexes the section that changed.
+    """
+
+    def __init__(self, service, derived: DerivedViews):
+        self._service = service
+        self._views = derived
+
+    def index(self, section: str) -> InvertedIndex:
+        """The inverted index of one section"""
+        fields = SEARCH_FIELDS[section]
+        return self._views.get(f"search_{section}", section, lambda items: InvertedIndex(items, fields))
+
+    def search(self, query: str, limit: int) -> List[Tuple[float, str, Any]]:
+        """Best matches for query as (score, result type, item), highest score first"""
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+        ranked: List[Tuple[float, int, int, str, Any]] = []
+        for order, section in enumerate(SEARCH_FIELDS):
+            items = getattr(self._service, section)
+            for position, score in self.index(section).search(terms).items():
+                ranked.append((-score, order, position, RESULT_TYPES[section], items[position]))
+        ranked.sort(key=lambda hit: hit[:3])
+        return [(-score, kind, item) for score, _, _, kind, item in ranked[:limit]]
+
+
+# Create singleton instance
+search_index = SearchIndex(data_service, views)
@@ -0,0 +1,52 @@
+"""Prebuilt snapshots of the CV data for fast cold starts
+
+A snapshot holds the already-validated section models, pickled, so a cold
+Lambda container can restore them without building and validating every
+Pydantic model. It keeps each section's change time too, so every
+container restoring it serves the same Last-Modified. Snapshots are produced at build time from trusted data and
+shipped with the deployment package; never load one from an untrusted source.
+
+Build one from the configured data backend with:
+
+    python -m app.services.snapshot build/cv-snapshot.pickle
+"""
+import os
+import pickle
+import sys
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from app.config import SECTION_NAMES
+
+SNAPSHOT_FORMAT = 2
+
+
+def save_snapshot(service, path: str) -> None:
+    """Write every section of a DataService to a snapshot file"""
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "sections": {section: getattr(service, section) for section in SECTION_NAMES},
+        "updated_at": {section: service.get_last_modified((section,)) for section in SECTION_NAMES},
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as snapshot_file:
+        pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(path: str) -> Tuple[Dict[str, Any], Dict[str, datetime]]:
+    """Read the sections stored in a snapshot file and their change times"""
+    with open(path, "rb") as snapshot_file:
+        snapshot = pickle.load(snapshot_file)
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported snapshot format in {path}: {snapshot.get('format')}")
+    return snapshot["sections"], snapshot["updated_at"]
+
+
+if __name__ == "__main__":
+    from app.services.data_service import data_service
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else "cv-snapshot.pickle"
+    save_snapshot(data_service, output_path)
+    print(f"Wrote snapshot of '{data_service.cv_id}' to {output_path}")
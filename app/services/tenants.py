@@ -0,0 +1,162 @@
+import re
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.services.data_service import SECTIONS, DataService, data_service
+from app.services.indexes import DerivedViews, views
+from app.services.response_cache import ResponseCache, response_cache
+from app.services.search import SearchIndex, search_index
+from app.utils.single_flight import SingleFlight
+
+# Handles double as repository CV ids, so keep them to a safe alphabet
+HANDLE_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+
+class TenantNotFound(LookupError):
+    """Raised when a handle doesn't name a CV that can be served"""
+
+
+def estimate_size(value: Any, seen: Optional[set] = None) -> int:
+    """Approximate bytes held by value and everything it references"""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool, type)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, seen) for item in value)
+    if hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), seen)
+    return size
+
+
+class Tenant:
+    """One CV's data service with the views, search index and response cache built on it"""
+
+    def __init__(
+        self,
+        handle: str,
+        service: DataService,
+        derived: Optional[DerivedViews] = None,
+        search: Optional[SearchIndex] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.handle = handle
+        self.service = service
+        self.views = DerivedViews(service) if derived is None else derived
+        self.search = SearchIndex(service, self.views) if search is None else search
+        if cache is None:
+            cache = ResponseCache(service, max_entries=settings.tenant_response_cache_size)
+        self.cache = cache
+
+    def _invalidate(self, section: str) -> None:
+        """Drop only the views and responses built from section"""
+        self.views.invalidate_section(section)
+        self.cache.invalidate_section(section)
+
+    async def update_section(self, section: str, raw: Any, expected_digests=None) -> Any:
+        """Replace one section"""
+        value = await self.service.update_section(section, raw, expected_digests)
+        self._invalidate(section)
+        return value
+
+    async def patch_section(self, section: str, operations: Any, expected_digests=None) -> Any:
+        """Apply a JSON Patch to one section"""
+        await self.service.load_section(section)
+        value = await self.service.patch_section(section, operations, expected_digests)
+        self._invalidate(section)
+        return value
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Approximate bytes held by the tenant's models and cached responses
+
+        Model sizes are estimated once per section version.
+        """
+        models = sum(
+            self.views.get(f"{section}_size", section, estimate_size)
+            for section in SECTIONS
+            if self.service.is_loaded(section)
+        )
+        return {"models": models, "responses": self.cache.size_bytes()}
+
+
+class TenantStore:
+    """Tenants by handle, loaded on first use and kept in a size-bounded LRU
+
+    The default tenant (the CV_ID of this deployment) is always held. Other
+    handles are loaded lazily from the repository; once more than
+    max_tenants are held, the least recently used one is dropped along with
+    its models and cached responses.
+    """
+
+    def __init__(self, default: Tenant, repository=None, max_tenants: Optional[int] = None):
+        self.default = default
+        self.repository = repository
+        self.max_tenants = settings.max_tenants if max_tenants is None else max_tenants
+        self._tenants: "OrderedDict[str, Tenant]" = OrderedDict()
+        self._loads = SingleFlight(timeout=settings.load_timeout_seconds)
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._tenants
+
+    async def get(self, handle: str) -> Tenant:
+        """Get the tenant for handle, loading it on first use"""
+        if handle == self.default.handle:
+            return self.default
+        tenant = self._tenants.get(handle)
+        if tenant is None:
+            if self.repository is None or not HANDLE_PATTERN.match(handle):
+                raise TenantNotFound(handle)
+            tenant = await self._loads.do(handle, lambda: self._load(handle))
+        if handle in self._tenants:
+            self._tenants.move_to_end(handle)
+        return tenant
+
+    async def _load(self, handle: str) -> Tenant:
+        """Create a tenant, checking the CV exists by loading its profile"""
+        service = DataService(repository=self.repository, cv_id=handle, preload=False)
+        try:
+            await service.load_section("profile")
+        except LookupError:
+            raise TenantNotFound(handle) from None
+        tenant = Tenant(handle, service)
+        self._tenants[handle] = tenant
+        while len(self._tenants) > self.max_tenants:
+            self._tenants.popitem(last=False)
+        return tenant
+
+    def evict(self, handle: Optional[str] = None) -> None:
+        """Drop one loaded tenant, or all of them when no handle is given"""
+        if handle is None:
+            self._tenants.clear()
+        else:
+            self._tenants.pop(handle, None)
+
+    def memory_usage(self, per_tenant: bool = False) -> Dict[str, Any]:
+        """Approximate bytes held by the loaded tenants, optionally broken down per tenant"""
+        usage = {self.default.handle: self.default.memory_usage()}
+        for handle, tenant in self._tenants.items():
+            usage[handle] = tenant.memory_usage()
+        report: Dict[str, Any] = {
+            "loaded_tenants": len(self._tenants),
+            "max_tenants": self.max_tenants,
+            "total_bytes": sum(sum(parts.values()) for parts in usage.values()),
+        }
+        if per_tenant:
+            report["per_tenant"] = usage
+        return report
+
+
+# Create singleton instance
+default_tenant = Tenant(settings.cv_id, data_service, views, search_index, response_cache)
+tenants = TenantStore(default_tenant, data_service.repository)
@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Mapping, Optional, Set
+
+
+def format_http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date (RFC 7231 IMF-fixdate)"""
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def parse_http_date(value: str) -> Optional[datetime]:
+    """Parse an HTTP date header, returning None if it is malformed"""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _opaque_tag(tag: str) -> str:
+    """Strip the weak indicator so tags can be compared weakly"""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison"""
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == target for tag in if_none_match.split(","))
+
+
+def parse_if_match(value: Optional[str]) -> Optional[Set[str]]:
+    """Opaque tags an If-Match header accepts, or None when it is absent or "*"
+
+    If-Match uses strong comparison, so weak tags are left out and can
+    never match.
+    """
+    if value is None or value.strip() == "*":
+        return None
+    tags = (tag.strip() for tag in value.split(","))
+    return {tag[1:-1] for tag in tags if len(tag) >= 2 and tag.startswith('"') and tag.endswith('"')}
+
+
+def is_not_modified(headers: Mapping[str, str], etag: str, last_modified: datetime) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since for a GET request
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client sent no entity tags (RFC 7232 section 6).
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None:
+        since = parse_http_date(if_modified_since)
+        # HTTP dates only carry whole seconds
+        return since is not None and last_modified.replace(microsecond=0) <= since
+
+    return False
@@ -0,0 +1,111 @@
+import calendar
+import re
+from bisect import bisect_right
+from datetime import date
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.utils.projection import InvalidQueryError
+
+# Dates given as YYYY, YYYY-MM or YYYY-MM-DD
+_DATE_BOUND = re.compile(r"^(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?$")
+
+Period = Tuple[Optional[date], Optional[date]]
+
+
+def parse_date_bound(value: Optional[str], end: bool = False) -> Optional[date]:
+    """Parse a from=/to= date, where a year or month covers the whole period
+
+    A partial date is the first day of its period, or the last day when
+    end is true, so from=2022&to=2023 spans both years.
+    """
+    if value is None:
+        return None
+    match = _DATE_BOUND.match(value.strip())
+    if match is None:
+        raise InvalidQueryError(f"Invalid date '{value}', expected YYYY, YYYY-MM or YYYY-MM-DD")
+    year, month, day = (int(part) if part else None for part in match.groups())
+    try:
+        if month is None:
+            return date(year, 12, 31) if end else date(year, 1, 1)
+        if day is None:
+            return date(year, month, calendar.monthrange(year, month)[1] if end else 1)
+        return date(year, month, day)
+    except ValueError:
+        raise InvalidQueryError(f"Invalid date '{value}'") from None
+
+
+def parse_period(date_from: Optional[str], date_to: Optional[str]) -> Optional[Period]:
+    """Parse from=/to= into a period, or None when neither is given"""
+    if date_from is None and date_to is None:
+        return None
+    start = parse_date_bound(date_from)
+    end = parse_date_bound(date_to, end=True)
+    if start is not None and end is not None and start > end:
+        raise InvalidQueryError("from must not be after to")
+    return start, end
+
+
+def interval_end(item: Any) -> date:
+    """Last day of an item's interval; ongoing items never end"""
+    if item.current or item.end_date is None:
+        return date.max
+    return item.end_date
+
+
+class IntervalIndex:
+    """Date intervals of items, sorted by start and augmented with the latest end
+
+    Items overlapping a period are those starting before it ends and ending
+    after it starts. The first condition is a prefix of the start-sorted
+    items, found by binary search. The second is answered by an implicit
+    balanced tree over that order, where each node holds the latest end in
+    its subtree, so subtrees without a match are skipped. A query walks
+    O(log n) nodes per match (O(log n) when nothing matches), instead of
+    every item that starts before the period ends, and returns positions
+    already in start order.
+    """
+
+    def __init__(self, items: Sequence[Any]):
+        by_start = sorted((item.start_date, position) for position, item in enumerate(items))
+        self.starts: List[date] = [start for start, _ in by_start]
+        self.positions: List[int] = [position for _, position in by_start]
+        self.ends: List[date] = [interval_end(items[position]) for position in self.positions]
+        # max_ends[mid] is the latest end in the subtree rooted at mid, the
+        # middle of the range it covers
+        self.max_ends: List[date] = list(self.ends)
+        self._build(0, len(self.ends))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _build(self, lo: int, hi: int) -> date:
+        if lo >= hi:
+            return date.min
+        mid = (lo + hi) // 2
+        self.max_ends[mid] = max(self.ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+        return self.max_ends[mid]
+
+    def _collect(self, lo: int, hi: int, limit: int, start: date, found: List[int]) -> None:
+        """Add positions in [lo, hi) before limit that end on or after start, in order"""
+        if lo >= hi or lo >= limit:
+            return
+        mid = (lo + hi) // 2
+        if self.max_ends[mid] < start:
+            return
+        self._collect(lo, mid, limit, start, found)
+        if mid < limit and self.ends[mid] >= start:
+            found.append(self.positions[mid])
+        self._collect(mid + 1, hi, limit, start, found)
+
+    def overlapping(self, start: Optional[date], end: Optional[date]) -> List[int]:
+        """Positions of items whose interval overlaps [start, end], in start order; bounds may be open"""
+        limit = len(self.starts) if end is None else bisect_right(self.starts, end)
+        if start is None:
+            return self.positions[:limit]
+        found: List[int] = []
+        self._collect(0, len(self.starts), limit, start, found)
+        return found
+
+    def chronological(self) -> List[int]:
+        """Positions of every item in order of start date"""
+        return list(self.positions)
@@ -0,0 +1,154 @@
+import copy
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+Container = Union[Dict[str, Any], List[Any]]
+
+
+class PatchError(ValueError):
+    """Raised when a JSON Patch is malformed or cannot be applied"""
+
+
+class PatchTestFailed(PatchError):
+    """Raised when a JSON Patch "test" operation does not match"""
+
+
+def parse_pointer(pointer: Any) -> List[str]:
+    """Split a JSON Pointer (RFC 6901) into its unescaped reference tokens"""
+    if not isinstance(pointer, str):
+        raise PatchError("JSON Pointer must be a string")
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise PatchError(f"Invalid JSON Pointer '{pointer}'")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _no_materialize(value: Any) -> Container:
+    raise PatchError("Path does not exist")
+
+
+class _Patcher:
+    """Applies operations to a document held under a root holder
+
+    Values that are not dicts or lists are handed to materialize when a
+    path descends into them, which lets callers keep opaque objects (such
+    as models) in the document and only expand the ones a patch touches.
+    """
+
+    def __init__(self, document: Any, materialize: Callable[[Any], Container]):
+        self.holder: Dict[str, Any] = {"": document}
+        self.materialize = materialize
+
+    def _key(self, node: Container, token: str, adding: bool = False):
+        if isinstance(node, dict):
+            return token
+        if adding and token == "-":
+            return len(node)
+        if not token.isdigit() or (token != "0" and token.startswith("0")):
+            raise PatchError(f"Invalid array index '{token}'")
+        index = int(token)
+        if index > len(node) or (index == len(node) and not adding):
+            raise PatchError(f"Array index {index} out of range")
+        return index
+
+    def _child(self, node: Container, key, expand: bool) -> Any:
+        """Get node[key], expanding an opaque child in place when expand is set"""
+        if isinstance(node, dict) and key not in node:
+            raise PatchError(f"Member '{key}' does not exist")
+        child = node[key]
+        if expand and not isinstance(child, (dict, list)):
+            child = node[key] = self.materialize(child)
+        return child
+
+    def _parent(self, tokens: Sequence[str]):
+        """Container holding the target of tokens and the target's token"""
+        node: Container = self.holder
+        path = ["", *tokens]
+        for token in path[:-1]:
+            node = self._child(node, self._key(node, token), expand=True)
+        return node, path[-1]
+
+    def get(self, tokens: Sequence[str]) -> Any:
+        node, token = self._parent(tokens)
+        return self._child(node, self._key(node, token), expand=False)
+
+    def add(self, tokens: Sequence[str], value: Any) -> None:
+        node, token = self._parent(tokens)
+        key = self._key(node, token, adding=True)
+        if isinstance(node, list):
+            node.insert(key, value)
+        else:
+            node[key] = value
+
+    def remove(self, tokens: Sequence[str]) -> Any:
+        if not tokens:
+            raise PatchError("Cannot remove the whole document")
+        node, token = self._parent(tokens)
+        key = self._key(node, token)
+        value = self._child(node, key, expand=False)
+        del node[key]
+        return value
+
+    def replace(self, tokens: Sequence[str], value: Any) -> None:
+        node, token = self._parent(tokens)
+        key = self._key(node, token)
+        self._child(node, key, expand=False)
+        node[key] = value
+
+    def plain(self, value: Any) -> Any:
+        """value with any opaque objects expanded, for comparisons"""
+        if isinstance(value, dict):
+            return {key: self.plain(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.plain(item) for item in value]
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        return self.plain(self.materialize(value))
+
+    def apply(self, operation: Any) -> None:
+        if not isinstance(operation, dict) or "op" not in operation or "path" not in operation:
+            raise PatchError("Each operation needs an 'op' and a 'path'")
+        op = operation["op"]
+        path = parse_pointer(operation["path"])
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise PatchError(f"'{op}' operation needs a 'value'")
+        if op in ("move", "copy") and "from" not in operation:
+            raise PatchError(f"'{op}' operation needs a 'from'")
+
+        if op == "add":
+            self.add(path, operation["value"])
+        elif op == "remove":
+            self.remove(path)
+        elif op == "replace":
+            self.replace(path, operation["value"])
+        elif op == "move":
+            source = parse_pointer(operation["from"])
+            if path[:len(source)] == source and len(path) > len(source):
+                raise PatchError("Cannot move a value into one of its children")
+            self.add(path, self.remove(source))
+        elif op == "copy":
+            self.add(path, copy.deepcopy(self.get(parse_pointer(operation["from"]))))
+        elif op == "test":
+            if self.plain(self.get(path)) != operation["value"]:
+                raise PatchTestFailed(f"Test failed at '{operation['path']}'")
+        else:
+            raise PatchError(f"Unknown operation '{op}'")
+
+
+def apply_patch(
+    document: Any,
+    operations: Any,
+    materialize: Optional[Callable[[Any], Container]] = None,
+) -> Any:
+    """Apply a JSON Patch (RFC 6902) and return the patched document
+
+    The document is modified in place where possible, so pass a copy of
+    anything readers may still be using. Opaque values are expanded with
+    materialize only when a path descends into them or a test compares them.
+    """
+    if not isinstance(operations, list):
+        raise PatchError("A JSON Patch must be an array of operations")
+    patcher = _Patcher(document, materialize or _no_materialize)
+    for operation in operations:
+        patcher.apply(operation)
+    return patcher.holder[""]
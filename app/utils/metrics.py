@@ -0,0 +1,35 @@
+import logging
+from collections import Counter
+from typing import Dict
+
+logger = logging.getLogger("cv_api.metrics")
+
+
+class Metrics:
+    """In-process counters for operational events
+
+    Counters are labelled by appending ``key=value`` pairs to the name, and
+    each increment is also logged so it reaches CloudWatch on Lambda.
+    """
+
+    def __init__(self):
+        self._counters: Counter = Counter()
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        """Increase a counter"""
+        if labels:
+            name = name + "{" + ",".join(f"{key}={labels[key]}" for key in sorted(labels)) + "}"
+        self._counters[name] += value
+        logger.info("metric %s +%d", name, value)
+
+    def get(self, name: str) -> int:
+        """Current value of a counter (including its labels, if any)"""
+        return self._counters[name]
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of every counter"""
+        return dict(self._counters)
+
+
+# Create singleton instance
+metrics = Metrics()
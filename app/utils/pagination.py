@@ -0,0 +1,71 @@
+import base64
+import json
+from bisect import bisect_right
+from typing import Any, Callable, Collection, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from app.utils.projection import InvalidQueryError
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(key: Tuple[Any, ...]) -> str:
+    """Encode a sort key as an opaque, URL-safe cursor"""
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+    """Decode a cursor back into the sort key it was made from"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise InvalidQueryError("Invalid cursor") from None
+    if not isinstance(key, list):
+        raise InvalidQueryError("Invalid cursor")
+    return tuple(key)
+
+
+class Ordering(Generic[T]):
+    """Items sorted once by a unique key, so pages are answered by slicing
+
+    The item's position is appended to its sort key as a tie-breaker, which
+    keeps keys unique and the order stable.
+    """
+
+    def __init__(self, items: Sequence[T], sort_key: Callable[[T], Tuple[Any, ...]]):
+        pairs = sorted(((*sort_key(item), position), item) for position, item in enumerate(items))
+        self.keys: List[Tuple[Any, ...]] = [key for key, _ in pairs]
+        self.items: List[T] = [item for _, item in pairs]
+
+    def restrict(self, positions: Collection[int]) -> "Ordering[T]":
+        """The same ordering limited to the items originally at positions
+
+        Keys are kept, so cursors stay valid across filtered and unfiltered
+        orderings of the same items.
+        """
+        restricted = Ordering((), lambda item: ())
+        for key, item in zip(self.keys, self.items):
+            if key[-1] in positions:
+                restricted.keys.append(key)
+                restricted.items.append(item)
+        return restricted
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def page(self, cursor: Optional[str], limit: int) -> Tuple[List[T], Optional[str]]:
+        """Return up to limit items after cursor and the cursor for the next page"""
+        start = 0
+        if cursor is not None:
+            try:
+                start = bisect_right(self.keys, decode_cursor(cursor))
+            except TypeError:
+                # The cursor's key doesn't compare with this ordering's keys
+                raise InvalidQueryError("Invalid cursor") from None
+        end = start + limit
+        next_cursor = encode_cursor(self.keys[end - 1]) if end < len(self.items) else None
+        return self.items[start:end], next_cursor
@@ -0,0 +1,66 @@
+from typing import Dict, Iterable, Mapping, Optional, Set, Tuple
+
+
+class InvalidQueryError(ValueError):
+    """Raised when query parameters ask for something that doesn't exist"""
+
+
+def _split(value: str, name: str) -> Tuple[str, ...]:
+    """Non-empty comma-separated parts of a query parameter that was given"""
+    parts = tuple(part.strip() for part in value.split(",") if part.strip())
+    if not parts:
+        raise InvalidQueryError(f"Empty {name}; leave it out to get everything")
+    return parts
+
+
+def parse_include(value: Optional[str], allowed: Iterable[str]) -> Optional[Set[str]]:
+    """Parse an ``include=a,b`` section filter, or None when absent"""
+    if value is None:
+        return None
+    sections = set(_split(value, "include"))
+    unknown = sections - set(allowed)
+    if unknown:
+        raise InvalidQueryError(f"Unknown section(s) in include: {', '.join(sorted(unknown))}")
+    return sections
+
+
+def parse_fields(value: Optional[str], allowed: Iterable[str]) -> Optional[Set[str]]:
+    """Parse a ``fields=a,b`` sparse fieldset, or None when absent"""
+    if value is None:
+        return None
+    fields = set(_split(value, "fields"))
+    unknown = fields - set(allowed)
+    if unknown:
+        raise InvalidQueryError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return fields
+
+
+def parse_section_fields(
+    value: Optional[str],
+    allowed: Mapping[str, Iterable[str]],
+) -> Dict[str, Set[str]]:
+    """Parse a ``fields=section.field,...`` sparse fieldset into fields per section
+
+    Sections without an entry are returned in full.
+    """
+    if value is None:
+        return {}
+    fields: Dict[str, Set[str]] = {}
+    for path in _split(value, "fields"):
+        section, _, field = path.partition(".")
+        if section not in allowed or not field:
+            raise InvalidQueryError(f"Invalid field path '{path}', expected <section>.<field>")
+        if field not in set(allowed[section]):
+            raise InvalidQueryError(f"Unknown field '{field}' in section '{section}'")
+        fields.setdefault(section, set()).add(field)
+    return fields
+
+
+def projection_key(base: str, **parts: Optional[Iterable[str]]) -> str:
+    """Cache key for a projected response: base plus each normalized part"""
+    key = base
+    for name in sorted(parts):
+        value = parts[name]
+        if value is not None:
+            key += f"|{name}={','.join(sorted(value))}"
+    return key
@@ -0,0 +1,345 @@
+import importlib.util
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+
+
+# JSON encoder backends
+
+class JSONBackend(ABC):
+    """Encodes JSON-compatible content to compact UTF-8 bytes"""
+
+    name = ""
+
+    @abstractmethod
+    def dumps(self, content: Any) -> bytes:
+        """Encode content as compact UTF-8 JSON"""
+
+
+class StdlibJSONBackend(JSONBackend):
+    """The standard library encoder, byte-compatible with Starlette's JSONResponse"""
+
+    name = "stdlib"
+
+    def dumps(self, content: Any) -> bytes:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class OrjsonBackend(JSONBackend):
+    """The orjson encoder, which writes bytes directly from native code"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+
+    def dumps(self, content: Any) -> bytes:
+        return self._dumps(content)
+
+
+def create_json_backend(name: str) -> JSONBackend:
+    """Create the named JSON backend, falling back to stdlib for "auto" without orjson"""
+    if name == "stdlib":
+        return StdlibJSONBackend()
+    try:
+        return OrjsonBackend()
+    except ImportError:
+        if name == "orjson":
+            raise
+        return StdlibJSONBackend()
+
+
+_json_backend = create_json_backend(settings.json_encoder)
+
+
+def get_json_backend() -> JSONBackend:
+    """Get the JSON backend used for all API responses"""
+    return _json_backend
+
+
+def set_json_backend(name: str) -> JSONBackend:
+    """Switch every API response to the named JSON backend"""
+    global _json_backend
+    _json_backend = create_json_backend(name)
+    return _json_backend
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode content with the configured JSON backend"""
+    return _json_backend.dumps(content)
+
+
+class APIJSONResponse(JSONResponse):
+    """JSONResponse rendered with the configured JSON backend"""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+# XML encoding
+
+_INVALID_TAG_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def xml_tag(name: Any) -> str:
+    """Turn a dict key into a valid XML element name"""
+    tag = _INVALID_TAG_CHARS.sub("_", str(name)) or "_"
+    if not (tag[0].isalpha() or tag[0] == "_") or tag.lower().startswith("xml"):
+        tag = f"_{tag}"
+    return tag
+
+
+def _xml_text(value: Any) -> str:
+    """Render a scalar as escaped XML text"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return escape(str(value))
+
+
+def iter_xml(content: Any) -> Iterator[str]:
+    """Yield the XML markup for content, one fragment at a time
+
+    Dicts become child elements named after their keys, lists become
+    repeated ``<item>`` elements and scalars become text.
+    """
+    if isinstance(content, dict):
+        for key, value in content.items():
+            tag = xml_tag(key)
+            if value is None:
+                yield f"<{tag}/>"
+            else:
+                yield f"<{tag}>"
+                yield from iter_xml(value)
+                yield f"</{tag}>"
+    elif isinstance(content, (list, tuple)):
+        for value in content:
+            if value is None:
+                yield "<item/>"
+            else:
+                yield "<item>"
+                yield from iter_xml(value)
+                yield "</item>"
+    else:
+        yield _xml_text(content)
+
+
+def encode_xml(content: Any) -> bytes:
+    """Encode content as an XML fragment"""
+    return "".join(iter_xml(content)).encode("utf-8")
+
+
+# Response formats
+
+class ResponseFormat(ABC):
+    """Encodes the parts of the success envelope for one media type
+
+    The data and message are encoded once and cached; the envelope is
+    stitched around them per response so the timestamp can stay live.
+    """
+
+    name = ""
+    media_type = ""
+
+    @abstractmethod
+    def encode_data(self, data: Any) -> bytes:
+        """Encode the envelope's data member"""
+
+    @abstractmethod
+    def encode_message(self, message: str) -> bytes:
+        """Encode the envelope's message member"""
+
+    @abstractmethod
+    def render_envelope(self, message: bytes, data: bytes, timestamp: str) -> bytes:
+        """Stitch the success envelope around an encoded message and data"""
+
+
+class JSONFormat(ResponseFormat):
+    """JSON responses encoded with the configured JSON backend"""
+
+    name = "json"
+    media_type = "application/json"
+
+    def encode_data(self, data: Any) -> bytes:
+        return encode_json(data)
+
+    def encode_message(self, message: str) -> bytes:
+        return encode_json(message)
+
+    def render_envelope(self, message: bytes, data: bytes, timestamp: str) -> bytes:
+        return b"".join((
+            b'{"success":true,"timestamp":', encode_json(timestamp),
+            b',"message":', message,
+            b',"data":', data,
+            b"}",
+        ))
+
+
+class XMLFormat(ResponseFormat):
+    """XML responses mirroring the JSON envelope under a <response> root"""
+
+    name = "xml"
+    media_type = "application/xml"
+
+    def encode_data(self, data: Any) -> bytes:
+        return encode_xml(data)
+
+    def encode_message(self, message: str) -> bytes:
+        return encode_xml(message)
+
+    def render_envelope(self, message: bytes, data: bytes, timestamp: str) -> bytes:
+        return b"".join((
+            b'<?xml version="1.0" encoding="UTF-8"?>',
+            b"<response><success>true</success><timestamp>", encode_xml(timestamp),
+            b"</timestamp><message>", message,
+            b"</message><data>", data,
+            b"</data></response>",
+        ))
+
+
+class MsgpackFormat(ResponseFormat):
+    """MessagePack responses (requires the msgpack package)
+
+    MessagePack values concatenate, so the envelope is a four-entry map
+    header followed by each key and its pre-encoded value.
+    """
+
+    name = "msgpack"
+    media_type = "application/msgpack"
+
+    def __init__(self):
+        import msgpack
+
+        self._packb = msgpack.packb
+        self._prefix = b"\x84" + msgpack.packb("success") + msgpack.packb(True) + msgpack.packb("timestamp")
+        self._message_key = msgpack.packb("message")
+        self._data_key = msgpack.packb("data")
+
+    def encode_data(self, data: Any) -> bytes:
+        return self._packb(data, use_bin_type=True)
+
+    def encode_message(self, message: str) -> bytes:
+        return self._packb(message, use_bin_type=True)
+
+    def render_envelope(self, message: bytes, data: bytes, timestamp: str) -> bytes:
+        return b"".join((
+            self._prefix, self._packb(timestamp),
+            self._message_key, message,
+            self._data_key, data,
+        ))
+
+
+class CBORFormat(ResponseFormat):
+    """CBOR responses (requires the cbor2 package)
+
+    Like MessagePack, CBOR items concatenate, so the envelope is a
+    four-entry map header followed by each key and its pre-encoded value.
+    """
+
+    name = "cbor"
+    media_type = "application/cbor"
+
+    def __init__(self):
+        import cbor2
+
+        self._dumps = cbor2.dumps
+        self._prefix = b"\xa4" + cbor2.dumps("success") + cbor2.dumps(True) + cbor2.dumps("timestamp")
+        self._message_key = cbor2.dumps("message")
+        self._data_key = cbor2.dumps("data")
+
+    def encode_data(self, data: Any) -> bytes:
+        return self._dumps(data)
+
+    def encode_message(self, message: str) -> bytes:
+        return self._dumps(message)
+
+    def render_envelope(self, message: bytes, data: bytes, timestamp: str) -> bytes:
+        return b"".join((
+            self._prefix, self._dumps(timestamp),
+            self._message_key, message,
+            self._data_key, data,
+        ))
+
+
+JSON_FORMAT = JSONFormat()
+XML_FORMAT = XMLFormat()
+
+# Binary formats are created on first use, so their packages are only
+# imported by instances that actually serve them
+_LAZY_FORMATS = {"msgpack": MsgpackFormat, "cbor": CBORFormat}
+_formats: Dict[str, ResponseFormat] = {"json": JSON_FORMAT, "xml": XML_FORMAT}
+
+
+def get_format(name: str) -> ResponseFormat:
+    """Get a response format by name, creating it on first use"""
+    fmt = _formats.get(name)
+    if fmt is None:
+        fmt = _formats[name] = _LAZY_FORMATS[name]()
+    return fmt
+
+
+# Accepted media types and the name of the format that serves them
+MEDIA_TYPES: Dict[str, str] = {
+    "application/json": "json",
+    "application/xml": "xml",
+    "text/xml": "xml",
+}
+
+# Binary formats are only offered when their optional package is installed
+if importlib.util.find_spec("msgpack") is not None:
+    MEDIA_TYPES["application/msgpack"] = "msgpack"
+    MEDIA_TYPES["application/x-msgpack"] = "msgpack"
+    MEDIA_TYPES["application/vnd.msgpack"] = "msgpack"
+
+if importlib.util.find_spec("cbor2") is not None:
+    MEDIA_TYPES["application/cbor"] = "cbor"
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Split an Accept header into (media range, quality) pairs"""
+    ranges = []
+    for part in accept.split(","):
+        media_range, _, params = part.strip().partition(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranges.append((media_range, quality))
+    return ranges
+
+
+def negotiate_format(accept: Optional[str]) -> ResponseFormat:
+    """Pick the response format for an Accept header, defaulting to JSON"""
+    if not accept:
+        return JSON_FORMAT
+    best, best_quality = "json", 0.0
+    for media_range, quality in _parse_accept(accept):
+        if quality <= best_quality:
+            continue
+        if media_range in MEDIA_TYPES:
+            best, best_quality = MEDIA_TYPES[media_range], quality
+        elif media_range in ("*/*", "application/*"):
+            best, best_quality = "json", quality
+    return get_format(best)
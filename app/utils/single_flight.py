@@ -0,0 +1,37 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """Collapses concurrent async calls for the same key into one
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same result, or the same exception. Each caller waits
+    at most timeout seconds, but a caller timing out or being cancelled never
+    cancels the shared call for the others. Once the call finishes the key
+    is released, so the next caller starts a fresh one.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a call for key is currently running"""
+        return key in self._in_flight
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func for key, or join the call already in flight for it"""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+
+    def _release(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every waiter timed out
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,36 @@
+"""Compare the JSON encoder backends on the /summary payload
+
+Run from the repository root:
+
+    python -m benchmarks.bench_json_encoders [iterations]
+"""
+import sys
+import timeit
+
+from app.routes.cv_routes import build_summary_payload, create_success_response
+from app.services.tenants import default_tenant
+from app.utils.serializers import OrjsonBackend, StdlibJSONBackend
+
+
+def main(iterations: int = 20000) -> None:
+    data, message = build_summary_payload(default_tenant)
+    envelope = create_success_response(data=data, message=message)
+
+    backends = [StdlibJSONBackend()]
+    try:
+        backends.append(OrjsonBackend())
+    except ImportError:
+        print("orjson is not installed - only the stdlib backend will be measured")
+
+    print(f"/summary payload, {iterations} iterations")
+    baseline = None
+    for backend in backends:
+        size = len(backend.dumps(envelope))
+        seconds = min(timeit.repeat(lambda: backend.dumps(envelope), number=iterations, repeat=5))
+        per_call_us = seconds / iterations * 1_000_000
+        baseline = baseline or per_call_us
+        print(f"{backend.name:>8}: {per_call_us:8.2f} us/call  {size} bytes  ({baseline / per_call_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
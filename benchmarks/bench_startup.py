@@ -0,0 +1,81 @@
+"""Measure cold-start cost: importing the app and serving the first request
+
+Each run starts a fresh interpreter with production settings, like a new
+Lambda container. Runs are repeated with the built-in mock data and with a
+prebuilt snapshot.
+
+    python -m benchmarks.bench_startup [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Executed in a fresh interpreter; prints the timings as JSON
+CHILD = r"""
+import asyncio, json, time
+start = time.perf_counter()
+import app.lambda_handler
+from app.main import app
+imported = time.perf_counter()
+
+async def first_request():
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "https", "path": "/api/v1/summary",
+        "raw_path": b"/api/v1/summary", "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"localhost"), (b"accept", b"application/json")],
+        "client": ("127.0.0.1", 1), "server": ("localhost", 443),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"]
+
+status = asyncio.run(first_request())
+served = time.perf_counter()
+print(json.dumps({"import_ms": (imported - start) * 1000, "first_request_ms": (served - imported) * 1000, "status": status}))
+"""
+
+
+def run_child(env) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def report(label: str, results) -> None:
+    for key in ("import_ms", "first_request_ms"):
+        values = [result[key] for result in results]
+        print(f"{label:>10} {key:>17}: median {statistics.median(values):7.1f} ms  min {min(values):7.1f} ms")
+
+
+def main(runs: int = 10) -> None:
+    base_env = {**os.environ, "ENVIRONMENT": "production"}
+    for name in ("CV_SNAPSHOT_PATH", "ENABLE_DOCS", "ADMIN_ENABLED"):
+        base_env.pop(name, None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, "cv-snapshot.pickle")
+        subprocess.run(
+            [sys.executable, "-m", "app.services.snapshot", snapshot_path],
+            env=base_env, check=True, capture_output=True,
+        )
+
+        print(f"{runs} fresh interpreters per mode")
+        report("mock", [run_child(base_env) for _ in range(runs)])
+        report("snapshot", [run_child({**base_env, "CV_SNAPSHOT_PATH": snapshot_path}) for _ in range(runs)])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,32 @@
+"""Compare admin token verification with and without the verified-token cache
+
+Run from the repository root:
+
+    python -m benchmarks.bench_token_cache [iterations]
+"""
+import sys
+import timeit
+
+from app.services.auth import ALGORITHMS, TokenVerifier, decode_token
+
+
+def main(iterations: int = 50000) -> None:
+    print(f"Bearer token verification, {iterations} iterations")
+    for algorithm in ALGORITHMS:
+        verifier = TokenVerifier("benchmark-secret", algorithm)
+        token = verifier.issue("admin")
+        cases = [
+            ("uncached", lambda: decode_token(token, verifier.secret, algorithm)),
+            ("cached", lambda: verifier.verify(token)),
+        ]
+        baseline = None
+        for name, verify in cases:
+            verify()
+            seconds = min(timeit.repeat(verify, number=iterations, repeat=5))
+            per_call_us = seconds / iterations * 1_000_000
+            baseline = baseline or per_call_us
+            print(f"{algorithm} {name:>8}: {per_call_us:8.2f} us/call  ({baseline / per_call_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+# The test client sends every request from one address, so the app under
+# test is built without a rate limit; tests/test_rate_limit.py wraps it in one
+os.environ["RATE_LIMIT_REQUESTS_PER_MINUTE"] = "0"
+
+# Admin routes are only mounted when enabled at startup; tests that need them
+# disabled turn the setting off again
+os.environ["ADMIN_ENABLED"] = "true"
+
+
+@pytest.fixture
+def admin_headers(monkeypatch):
+    """Enable the admin endpoints with a test signing key and return headers with a valid token"""
+    from app.config import settings
+    from app.services.auth import token_verifier
+
+    monkeypatch.setattr(settings, "admin_enabled", True)
+    monkeypatch.setattr(token_verifier, "secret", "test-secret")
+    yield {"Authorization": f"Bearer {token_verifier.issue('tests')}"}
+    token_verifier.clear()
+
+
+@pytest.fixture
+def mock_sections():
+    """JSON-compatible sections of the built-in mock CV"""
+    from app.services.data_service import DataService
+
+    return DataService().export_sections()
+
+
+class ConditionalCheckFailedException(Exception):
+    """Stand-in for the error boto3 raises when a ConditionExpression fails"""
+
+
+class FakeDynamoDBClient:
+    """Minimal stand-in for the boto3 DynamoDB client calls the repository makes"""
+    
+    class exceptions:
+        ConditionalCheckFailedException = ConditionalCheckFailedException
+    
+    def __init__(self):
+        self.items = {}
+        self.calls = []
+    
+    def put_item(self, TableName, Item, **kwargs):
+        self.calls.append("put_item")
+        key = (Item["pk"]["S"], Item["sk"]["S"])
+        if "ConditionExpression" in kwargs:
+            # Only the "#digest IN (...)" condition the repository sends is understood
+            stored = self.items.get(key, {}).get("digest", {}).get("S")
+            if stored not in {value["S"] for value in kwargs["ExpressionAttributeValues"].values()}:
+                raise ConditionalCheckFailedException()
+        self.items[key] = Item
+        return {}
+    
+    def batch_write_item(self, RequestItems):
+        self.calls.append("batch_write_item")
+        for requests in RequestItems.values():
+            keys = [(r["PutRequest"]["Item"]["pk"]["S"], r["PutRequest"]["Item"]["sk"]["S"]) for r in requests]
+            if len(set(keys)) != len(keys):
+                raise ValueError("Provided list of item keys contains duplicates")
+            for request in requests:
+                item = request["PutRequest"]["Item"]
+                self.items[(item["pk"]["S"], item["sk"]["S"])] = item
+        return {}
+    
+    def query(self, **kwargs):
+        self.calls.append("query")
+        pk = kwargs["ExpressionAttributeValues"][":pk"]["S"]
+        return {"Items": [item for (item_pk, _), item in self.items.items() if item_pk == pk]}
+    
+    def scan(self, **kwargs):
+        self.calls.append("scan")
+        sk = kwargs["ExpressionAttributeValues"][":sk"]["S"]
+        return {"Items": [{"pk": item["pk"]} for (_, item_sk), item in sorted(self.items.items()) if item_sk == sk]}
+    
+    def batch_get_item(self, RequestItems):
+        self.calls.append("batch_get_item")
+        responses = {}
+        for table, request in RequestItems.items():
+            responses[table] = [
+                self.items[(key["pk"]["S"], key["sk"]["S"])]
+                for key in request["Keys"]
+                if (key["pk"]["S"], key["sk"]["S"]) in self.items
+            ]
+        return {"Responses": responses}
+
+
+@pytest.fixture
+def dynamodb_client():
+    """Empty fake DynamoDB client"""
+    return FakeDynamoDBClient()
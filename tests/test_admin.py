@@ -0,0 +1,278 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.data_service import DataService
+from app.services.repository import InMemoryRepository
+from app.services.tenants import Tenant, default_tenant
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def admin(admin_headers):
+    """Enable the admin endpoints, authenticate the client and restore the default CV afterwards"""
+    original = default_tenant.service.export_sections()
+    client.headers.update(admin_headers)
+    yield
+    del client.headers["Authorization"]
+    for section, raw in original.items():
+        asyncio.run(default_tenant.update_section(section, raw))
+
+
+class TestAdminUpdates:
+    """Test replacing CV sections through PUT /admin/{section}"""
+    
+    def test_refused_when_disabled(self, monkeypatch):
+        """Test admin endpoints refuse requests once ADMIN_ENABLED is turned off"""
+        from app.config import settings
+        
+        monkeypatch.setattr(settings, "admin_enabled", False)
+        response = client.put("/admin/profile", json={"section": "profile", "data": {}})
+        assert response.status_code == 403
+        assert response.json()["error_code"] == "ADMIN_DISABLED"
+    
+    def test_update_contact(self, admin):
+        """Test an update is served straight away and bumps only its section's version"""
+        contact = [{"method": "email", "value": "new@example.com", "label": "Email", "primary": True}]
+        versions = default_tenant.service.get_versions(("contact_info", "skills"))
+        response = client.put("/admin/contact", json={"section": "contact", "data": contact})
+        assert response.status_code == 200
+        assert response.json()["data"]["version"] == versions[0] + 1
+        assert default_tenant.service.get_versions(("skills",)) == versions[1:]
+        data = client.get("/api/v1/contact").json()["data"]
+        assert [c["value"] for c in data["all_contacts"]] == ["new@example.com"]
+    
+    def test_only_dependent_responses_dropped(self, admin):
+        """Test a contact edit leaves cached skills responses and indexes in place"""
+        client.get("/api/v1/skills")
+        client.get("/api/v1/contact")
+        skills_index = default_tenant.views.skill_category_index()
+        skills_etag = client.get("/api/v1/skills").headers["etag"]
+        contact = default_tenant.service.export_sections()["contact_info"]
+        client.put("/admin/contact", json={"section": "contact", "data": contact})
+        assert "skills" in default_tenant.cache._entries
+        assert "contact" not in default_tenant.cache._entries
+        assert default_tenant.views.skill_category_index() is skills_index
+        assert client.get("/api/v1/skills").headers["etag"] == skills_etag
+    
+    def test_invalid_data_rejected(self, admin):
+        """Test invalid data is rejected and leaves the section unchanged"""
+        before = client.get("/api/v1/skills").json()["data"]
+        response = client.put("/admin/skills", json={"section": "skills", "data": [{"name": "Rust", "level": "wizard"}]})
+        assert response.status_code == 422
+        assert response.json()["error_code"] == "VALIDATION_ERROR"
+        assert client.get("/api/v1/skills").json()["data"] == before
+    
+    def test_unknown_or_mismatched_section(self, admin):
+        """Test unknown sections and mismatched bodies are rejected"""
+        assert client.put("/admin/hobbies", json={"section": "hobbies", "data": {}}).status_code == 404
+        assert client.put("/admin/profile", json={"section": "skills", "data": {}}).status_code == 400
+    
+    def test_update_saved_to_repository(self, mock_sections):
+        """Test updates are written to the repository before being served"""
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        tenant = Tenant("me", DataService(repository=repository, cv_id="me"))
+        skills = mock_sections["skills"][:1]
+        asyncio.run(tenant.update_section("skills", skills))
+        assert repository.load_sections("me", ["skills"]) == {"skills": skills}
+        assert [skill.name for skill in tenant.service.skills] == [skills[0]["name"]]
+
+
+class TestAdminPatches:
+    """Test JSON Patch updates through PATCH /admin/{section}"""
+    
+    def patch(self, section, operations, **headers):
+        return client.patch(
+            f"/admin/{section}",
+            json=operations,
+            headers={"Content-Type": "application/json-patch+json", **headers}
+        )
+    
+    def test_patch_one_skill(self, admin):
+        """Test a patch changes one entry and leaves the others as they were"""
+        skills = default_tenant.service.skills
+        response = self.patch("skills", [{"op": "replace", "path": "/0/name", "value": "Patched"}])
+        assert response.status_code == 200
+        patched = default_tenant.service.skills
+        assert patched[0].name == "Patched"
+        assert all(new is old for new, old in zip(patched[1:], skills[1:]))
+        assert client.get("/api/v1/skills").json()["data"]["all_skills"][0]["name"] == "Patched"
+    
+    def test_patch_profile(self, admin):
+        """Test patching the profile object"""
+        response = self.patch("profile", [{"op": "add", "path": "/specialties/-", "value": "Patching"}])
+        assert response.status_code == 200
+        assert client.get("/api/v1/me").json()["data"]["specialties"][-1] == "Patching"
+    
+    def test_invalid_result_rejected(self, admin):
+        """Test a patch producing an invalid entry is rejected without changes"""
+        skills = default_tenant.service.skills
+        response = self.patch("skills", [{"op": "replace", "path": "/0/level", "value": "wizard"}])
+        assert response.status_code == 422
+        assert default_tenant.service.skills is skills
+    
+    def test_bad_patches(self, admin):
+        """Test malformed patches and failed tests are rejected"""
+        assert self.patch("skills", [{"op": "remove", "path": "/9999"}]).status_code == 400
+        assert self.patch("skills", {"op": "remove"}).status_code in (400, 422)
+        response = self.patch("skills", [{"op": "test", "path": "/0/name", "value": "Not it"}])
+        assert response.status_code == 409
+        assert response.json()["error_code"] == "PATCH_TEST_FAILED"
+    
+    def test_if_match(self, admin):
+        """Test writes against an outdated section version are refused"""
+        first = self.patch("skills", [{"op": "replace", "path": "/0/years_experience", "value": 7}])
+        etag = first.headers["etag"]
+        assert self.patch("skills", [{"op": "remove", "path": "/0"}], **{"If-Match": etag}).status_code == 200
+        stale = self.patch("skills", [{"op": "remove", "path": "/0"}], **{"If-Match": etag})
+        assert stale.status_code == 412
+        assert stale.json()["error_code"] == "VERSION_CONFLICT"
+        assert stale.headers["etag"] != etag
+
+
+class TestJSONPatch:
+    """Test the JSON Patch implementation"""
+    
+    def test_operations(self):
+        """Test each RFC 6902 operation"""
+        from app.utils.json_patch import apply_patch
+        document = {"a": {"b": 1}, "list": [1, 2]}
+        patched = apply_patch(document, [
+            {"op": "add", "path": "/list/1", "value": 9},
+            {"op": "remove", "path": "/list/0"},
+            {"op": "replace", "path": "/a/b", "value": 2},
+            {"op": "copy", "from": "/a", "path": "/c"},
+            {"op": "move", "from": "/c/b", "path": "/d"},
+            {"op": "test", "path": "/d", "value": 2},
+            {"op": "add", "path": "/e~1f", "value": True},
+        ])
+        assert patched == {"a": {"b": 2}, "list": [9, 2], "c": {}, "d": 2, "e/f": True}
+    
+    def test_errors(self):
+        """Test invalid operations raise PatchError"""
+        from app.utils.json_patch import PatchError, PatchTestFailed, apply_patch
+        with pytest.raises(PatchTestFailed):
+            apply_patch([1], [{"op": "test", "path": "/0", "value": 2}])
+        for operations in (
+            [{"op": "remove", "path": "/1"}],
+            [{"op": "add", "path": "/01", "value": 0}],
+            [{"op": "replace", "path": "missing-slash", "value": 0}],
+            [{"op": "move", "from": "", "path": "/0"}],
+            [{"op": "unknown", "path": ""}],
+        ):
+            with pytest.raises(PatchError):
+                apply_patch([1], operations)
+    
+    def test_opaque_values_expanded_on_demand(self):
+        """Test only values a path descends into are materialized"""
+        from app.utils.json_patch import apply_patch
+        expanded = []
+        
+        class Entry:
+            def __init__(self, name):
+                self.name = name
+        
+        def materialize(entry):
+            expanded.append(entry.name)
+            return {"name": entry.name}
+        
+        entries = [Entry("a"), Entry("b"), Entry("c")]
+        patched = apply_patch(list(entries), [{"op": "replace", "path": "/1/name", "value": "B"}], materialize)
+        assert expanded == ["b"]
+        assert patched[0] is entries[0] and patched[2] is entries[2]
+        assert patched[1] == {"name": "B"}
+
+
+class FakeClock:
+    """Clock advanced by hand"""
+    
+    def __init__(self):
+        self.now = 1_700_000_000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestAdminAuth:
+    """Test bearer token authentication of the admin endpoints"""
+    
+    def test_token_required(self, admin_headers):
+        """Test requests without a valid token get a 401 with a challenge"""
+        response = client.get("/admin/export")
+        assert response.status_code == 401
+        assert response.json()["error_code"] == "UNAUTHORIZED"
+        assert response.headers["www-authenticate"] == "Bearer"
+        response = client.get("/admin/export", headers={"Authorization": admin_headers["Authorization"] + "x"})
+        assert response.status_code == 401
+        assert 'error="invalid_token"' in response.headers["www-authenticate"]
+    
+    def test_signing_key_required(self, admin_headers, monkeypatch):
+        """Test enabled admin endpoints refuse every request until a signing key is set"""
+        from app.services.auth import token_verifier
+        monkeypatch.setattr(token_verifier, "secret", None)
+        response = client.get("/admin/export", headers=admin_headers)
+        assert response.status_code == 503
+        assert response.json()["error_code"] == "AUTH_NOT_CONFIGURED"
+
+
+class TestTokenVerifier:
+    """Test JWT verification and the verified-token cache"""
+    
+    def test_round_trip(self):
+        """Test tokens signed with each algorithm verify, and tampered ones don't"""
+        from app.services.auth import TokenError, decode_token, encode_token
+        for algorithm in ("HS256", "HS384", "HS512"):
+            token = encode_token({"sub": "a", "exp": 2_000_000_000}, "secret", algorithm)
+            assert decode_token(token, "secret", algorithm, now=1_700_000_000)["sub"] == "a"
+        header, payload, signature = token.split(".")
+        for bad in (
+            encode_token({"sub": "a", "exp": 2_000_000_000}, "other", "HS512"),
+            encode_token({"sub": "a", "exp": 2_000_000_000}, "secret", "HS256"),
+            encode_token({"sub": "a", "exp": 1_000_000_000}, "secret", "HS512"),
+            encode_token({"sub": "a"}, "secret", "HS512"),
+            f"{header}.{payload}.",
+            "not-a-token",
+        ):
+            with pytest.raises(TokenError):
+                decode_token(bad, "secret", "HS512", now=1_700_000_000)
+    
+    def test_verified_tokens_cached_until_exp(self):
+        """Test a token is verified once and then served from the cache until it expires"""
+        from app.services.auth import TokenError, TokenVerifier
+        clock = FakeClock()
+        verifier = TokenVerifier("secret", clock=clock)
+        token = verifier.issue("admin", hours=1)
+        claims = verifier.verify(token)
+        assert verifier.verify(token) is claims
+        assert len(verifier) == 1
+        clock.now += 3600
+        with pytest.raises(TokenError):
+            verifier.verify(token)
+        assert len(verifier) == 0
+    
+    def test_cache_bounded(self):
+        """Test the least recently used tokens are dropped past cache_size"""
+        from app.services.auth import TokenVerifier
+        verifier = TokenVerifier("secret", cache_size=2, clock=FakeClock())
+        for subject in ("a", "b", "c"):
+            verifier.verify(verifier.issue(subject))
+        assert len(verifier) == 2
+    
+    def test_revocation(self):
+        """Test revoked tokens and tokens rejected by the hook are refused, cached or not"""
+        from app.services.auth import TokenError, TokenVerifier
+        verifier = TokenVerifier("secret", clock=FakeClock())
+        token, other = verifier.issue("a"), verifier.issue("b")
+        verifier.verify(token)
+        verifier.revoke(token)
+        with pytest.raises(TokenError):
+            verifier.verify(token)
+        
+        verifier.verify(other)
+        verifier.is_revoked = lambda claims: claims["sub"] == "b"
+        with pytest.raises(TokenError):
+            verifier.verify(other)
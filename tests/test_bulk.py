@@ -0,0 +1,136 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.bulk import BulkImport, RecordError, import_lines, iter_ndjson, iter_repository_records, parse_record
+from app.services.data_service import SECTIONS
+from app.services.repository import DynamoDBRepository, InMemoryRepository
+from app.services.tenants import tenants
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(mock_sections):
+    """In-memory repository holding two CVs"""
+    repository = InMemoryRepository()
+    repository.save_sections("alice", mock_sections)
+    repository.save_sections("bob", mock_sections)
+    return repository
+
+
+def export_lines(repository):
+    return [line.decode() for line in iter_ndjson(iter_repository_records(repository))]
+
+
+class TestBulkRecords:
+    """Test NDJSON export and import of CV data"""
+    
+    def test_round_trip(self, repository, mock_sections):
+        """Test an export imported into an empty repository reproduces every CV"""
+        lines = export_lines(repository)
+        assert len(lines) == 2 * len(SECTIONS)
+        assert all(line.endswith("\n") for line in lines)
+        
+        target = InMemoryRepository()
+        result = import_lines(target, lines)
+        assert result.report() == {"imported": len(lines), "failed": 0, "errors": []}
+        assert sorted(target.list_cv_ids()) == ["alice", "bob"]
+        assert target.load_sections("bob") == mock_sections
+    
+    def test_invalid_records_skipped(self, repository):
+        """Test invalid lines are counted and reported without stopping the import"""
+        lines = export_lines(repository)[:2] + [
+            "not json",
+            json.dumps({"cv_id": "carol", "section": "hobbies", "data": []}),
+            json.dumps({"cv_id": "carol", "section": "skills", "data": [{"name": "x"}]}),
+            "",
+        ]
+        result = import_lines(InMemoryRepository(), lines).report()
+        assert result["imported"] == 2
+        assert result["failed"] == 3
+        assert [error["line"] for error in result["errors"]] == [3, 4, 5]
+    
+    def test_records_normalized(self, mock_sections):
+        """Test imported data is validated and stored in its canonical form"""
+        cv_id, section, data = parse_record(json.dumps({"cv_id": "a", "section": "skills", "data": mock_sections["skills"]}))
+        assert (cv_id, section, data) == ("a", "skills", mock_sections["skills"])
+        with pytest.raises(RecordError):
+            parse_record(json.dumps({"section": "skills", "data": []}))
+    
+    def test_cv_id_must_be_a_handle(self, mock_sections):
+        """Test records are refused unless their cv_id could be served as a handle"""
+        for cv_id in ("Alice", "../alice", "a" * 65, "alice#skills"):
+            with pytest.raises(RecordError):
+                parse_record(json.dumps({"cv_id": cv_id, "section": "skills", "data": mock_sections["skills"]}))
+    
+    def test_batches(self, repository):
+        """Test lines are validated and written a batch at a time"""
+        lines = export_lines(repository)
+        importer = BulkImport(batch_size=5)
+        batches = [batch for batch in map(importer.add_line, lines) if batch]
+        batches.append(importer.flush())
+        assert [len(batch) for batch in batches] == [5, 5, 2]
+    
+    def test_dynamodb_batches_span_cvs(self, repository, mock_sections, dynamodb_client):
+        """Test DynamoDB imports write up to 25 items per request across CVs"""
+        repository.save_sections("carol", mock_sections)
+        dynamo = DynamoDBRepository("cv-table", client=dynamodb_client)
+        import_lines(dynamo, export_lines(repository))
+        assert dynamo.client.calls.count("batch_write_item") == 1
+        repository.save_sections("dave", mock_sections)
+        repository.save_sections("erin", mock_sections)
+        import_lines(dynamo, export_lines(repository))
+        assert dynamo.client.calls.count("batch_write_item") == 3
+        assert list(dynamo.list_cv_ids()) == ["alice", "bob", "carol", "dave", "erin"]
+    
+    def test_dynamodb_repeated_records_last_wins(self, repository, mock_sections, dynamodb_client):
+        """Test a batch repeating a CV section writes it once, with the last record's data"""
+        dynamo = DynamoDBRepository("cv-table", client=dynamodb_client)
+        lines = export_lines(repository) + [
+            json.dumps({"cv_id": "alice", "section": "skills", "data": mock_sections["skills"][:1]})
+        ]
+        result = import_lines(dynamo, lines * 2).report()
+        assert result["failed"] == 0
+        assert dynamo.client.calls.count("batch_write_item") == 1
+        assert dynamo.load_sections("alice", ["skills"])["skills"] == mock_sections["skills"][:1]
+        assert dynamo.load_sections("bob", ["skills"])["skills"] == mock_sections["skills"]
+
+
+class TestBulkRoutes:
+    """Test the /admin/export and /admin/import endpoints"""
+    
+    def test_refused_when_disabled(self, monkeypatch):
+        """Test bulk endpoints are gated like the other admin endpoints"""
+        from app.config import settings
+        
+        monkeypatch.setattr(settings, "admin_enabled", False)
+        assert client.get("/admin/export").status_code == 403
+    
+    def test_export_and_import(self, repository, monkeypatch, admin_headers):
+        """Test an export streamed from one store imports into another"""
+        monkeypatch.setattr(tenants, "repository", repository)
+        response = client.get("/admin/export", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = response.text.splitlines()
+        assert {json.loads(line)["cv_id"] for line in lines} == {"alice", "bob"}
+        
+        target = InMemoryRepository()
+        monkeypatch.setattr(tenants, "repository", target)
+        try:
+            response = client.post("/admin/import", content=response.content, headers=admin_headers)
+            assert response.status_code == 200
+            assert response.json()["data"]["imported"] == len(lines)
+            assert client.get("/api/v1/bob/me").status_code == 200
+        finally:
+            tenants.evict()
+    
+    def test_import_needs_repository(self, monkeypatch, admin_headers):
+        """Test importing is refused when there's nowhere to store the data"""
+        monkeypatch.setattr(tenants, "repository", None)
+        response = client.post("/admin/import", content=b"", headers=admin_headers)
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "NO_REPOSITORY"
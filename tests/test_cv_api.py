@@ -328,3 +328,696 @@ class TestPerformance:
             assert response.status_code == 200
             response_time = end_time - start_time
             assert response_time < 1.0, f"Endpoint {endpoint} took too long: {response_time}s"
+
+
+class TestResponseCache:
+    """Test cached response payloads"""
+    
+    def test_cached_payload_reused_between_requests(self):
+        """Test repeated requests reuse the cached payload without rebuilding"""
+        from app.services.data_service import data_service
+        from app.services.response_cache import ResponseCache
+        
+        cache = ResponseCache(data_service)
+        calls = []
+        
+        def builder():
+            calls.append(1)
+            return {"value": 1}, "Built"
+        
+        first = cache.get_or_build("test", ("profile",), builder)
+        second = cache.get_or_build("test", ("profile",), builder)
+        assert first is second
+        assert len(calls) == 1
+    
+    def test_cache_invalidated_when_section_changes(self):
+        """Test updating a data section invalidates responses built from it"""
+        from app.services.data_service import data_service
+        
+        original_name = data_service.profile.name
+        client.get("/api/v1/me")
+        try:
+            data_service.profile = data_service.profile.model_copy(update={"name": "Updated Name"})
+            data_service.mark_updated("profile")
+            assert client.get("/api/v1/me").json()["data"]["name"] == "Updated Name"
+            assert client.get("/api/v1/summary").json()["data"]["profile"]["name"] == "Updated Name"
+        finally:
+            data_service.profile = data_service.profile.model_copy(update={"name": original_name})
+            data_service.mark_updated("profile")
+    
+    def test_cached_response_has_fresh_timestamp(self):
+        """Test cached responses still use the standard envelope"""
+        response = client.get("/api/v1/skills")
+        data = response.json()
+        assert set(data.keys()) == {"success", "timestamp", "message", "data"}
+        assert data["success"] is True
+
+
+class TestStableEnvelope:
+    """Test the opt-in stable envelope mode"""
+    
+    def test_live_mode_is_default(self):
+        """Test the live envelope remains the default"""
+        from app.config import settings
+        assert settings.envelope_mode == "live"
+    
+    def test_stable_bodies_identical_between_requests(self):
+        """Test stable mode returns byte-identical bodies until data changes"""
+        from app.config import settings
+        from app.services.data_service import data_service
+        
+        settings.envelope_mode = "stable"
+        try:
+            first = client.get("/api/v1/skills")
+            second = client.get("/api/v1/skills")
+            assert first.content == second.content
+            last_modified = data_service.get_last_modified(("skills",))
+            assert first.json()["timestamp"] == last_modified.isoformat()
+            
+            data_service.mark_updated("skills")
+            third = client.get("/api/v1/skills")
+            assert third.json()["timestamp"] != first.json()["timestamp"]
+        finally:
+            settings.envelope_mode = "live"
+    
+    def test_strong_etag_covers_timestamp(self):
+        """Test the strong ETag changes with the timestamp even when the data doesn't"""
+        from app.config import settings
+        from app.services.data_service import data_service
+        
+        settings.envelope_mode = "stable"
+        try:
+            first = client.get("/api/v1/skills")
+            data_service.mark_updated("skills")
+            second = client.get("/api/v1/skills", headers={"If-None-Match": first.headers["etag"]})
+            assert second.status_code == 200
+            assert second.headers["etag"] != first.headers["etag"]
+        finally:
+            settings.envelope_mode = "live"
+
+
+class TestConditionalRequests:
+    """Test ETag / Last-Modified conditional GET support"""
+    
+    def test_validators_present(self):
+        """Test CV endpoints send ETag and Last-Modified headers"""
+        response = client.get("/api/v1/summary")
+        assert response.status_code == 200
+        assert response.headers.get("etag")
+        assert response.headers.get("last-modified")
+    
+    def test_if_none_match_returns_304(self):
+        """Test a matching If-None-Match gets an empty 304"""
+        etag = client.get("/api/v1/skills").headers["etag"]
+        response = client.get("/api/v1/skills", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    
+    def test_if_modified_since_returns_304(self):
+        """Test an up-to-date If-Modified-Since gets a 304"""
+        last_modified = client.get("/api/v1/summary").headers["last-modified"]
+        response = client.get("/api/v1/summary", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+    
+    def test_stale_etag_returns_full_response(self):
+        """Test a non-matching ETag gets the full response"""
+        response = client.get("/api/v1/skills", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+    
+    def test_etag_unaffected_by_unrelated_section(self):
+        """Test an edit to one section keeps other endpoints' ETags"""
+        from app.services.data_service import data_service
+        
+        skills_etag = client.get("/api/v1/skills").headers["etag"]
+        data_service.mark_updated("contact_info")
+        assert client.get("/api/v1/skills").headers["etag"] == skills_etag
+    
+    def test_etag_strong_in_stable_mode(self):
+        """Test stable envelope mode issues strong ETags"""
+        from app.config import settings
+        
+        settings.envelope_mode = "stable"
+        try:
+            etag = client.get("/api/v1/me").headers["etag"]
+            assert not etag.startswith("W/")
+        finally:
+            settings.envelope_mode = "live"
+
+
+class TestXMLResponses:
+    """Test XML content negotiation"""
+    
+    def test_xml_response_via_accept(self):
+        """Test Accept: application/xml returns a parseable XML envelope"""
+        import xml.etree.ElementTree as ET
+        
+        response = client.get("/api/v1/me", headers={"Accept": "application/xml"})
+        assert response.status_code == 200
+        assert "application/xml" in response.headers.get("content-type", "")
+        root = ET.fromstring(response.content)
+        assert root.tag == "response"
+        assert root.findtext("success") == "true"
+        assert root.find("data/name").text == client.get("/api/v1/me").json()["data"]["name"]
+    
+    def test_xml_lists_use_item_elements(self):
+        """Test list data is rendered as repeated item elements"""
+        import xml.etree.ElementTree as ET
+        
+        response = client.get("/api/v1/experience", headers={"Accept": "text/xml"})
+        root = ET.fromstring(response.content)
+        assert len(root.findall("data/item")) == len(client.get("/api/v1/experience").json()["data"])
+    
+    def test_formats_have_distinct_etags(self):
+        """Test JSON and XML representations do not share an ETag"""
+        json_etag = client.get("/api/v1/skills").headers["etag"]
+        xml_etag = client.get("/api/v1/skills", headers={"Accept": "application/xml"}).headers["etag"]
+        assert json_etag != xml_etag
+    
+    def test_unsupported_accept_falls_back_to_json(self):
+        """Test unknown media types fall back to JSON"""
+        response = client.get("/api/v1/me", headers={"Accept": "text/html"})
+        assert response.status_code == 200
+        assert "application/json" in response.headers.get("content-type", "")
+
+
+class TestJSONBackends:
+    """Test pluggable JSON encoder backends"""
+    
+    def test_backends_produce_equivalent_json(self):
+        """Test every available backend encodes the same document"""
+        import json
+        from app.utils.serializers import OrjsonBackend, StdlibJSONBackend
+        
+        content = client.get("/api/v1/summary").json()
+        backends = [StdlibJSONBackend()]
+        try:
+            backends.append(OrjsonBackend())
+        except ImportError:
+            pass
+        for backend in backends:
+            assert json.loads(backend.dumps(content)) == content
+    
+    def test_stdlib_backend_matches_json_response(self):
+        """Test the stdlib backend is byte-compatible with JSONResponse"""
+        from fastapi.responses import JSONResponse
+        from app.utils.serializers import StdlibJSONBackend
+        
+        content = {"name": "Zoë", "items": [1, 2.5, None, True]}
+        assert StdlibJSONBackend().dumps(content) == JSONResponse(content=content).body
+    
+    def test_switching_backend(self):
+        """Test the API-wide backend can be switched"""
+        from app.utils.serializers import get_json_backend, set_json_backend
+        
+        original = get_json_backend().name
+        try:
+            assert set_json_backend("stdlib").name == "stdlib"
+            assert get_json_backend().name == "stdlib"
+        finally:
+            set_json_backend(original)
+
+
+class TestBinaryResponses:
+    """Test MessagePack and CBOR content negotiation"""
+    
+    def test_msgpack_response(self):
+        """Test Accept: application/msgpack returns the standard envelope"""
+        msgpack = pytest.importorskip("msgpack")
+        
+        response = client.get("/api/v1/summary", headers={"Accept": "application/msgpack"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        body = msgpack.unpackb(response.content)
+        assert body["success"] is True
+        assert set(body.keys()) == {"success", "timestamp", "message", "data"}
+        assert body["data"] == client.get("/api/v1/summary").json()["data"]
+    
+    def test_cbor_response(self):
+        """Test Accept: application/cbor returns the standard envelope"""
+        cbor2 = pytest.importorskip("cbor2")
+        
+        response = client.get("/api/v1/experience", headers={"Accept": "application/cbor"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/cbor"
+        body = cbor2.loads(response.content)
+        assert body["success"] is True
+        assert body["data"] == client.get("/api/v1/experience").json()["data"]
+
+
+class TestCompression:
+    """Test response compression"""
+    
+    def test_large_response_gzipped(self):
+        """Test large responses are gzip-encoded when the client accepts it"""
+        response = client.get("/api/v1/summary", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert "Accept-Encoding" in response.headers.get("vary", "")
+        assert response.json()["success"] is True
+    
+    def test_identity_when_not_accepted(self):
+        """Test responses are uncompressed without Accept-Encoding"""
+        response = client.get("/api/v1/summary", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+    
+    def test_small_response_not_compressed(self):
+        """Test bodies below the minimum size are sent as-is"""
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+    
+    def test_strong_etag_variants_compressed_once(self):
+        """Test bodies with a strong ETag are compressed once and reused"""
+        from app.middleware.compression import CompressionMiddleware
+        
+        middleware = CompressionMiddleware(app=None)
+        body = b'{"data":"' + b"x" * 2000 + b'"}'
+        first = middleware.compress(body, "gzip", '"abc"')
+        second = middleware.compress(body, "gzip", '"abc"')
+        assert first is second
+    
+    def test_stable_mode_compressed_body_follows_timestamp(self):
+        """Test a precompressed stable body is not reused once its timestamp changes"""
+        from app.config import settings
+        from app.services.data_service import data_service
+        
+        settings.envelope_mode = "stable"
+        try:
+            headers = {"Accept-Encoding": "gzip"}
+            first = client.get("/api/v1/summary", headers=headers)
+            assert first.headers["content-encoding"] == "gzip"
+            data_service.mark_updated("skills")
+            second = client.get("/api/v1/summary", headers=headers)
+            assert second.json()["timestamp"] == data_service.get_last_modified(("skills",)).isoformat()
+            assert second.json()["timestamp"] != first.json()["timestamp"]
+        finally:
+            settings.envelope_mode = "live"
+    
+    def test_stable_mode_conditional_request_with_compression(self):
+        """Test the weakened ETag of a compressed body still revalidates"""
+        from app.config import settings
+        
+        settings.envelope_mode = "stable"
+        try:
+            headers = {"Accept-Encoding": "gzip"}
+            etag = client.get("/api/v1/summary", headers=headers).headers["etag"]
+            assert etag.startswith("W/")
+            response = client.get("/api/v1/summary", headers={**headers, "If-None-Match": etag})
+            assert response.status_code == 304
+        finally:
+            settings.envelope_mode = "live"
+
+
+class TestPrebuiltOpenAPI:
+    """Test precomputed OpenAPI document and optional docs routes"""
+    
+    def test_openapi_served_from_memory(self):
+        """Test the OpenAPI document is encoded once and reused"""
+        first = client.get("/openapi.json")
+        second = client.get("/openapi.json")
+        assert first.content == second.content
+        assert "/api/v1/summary" in first.json()["paths"]
+    
+    def test_prebuilt_schema_file(self, tmp_path, monkeypatch):
+        """Test a build-time OpenAPI file is served as-is"""
+        import app.docs as docs
+        from app.config import settings
+        
+        path = str(tmp_path / "openapi.json")
+        docs.write_openapi(app, path)
+        monkeypatch.setattr(settings, "openapi_schema_path", path)
+        monkeypatch.setattr(app.state, "openapi_body", None, raising=False)
+        
+        response = client.get("/openapi.json")
+        assert response.content == open(path, "rb").read()
+    
+    def test_docs_not_mounted_in_production(self, monkeypatch):
+        """Test the app built with production settings has no docs routes"""
+        import importlib
+        import app.config as config
+        import app.main as main
+        
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        monkeypatch.delenv("ENABLE_DOCS", raising=False)
+        monkeypatch.setattr(config, "settings", config.Settings())
+        assert config.settings.enable_docs is False
+        try:
+            production_app = importlib.reload(main).app
+        finally:
+            monkeypatch.undo()
+            importlib.reload(main)
+        
+        production_client = TestClient(production_app)
+        assert production_client.get("/api/v1/me").status_code == 200
+        for path in ("/docs", "/redoc", "/openapi.json"):
+            assert production_client.get(path).status_code == 404
+    
+    def test_production_import_skips_docs_and_admin(self):
+        """Test a production cold start doesn't import the docs or admin modules"""
+        import os
+        import subprocess
+        import sys
+        
+        env = {**os.environ, "ENVIRONMENT": "production", "ADMIN_ENABLED": "false"}
+        env.pop("ENABLE_DOCS", None)
+        modules = ("app.docs", "app.routes.admin_routes", "app.services.auth", "app.services.bulk")
+        output = subprocess.run(
+            [sys.executable, "-c", f"import sys, app.main; print([m for m in {modules!r} if m in sys.modules])"],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        assert output.strip() == "[]"
+
+
+class TestFieldProjection:
+    """Test sparse fieldsets and section selection"""
+    
+    def test_summary_include_sections(self):
+        """Test include= limits the summary to the requested sections"""
+        response = client.get("/api/v1/summary", params={"include": "profile,stats"})
+        assert response.status_code == 200
+        assert set(response.json()["data"].keys()) == {"profile", "stats"}
+    
+    def test_summary_include_depends_on_its_sections(self):
+        """Test an include= summary is only rebuilt when its own sections change"""
+        from app.config import settings
+        from app.services.data_service import data_service
+        
+        # Stable ETags cover the last-modified time of the entry's sections
+        settings.envelope_mode = "stable"
+        try:
+            params = {"include": "profile"}
+            etag = client.get("/api/v1/summary", params=params).headers["etag"]
+            data_service.mark_updated("skills")
+            response = client.get("/api/v1/summary", params=params, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+        finally:
+            settings.envelope_mode = "live"
+    
+    def test_summary_fields(self):
+        """Test fields= limits summary sections to the requested fields"""
+        response = client.get("/api/v1/summary", params={"fields": "profile.name,top_skills.name"})
+        data = response.json()["data"]
+        assert set(data["profile"].keys()) == {"name"}
+        assert all(set(skill.keys()) == {"name"} for skill in data["top_skills"])
+        # Sections without fields are returned in full
+        assert "company" in data["recent_experience"][0]
+    
+    def test_list_endpoint_fields(self):
+        """Test fields= applies to each item of list endpoints"""
+        response = client.get("/api/v1/experience", params={"fields": "company,title"})
+        assert all(set(exp.keys()) == {"company", "title"} for exp in response.json()["data"])
+    
+    def test_skills_grouping_survives_projection(self):
+        """Test skills are still grouped when category isn't requested"""
+        full = client.get("/api/v1/skills").json()["data"]
+        projected = client.get("/api/v1/skills", params={"fields": "name"}).json()["data"]
+        assert projected["categories"] == full["categories"]
+        assert all(set(skill.keys()) == {"name"} for skill in projected["all_skills"])
+    
+    def test_unknown_field_rejected(self):
+        """Test unknown fields and sections return 400"""
+        assert client.get("/api/v1/summary", params={"fields": "profile.salary"}).status_code == 400
+        assert client.get("/api/v1/summary", params={"include": "secrets"}).status_code == 400
+        response = client.get("/api/v1/projects", params={"fields": "budget"})
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_QUERY"
+    
+    def test_empty_selection_rejected(self):
+        """Test empty include and fields parameters return 400 rather than an empty selection"""
+        for params in ({"include": ""}, {"include": ","}, {"fields": ""}):
+            response = client.get("/api/v1/summary", params=params)
+            assert response.status_code == 400
+            assert response.json()["error_code"] == "INVALID_QUERY"
+        assert client.get("/api/v1/projects", params={"fields": " , "}).status_code == 400
+    
+    def test_projection_variants_cached_separately(self):
+        """Test each projection gets its own cache entry and ETag"""
+        full = client.get("/api/v1/summary").headers["etag"]
+        projected = client.get("/api/v1/summary", params={"include": "profile"}).headers["etag"]
+        reordered = client.get("/api/v1/summary", params={"include": "profile,"}).headers["etag"]
+        assert full != projected
+        assert projected == reordered
+
+
+class TestPagination:
+    """Test cursor-based pagination"""
+    
+    def test_skills_pages_cover_every_skill_once(self):
+        """Test following next_cursor visits each skill exactly once"""
+        total = client.get("/api/v1/skills").json()["data"]["total_skills"]
+        seen = []
+        params = {"limit": 5}
+        while True:
+            data = client.get("/api/v1/skills", params=params).json()["data"]
+            assert len(data["items"]) <= 5
+            assert data["total"] == total
+            seen.extend((skill["category"], skill["name"]) for skill in data["items"])
+            if data["next_cursor"] is None:
+                break
+            params = {"limit": 5, "cursor": data["next_cursor"]}
+        assert len(seen) == total
+        assert len(set(seen)) == total
+        assert seen == sorted(seen, key=lambda pair: (pair[0].lower(), pair[1].lower()))
+    
+    def test_experience_page_most_recent_first(self):
+        """Test experience pages are ordered by start date, newest first"""
+        data = client.get("/api/v1/experience", params={"limit": 10}).json()["data"]
+        start_dates = [exp["start_date"] for exp in data["items"]]
+        assert start_dates == sorted(start_dates, reverse=True)
+    
+    def test_projects_page_with_fields(self):
+        """Test pagination combines with field projection"""
+        data = client.get("/api/v1/projects", params={"limit": 1, "fields": "name"}).json()["data"]
+        assert len(data["items"]) == 1
+        assert set(data["items"][0].keys()) == {"name"}
+    
+    def test_invalid_cursor_rejected(self):
+        """Test malformed cursors return 400"""
+        response = client.get("/api/v1/skills", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_QUERY"
+    
+    def test_limit_bounds(self):
+        """Test out-of-range limits are rejected"""
+        assert client.get("/api/v1/skills", params={"limit": 0}).status_code == 422
+        assert client.get("/api/v1/skills", params={"limit": 1000}).status_code == 422
+    
+    def test_unpaginated_shape_unchanged(self):
+        """Test responses without limit/cursor keep their original shape"""
+        assert isinstance(client.get("/api/v1/experience").json()["data"], list)
+
+
+class TestDerivedIndexes:
+    """Test the precomputed skill and project indexes"""
+    
+    def test_category_index_matches_skills(self):
+        """Test the category index groups every skill under its category key"""
+        from app.services.data_service import data_service
+        from app.services.indexes import category_key, views
+        skills = data_service.get_skills()
+        index = views.skill_category_index()
+        assert sorted(p for positions in index.values() for p in positions) == list(range(len(skills)))
+        for key, positions in index.items():
+            assert all(category_key(skills[p].category) == key for p in positions)
+    
+    def test_level_index_and_top_skills(self):
+        """Test the level index and top skills agree with the skill levels"""
+        from app.services.data_service import data_service
+        from app.services.indexes import views
+        skills = data_service.get_skills()
+        for level, positions in views.skill_level_index().items():
+            assert all(skills[p].level.value == level for p in positions)
+        top = views.top_skill_positions()
+        assert len(top) <= 8
+        assert top == sorted(top)
+        assert all(skills[p].level.value in ("expert", "advanced") for p in top)
+    
+    def test_views_reused_until_section_changes(self):
+        """Test views are built once and rebuilt after their section is updated"""
+        from app.services.data_service import data_service
+        from app.services.indexes import views
+        partitions = views.project_partitions()
+        assert views.project_partitions() is partitions
+        skills_index = views.skill_category_index()
+        data_service.mark_updated("projects")
+        assert views.project_partitions() is not partitions
+        assert views.skill_category_index() is skills_index
+    
+    def test_project_split_in_response(self):
+        """Test the projects endpoint splits projects using the partition"""
+        data = client.get("/api/v1/projects").json()["data"]
+        assert all(project["current"] for project in data["current_projects"])
+        assert not any(project["current"] for project in data["past_projects"])
+        assert len(data["current_projects"]) + len(data["past_projects"]) == data["total_projects"]
+
+
+class TestSearch:
+    """Test the full-text search endpoint"""
+    
+    def test_search_technology(self):
+        """Test searching a technology finds entries using it"""
+        response = client.get("/api/v1/search", params={"q": "python"})
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["total"] == len(data["results"])
+        assert data["total"] > 0
+        scores = [result["score"] for result in data["results"]]
+        assert scores == sorted(scores, reverse=True)
+        assert {result["type"] for result in data["results"]} <= {"experience", "project", "skill"}
+    
+    def test_prefix_matching(self):
+        """Test a partial term matches the words it starts"""
+        full = client.get("/api/v1/search", params={"q": "python"}).json()["data"]
+        partial = client.get("/api/v1/search", params={"q": "pyth"}).json()["data"]
+        assert partial["total"] >= full["total"]
+    
+    def test_case_and_order_insensitive(self):
+        """Test equivalent queries return the same results"""
+        first = client.get("/api/v1/search", params={"q": "Python API"}).json()["data"]
+        second = client.get("/api/v1/search", params={"q": "api python"}).json()["data"]
+        assert first == second
+    
+    def test_no_searchable_terms(self):
+        """Test queries without terms are rejected"""
+        response = client.get("/api/v1/search", params={"q": "!!!"})
+        assert response.status_code == 400
+        assert client.get("/api/v1/search").status_code == 422
+    
+    def test_inverted_index(self):
+        """Test the inverted index ranks exact matches over prefix matches"""
+        from types import SimpleNamespace
+        from app.services.search import InvertedIndex
+        items = [SimpleNamespace(name="Go"), SimpleNamespace(name="GraphQL"), SimpleNamespace(name="Google Cloud")]
+        index = InvertedIndex(items, {"name": 1.0})
+        assert index.prefixed("g") == ["go", "google", "graphql"]
+        scores = index.search(["go"])
+        assert set(scores) == {0, 2}
+        assert scores[0] > scores[2]
+        assert index.search(["google", "cloud"]) == {2: 2.0}
+        assert index.search(["missing"]) == {}
+
+
+class TestFilters:
+    """Test technology, level and category filters"""
+    
+    def test_experience_by_technology(self):
+        """Test experience can be filtered by technology, case-insensitively"""
+        data = client.get("/api/v1/experience", params={"technology": "next.js"}).json()["data"]
+        assert len(data) > 0
+        assert all("Next.js" in exp["technologies"] for exp in data)
+    
+    def test_projects_by_technology_and_current(self):
+        """Test project filters are combined"""
+        data = client.get("/api/v1/projects", params={"technology": "Supabase"}).json()["data"]
+        assert data["total_projects"] > 0
+        assert all("Supabase" in project["technologies"] for project in data["all_projects"])
+        current = client.get("/api/v1/projects", params={"technology": "Supabase", "current": "true"}).json()["data"]
+        assert all(project["current"] for project in current["all_projects"])
+        assert current["past_projects"] == []
+    
+    def test_skills_by_level_and_category(self):
+        """Test skills can be filtered by level and category"""
+        data = client.get("/api/v1/skills", params={"level": "Advanced", "category": "databases"}).json()["data"]
+        assert data["total_skills"] > 0
+        assert all(skill["level"] == "advanced" and skill["category"] == "Databases" for skill in data["all_skills"])
+        assert data["categories"] == ["databases"]
+    
+    def test_unknown_values(self):
+        """Test unknown technologies match nothing and unknown levels are rejected"""
+        assert client.get("/api/v1/experience", params={"technology": "COBOL"}).json()["data"] == []
+        response = client.get("/api/v1/skills", params={"level": "guru"})
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_QUERY"
+    
+    def test_filtered_pages(self):
+        """Test filters combine with pagination"""
+        data = client.get("/api/v1/skills", params={"level": "advanced", "limit": 3}).json()["data"]
+        assert len(data["items"]) == 3
+        assert data["total"] == len(client.get("/api/v1/skills", params={"level": "advanced"}).json()["data"]["all_skills"])
+        assert all(skill["level"] == "advanced" for skill in data["items"])
+    
+    def test_intersect(self):
+        """Test set intersection returns sorted common positions"""
+        from app.services.indexes import intersect
+        assert intersect([frozenset({3, 1, 2}), frozenset({2, 3})]) == [2, 3]
+        assert intersect([frozenset({1}), frozenset()]) == []
+
+
+class TestDateRanges:
+    """Test from/to date filters and the timeline"""
+    
+    def test_experience_overlapping_period(self):
+        """Test only entries overlapping the period are returned"""
+        data = client.get("/api/v1/experience", params={"from": "2022", "to": "2023"}).json()["data"]
+        for exp in data:
+            assert exp["start_date"] <= "2023-12-31"
+            assert exp["current"] or exp["end_date"] is None or exp["end_date"] >= "2022-01-01"
+    
+    def test_open_bounds(self):
+        """Test a lone from= keeps current entries"""
+        data = client.get("/api/v1/projects", params={"from": "2100"}).json()["data"]
+        assert all(project["current"] or project["end_date"] is None for project in data["all_projects"])
+        assert client.get("/api/v1/education", params={"to": "1900"}).json()["data"] == []
+    
+    def test_invalid_dates(self):
+        """Test malformed or reversed periods are rejected"""
+        assert client.get("/api/v1/experience", params={"from": "last year"}).status_code == 400
+        assert client.get("/api/v1/experience", params={"from": "2023", "to": "2022"}).status_code == 400
+    
+    def test_timeline_is_chronological(self):
+        """Test the timeline merges every section by start date"""
+        data = client.get("/api/v1/timeline").json()["data"]
+        assert {entry["type"] for entry in data} == {"experience", "education", "project"}
+        start_dates = [entry["start_date"] for entry in data]
+        assert start_dates == sorted(start_dates)
+        total = (
+            len(client.get("/api/v1/experience").json()["data"])
+            + len(client.get("/api/v1/education").json()["data"])
+            + client.get("/api/v1/projects").json()["data"]["total_projects"]
+        )
+        assert len(data) == total
+    
+    def test_interval_index(self):
+        """Test overlap queries against the interval index"""
+        from datetime import date
+        from types import SimpleNamespace
+        from app.utils.intervals import IntervalIndex, parse_period
+        items = [
+            SimpleNamespace(start_date=date(2020, 1, 1), end_date=date(2021, 6, 1), current=False),
+            SimpleNamespace(start_date=date(2022, 3, 1), end_date=None, current=True),
+            SimpleNamespace(start_date=date(2019, 1, 1), end_date=date(2019, 12, 1), current=False),
+        ]
+        index = IntervalIndex(items)
+        assert index.overlapping(*parse_period("2021", "2022")) == [0, 1]
+        assert index.overlapping(*parse_period(None, "2019-06")) == [2]
+        assert index.overlapping(*parse_period("2019-06", None)) == [2, 0, 1]
+        assert index.overlapping(*parse_period("2021-07", "2021-12")) == []
+        assert index.chronological() == [2, 0, 1]
+        assert parse_period("2024-02", "2024-02") == (date(2024, 2, 1), date(2024, 2, 29))
+    
+    def test_interval_index_matches_scan(self):
+        """Test overlap queries agree with checking every interval, across many shapes"""
+        import random
+        from datetime import date, timedelta
+        from types import SimpleNamespace
+        from app.utils.intervals import IntervalIndex, interval_end
+        rng = random.Random(7)
+        base = date(2000, 1, 1)
+        items = []
+        for _ in range(200):
+            start = base + timedelta(days=rng.randrange(8000))
+            ongoing = rng.random() < 0.1
+            end = None if ongoing else start + timedelta(days=rng.randrange(2000))
+            items.append(SimpleNamespace(start_date=start, end_date=end, current=ongoing))
+        index = IntervalIndex(items)
+        for _ in range(200):
+            start = base + timedelta(days=rng.randrange(9000))
+            end = start + timedelta(days=rng.randrange(1500))
+            for bounds in ((start, end), (start, None), (None, end)):
+                expected = [
+                    position for position in index.chronological()
+                    if (bounds[1] is None or items[position].start_date <= bounds[1])
+                    and (bounds[0] is None or interval_end(items[position]) >= bounds[0])
+                ]
+                assert index.overlapping(*bounds) == expected
@@ -0,0 +1,84 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.middleware.rate_limit import InMemoryRateLimitStore, RateLimitMiddleware
+
+
+class FakeClock:
+    """Clock advanced by hand"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+def consume(store, key, rate=1.0, capacity=3):
+    return asyncio.run(store.consume(key, rate, capacity))
+
+
+class TestTokenBuckets:
+    """Test the in-memory token bucket store"""
+    
+    def test_burst_then_refill(self):
+        """Test a full bucket allows a burst, then refills at the rate"""
+        clock = FakeClock()
+        store = InMemoryRateLimitStore(clock=clock)
+        assert [consume(store, "a").allowed for _ in range(4)] == [True, True, True, False]
+        refused = consume(store, "a")
+        assert refused.retry_after == 1.0
+        assert refused.reset_after == 3.0
+        clock.now += 1
+        decision = consume(store, "a")
+        assert decision.allowed and decision.remaining == 0
+        assert consume(store, "b").allowed
+    
+    def test_idle_full_buckets_dropped(self):
+        """Test buckets that have refilled are evicted once they reach the LRU's end"""
+        clock = FakeClock()
+        store = InMemoryRateLimitStore(clock=clock)
+        consume(store, "a")
+        consume(store, "b")
+        clock.now += 10
+        consume(store, "c")
+        assert len(store) == 1
+    
+    def test_max_keys(self):
+        """Test the least recently used bucket is dropped past max_keys"""
+        store = InMemoryRateLimitStore(max_keys=2, clock=FakeClock())
+        for key in ("a", "b", "a", "c"):
+            consume(store, key)
+        assert list(store._buckets) == ["a", "c"]
+
+
+class TestRateLimitMiddleware:
+    """Test rate limiting of API requests"""
+    
+    def test_limit_enforced(self):
+        """Test requests past the burst are refused with a 429 and Retry-After"""
+        client = TestClient(RateLimitMiddleware(app, requests_per_minute=60, burst=2))
+        first = client.get("/api/v1/summary")
+        assert first.status_code == 200
+        assert first.headers["ratelimit-limit"] == "2"
+        assert first.headers["ratelimit-remaining"] == "1"
+        assert first.headers["ratelimit-policy"] == "60;w=60"
+        client.get("/api/v1/summary")
+        refused = client.get("/api/v1/summary")
+        assert refused.status_code == 429
+        assert refused.json()["error_code"] == "RATE_LIMITED"
+        assert int(refused.headers["retry-after"]) >= 1
+    
+    def test_health_exempt(self):
+        """Test health checks are never limited"""
+        client = TestClient(RateLimitMiddleware(app, requests_per_minute=60, burst=1))
+        assert all(client.get("/health").status_code == 200 for _ in range(3))
+        assert "ratelimit-limit" not in client.get("/health").headers
+    
+    def test_custom_key(self):
+        """Test clients are told apart by the key function"""
+        keys = iter(["a", "b", "a"])
+        client = TestClient(RateLimitMiddleware(app, requests_per_minute=60, burst=1, key_func=lambda scope: next(keys)))
+        assert [client.get("/").status_code for _ in range(3)] == [200, 200, 429]
@@ -0,0 +1,495 @@
+import json
+
+import pytest
+
+from app.services.data_service import (
+    MOCK_DATA_UPDATED_AT, SECTIONS, UNKNOWN_UPDATED_AT, DataService, VersionConflict
+)
+from app.services.repository import DynamoDBRepository, InMemoryRepository, WriteConflict, section_digest
+from tests.conftest import FakeDynamoDBClient
+
+
+class ThrottledDynamoDBClient(FakeDynamoDBClient):
+    """Fake client that leaves whole batches unprocessed for its first calls (or forever)"""
+    
+    def __init__(self, throttled_calls=None):
+        super().__init__()
+        self.throttled_calls = throttled_calls
+    
+    def _throttled(self):
+        if self.throttled_calls is None:
+            return True
+        self.throttled_calls -= 1
+        return self.throttled_calls >= 0
+    
+    def batch_write_item(self, RequestItems):
+        if self._throttled():
+            self.calls.append("batch_write_item")
+            return {"UnprocessedItems": RequestItems}
+        return super().batch_write_item(RequestItems)
+    
+    def batch_get_item(self, RequestItems):
+        if self._throttled():
+            self.calls.append("batch_get_item")
+            return {"Responses": {}, "UnprocessedKeys": RequestItems}
+        return super().batch_get_item(RequestItems)
+
+
+class TestInMemoryRepository:
+    """Test the in-memory repository stand-in"""
+    
+    def test_data_service_loads_in_one_call(self, mock_sections):
+        """Test DataService loads every section with a single repository call"""
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        
+        service = DataService(repository=repository, cv_id="me")
+        assert repository.load_calls == 1
+        assert service.export_sections() == mock_sections
+    
+    def test_missing_cv_raises(self):
+        """Test loading an unknown CV fails clearly"""
+        with pytest.raises(LookupError):
+            DataService(repository=InMemoryRepository(), cv_id="nobody")
+    
+    def test_load_subset(self, mock_sections):
+        """Test loading only some sections"""
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        assert set(repository.load_sections("me", ["skills", "profile"])) == {"skills", "profile"}
+
+
+class TestDynamoDBRepository:
+    """Test the DynamoDB repository against a fake client"""
+    
+    def test_round_trip_uses_single_query(self, mock_sections, dynamodb_client):
+        """Test all sections are written in a batch and read with one Query"""
+        fake_client = dynamodb_client
+        repository = DynamoDBRepository("cv-data", client=fake_client)
+        repository.save_sections("me", mock_sections)
+        fake_client.calls.clear()
+        
+        service = DataService(repository=repository, cv_id="me")
+        assert fake_client.calls == ["query"]
+        assert service.export_sections() == mock_sections
+    
+    def test_subset_uses_batch_get(self, mock_sections, dynamodb_client):
+        """Test loading specific sections uses BatchGetItem"""
+        fake_client = dynamodb_client
+        repository = DynamoDBRepository("cv-data", client=fake_client)
+        repository.save_sections("me", mock_sections)
+        fake_client.calls.clear()
+        
+        loaded = repository.load_sections("me", ["profile", "skills"])
+        assert fake_client.calls == ["batch_get_item"]
+        assert loaded["skills"] == mock_sections["skills"]
+    
+    def test_sections_stored_as_json(self, mock_sections, dynamodb_client):
+        """Test each section is stored as one item holding a JSON string"""
+        fake_client = dynamodb_client
+        DynamoDBRepository("cv-data", client=fake_client).save_sections("me", mock_sections)
+        assert len(fake_client.items) == len(SECTIONS)
+        item = fake_client.items[("CV#me", "SECTION#profile")]
+        assert json.loads(item["data"]["S"]) == mock_sections["profile"]
+    
+    def test_unprocessed_items_retried_with_backoff(self, mock_sections):
+        """Test unprocessed items are retried after growing delays"""
+        fake_client = ThrottledDynamoDBClient(throttled_calls=3)
+        sleeps = []
+        repository = DynamoDBRepository("cv-data", client=fake_client, sleep=sleeps.append)
+        repository.save_sections("me", mock_sections)
+        assert len(fake_client.items) == len(SECTIONS)
+        assert len(sleeps) == 3
+        assert sleeps[2] > sleeps[0]
+    
+    def test_retries_capped(self, mock_sections):
+        """Test a table that never processes the batch fails instead of spinning"""
+        from app.services.repository import BATCH_MAX_ATTEMPTS, BatchIncomplete
+        fake_client = ThrottledDynamoDBClient(throttled_calls=None)
+        repository = DynamoDBRepository("cv-data", client=fake_client, sleep=lambda seconds: None)
+        with pytest.raises(BatchIncomplete):
+            repository.load_sections("me", ["profile"])
+        assert fake_client.calls.count("batch_get_item") == BATCH_MAX_ATTEMPTS
+    
+    def test_conditional_write(self, mock_sections, dynamodb_client):
+        """Test a section write is refused unless the stored digest is an expected one"""
+        fake_client = dynamodb_client
+        repository = DynamoDBRepository("cv-data", client=fake_client)
+        repository.save_sections("me", mock_sections)
+        current = section_digest(mock_sections["skills"])
+        new_skills = mock_sections["skills"][:1]
+        
+        with pytest.raises(WriteConflict):
+            repository.save_section("me", "skills", new_skills, {"outdated"})
+        repository.save_section("me", "skills", new_skills, {current})
+        assert repository.load_sections("me", ["skills"])["skills"] == new_skills
+        with pytest.raises(WriteConflict):
+            repository.save_section("me", "skills", mock_sections["skills"], {current})
+
+
+class SlowRepository(InMemoryRepository):
+    """In-memory repository whose loads block like a network round trip"""
+    
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+    
+    def load_stored_sections(self, cv_id, sections=None):
+        import time
+        time.sleep(self.delay)
+        return super().load_stored_sections(cv_id, sections)
+
+
+class LaggingRepository(InMemoryRepository):
+    """In-memory repository whose loads read the data, then take a while to return it"""
+    
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+    
+    def load_stored_sections(self, cv_id, sections=None):
+        import time
+        loaded = super().load_stored_sections(cv_id, sections)
+        time.sleep(self.delay)
+        return loaded
+
+
+class TestAsyncLoading:
+    """Test async, concurrent section loading"""
+    
+    def test_lazy_service_loads_sections_on_demand(self, mock_sections):
+        """Test a non-preloaded service loads only the sections requested"""
+        import asyncio
+        
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        service = DataService(repository=repository, cv_id="me", preload=False)
+        assert repository.load_calls == 0
+        
+        loaded = asyncio.run(service.load_sections("profile", "skills"))
+        assert repository.load_calls == 2
+        assert loaded["profile"].name == mock_sections["profile"]["name"]
+        assert not service.is_loaded("projects")
+        
+        asyncio.run(service.load_sections("profile"))
+        assert repository.load_calls == 2
+    
+    def test_sections_load_concurrently(self, mock_sections):
+        """Test blocking loads run in the thread pool, not one after another"""
+        import asyncio
+        import time
+        
+        repository = SlowRepository(delay=0.2)
+        repository.save_sections("me", mock_sections)
+        service = DataService(repository=repository, cv_id="me", preload=False)
+        
+        start = time.perf_counter()
+        asyncio.run(service.load_sections("profile", "experiences", "skills", "projects", "contact_info"))
+        elapsed = time.perf_counter() - start
+        assert repository.load_calls == 5
+        assert elapsed < 0.2 * 3
+
+
+class FailingRepository(InMemoryRepository):
+    """In-memory repository whose loads fail until told otherwise"""
+    
+    def __init__(self):
+        super().__init__()
+        self.failing = True
+    
+    def load_stored_sections(self, cv_id, sections=None):
+        if self.failing:
+            self.load_calls += 1
+            raise ConnectionError("backend unavailable")
+        return super().load_stored_sections(cv_id, sections)
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent section loads"""
+    
+    def test_concurrent_misses_share_one_load(self, mock_sections):
+        """Test a burst of concurrent misses triggers a single backend fetch"""
+        import asyncio
+        
+        repository = SlowRepository(delay=0.05)
+        repository.save_sections("me", mock_sections)
+        service = DataService(repository=repository, cv_id="me", preload=False)
+        
+        async def burst():
+            return await asyncio.gather(*(service.load_section("skills") for _ in range(20)))
+        
+        results = asyncio.run(burst())
+        assert repository.load_calls == 1
+        assert all(result is results[0] for result in results)
+    
+    def test_errors_propagate_to_every_waiter(self, mock_sections):
+        """Test a failed load fails all waiters and is retried afterwards"""
+        import asyncio
+        
+        repository = FailingRepository()
+        repository.save_sections("me", mock_sections)
+        service = DataService(repository=repository, cv_id="me", preload=False)
+        
+        async def burst():
+            return await asyncio.gather(
+                *(service.load_section("skills") for _ in range(5)),
+                return_exceptions=True
+            )
+        
+        results = asyncio.run(burst())
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert repository.load_calls == 1
+        
+        repository.failing = False
+        asyncio.run(service.load_section("skills"))
+        assert service.is_loaded("skills")
+    
+    def test_load_timeout(self, mock_sections):
+        """Test waiters give up after the configured timeout"""
+        import asyncio
+        
+        repository = SlowRepository(delay=0.5)
+        repository.save_sections("me", mock_sections)
+        service = DataService(repository=repository, cv_id="me", preload=False, load_timeout=0.05)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(service.load_section("skills"))
+
+
+class TestStaleWhileRevalidate:
+    """Test TTL expiry with background refresh"""
+    
+    def _service(self, repository, mock_sections, **kwargs):
+        repository.save_sections("me", mock_sections)
+        return DataService(repository=repository, cv_id="me", preload=False, **kwargs)
+    
+    def test_stale_section_served_while_refreshing(self, mock_sections):
+        """Test an expired section is served immediately and refreshed in the background"""
+        import asyncio
+        import time
+        
+        repository = InMemoryRepository()
+        service = self._service(repository, mock_sections, ttl={"skills": 0.01}, stale={"skills": 60})
+        
+        async def scenario():
+            first = await service.load_section("skills")
+            version = service.get_versions(("skills",))
+            time.sleep(0.02)
+            assert await service.load_section("skills") is first
+            await asyncio.sleep(0.05)
+            return version
+        
+        version = asyncio.run(scenario())
+        assert repository.load_calls == 2
+        # Unchanged data keeps its version, so cached responses stay valid
+        assert service.get_versions(("skills",)) == version
+    
+    def test_refresh_picks_up_changes(self, mock_sections):
+        """Test a background refresh stores changed data under a new version"""
+        import asyncio
+        import time
+        
+        repository = InMemoryRepository()
+        service = self._service(repository, mock_sections, ttl={"profile": 0.01}, stale={"profile": 60})
+        
+        async def scenario():
+            await service.load_section("profile")
+            repository.save_sections("me", {"profile": {**mock_sections["profile"], "name": "New Name"}})
+            time.sleep(0.02)
+            await service.load_section("profile")
+            await asyncio.sleep(0.05)
+        
+        asyncio.run(scenario())
+        assert service.get_profile().name == "New Name"
+    
+    def test_write_during_refresh_wins(self, mock_sections):
+        """Test a refresh that read the section before a write doesn't overwrite it"""
+        import asyncio
+        
+        repository = LaggingRepository(delay=0.05)
+        service = self._service(repository, mock_sections, ttl={"skills": 0}, stale={"skills": 60})
+        new_skills = mock_sections["skills"][:1]
+        
+        async def scenario():
+            await service.load_section("skills")
+            await service.load_section("skills")
+            await asyncio.sleep(0.01)
+            await service.update_section("skills", new_skills)
+            await asyncio.sleep(0.1)
+        
+        asyncio.run(scenario())
+        assert repository.load_calls == 2
+        assert [skill.name for skill in service.get_skills()] == [new_skills[0]["name"]]
+        assert repository.load_sections("me", ["skills"])["skills"] == new_skills
+    
+    def test_refresh_failure_recorded_not_raised(self, mock_sections):
+        """Test failed background refreshes go to metrics and keep the last good value"""
+        import asyncio
+        import time
+        from app.utils.metrics import metrics
+        
+        repository = FailingRepository()
+        repository.failing = False
+        service = self._service(repository, mock_sections, ttl={"skills": 0.01}, stale={"skills": 60})
+        failures = metrics.get("section_refresh_failures{section=skills}")
+        
+        async def scenario():
+            first = await service.load_section("skills")
+            repository.failing = True
+            time.sleep(0.02)
+            assert await service.load_section("skills") is first
+            await asyncio.sleep(0.05)
+        
+        asyncio.run(scenario())
+        assert metrics.get("section_refresh_failures{section=skills}") == failures + 1
+    
+    def test_expired_past_stale_window_reloads(self, mock_sections):
+        """Test a section past its stale window is reloaded before being served"""
+        import asyncio
+        import time
+        
+        repository = InMemoryRepository()
+        service = self._service(repository, mock_sections, ttl={"skills": 0.01}, stale={"skills": 0.01})
+        
+        asyncio.run(service.load_section("skills"))
+        time.sleep(0.03)
+        asyncio.run(service.load_section("skills"))
+        assert repository.load_calls == 2
+
+
+class TestConditionalWrites:
+    """Test If-Match style writes between services sharing a repository"""
+    
+    def test_write_from_another_instance_conflicts(self, mock_sections):
+        """Test a write against content another instance has replaced is refused by the repository"""
+        import asyncio
+        
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        first = DataService(repository=repository, cv_id="me")
+        second = DataService(repository=repository, cv_id="me")
+        digest = second.section_digest("skills")
+        assert first.section_digest("skills") == digest
+        
+        asyncio.run(first.update_section("skills", mock_sections["skills"][:1], {digest}))
+        with pytest.raises(VersionConflict) as conflict:
+            asyncio.run(second.update_section("skills", mock_sections["skills"][:2], {digest}))
+        assert conflict.value.current_digest == first.section_digest("skills")
+        assert second.section_digest("skills") == first.section_digest("skills")
+        assert repository.load_sections("me", ["skills"])["skills"] == mock_sections["skills"][:1]
+    
+    def test_patches_from_two_instances_both_kept(self, mock_sections):
+        """Test a patch computed from a stale copy is reapplied instead of overwriting another instance's"""
+        import asyncio
+        
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        first = DataService(repository=repository, cv_id="me")
+        second = DataService(repository=repository, cv_id="me")
+        
+        asyncio.run(first.patch_section("skills", [{"op": "replace", "path": "/0/name", "value": "FromA"}]))
+        asyncio.run(second.patch_section("skills", [{"op": "replace", "path": "/1/name", "value": "FromB"}]))
+        stored = repository.load_sections("me", ["skills"])["skills"]
+        assert [skill["name"] for skill in stored[:2]] == ["FromA", "FromB"]
+        assert second.section_digest("skills") == section_digest(stored)
+    
+    def test_if_match_checked_against_repository(self, mock_sections):
+        """Test a stale instance accepts the ETag of another instance's write"""
+        import asyncio
+        
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        first = DataService(repository=repository, cv_id="me")
+        second = DataService(repository=repository, cv_id="me")
+        
+        asyncio.run(first.update_section("skills", mock_sections["skills"][:2]))
+        etag = first.section_digest("skills")
+        asyncio.run(second.patch_section("skills", [{"op": "remove", "path": "/0"}], {etag}))
+        asyncio.run(second.update_section("skills", mock_sections["skills"][:3], {second.section_digest("skills")}))
+        asyncio.run(first.update_section("skills", mock_sections["skills"][:1], {second.section_digest("skills")}))
+        assert repository.load_sections("me", ["skills"])["skills"] == mock_sections["skills"][:1]
+    
+    def test_digest_follows_content(self, mock_sections):
+        """Test the section digest is the same for the same content, whatever the version"""
+        import asyncio
+        
+        service = DataService()
+        digest = service.section_digest("skills")
+        asyncio.run(service.update_section("skills", mock_sections["skills"][:1]))
+        assert service.section_digest("skills") != digest
+        asyncio.run(service.update_section("skills", mock_sections["skills"]))
+        assert service.section_digest("skills") == digest
+
+
+class TestChangeTimes:
+    """Test section change times travel with the data"""
+    
+    def test_instances_agree_on_change_times(self, mock_sections):
+        """Test services loading the same data at different times report the same change times"""
+        import asyncio
+        import time
+        
+        repository = InMemoryRepository()
+        repository.save_sections("me", mock_sections)
+        first = DataService(repository=repository, cv_id="me")
+        time.sleep(0.01)
+        second = DataService(repository=repository, cv_id="me", preload=False, ttl={"skills": 0}, stale={"skills": 0})
+        asyncio.run(second.load_sections(*SECTIONS))
+        assert second.get_last_modified(SECTIONS) == first.get_last_modified(SECTIONS)
+        
+        asyncio.run(first.update_section("skills", mock_sections["skills"][:1]))
+        asyncio.run(second.load_section("skills"))
+        assert second.get_last_modified(("skills",)) == first.get_last_modified(("skills",))
+        assert DataService().get_last_modified(SECTIONS) == MOCK_DATA_UPDATED_AT
+    
+    def test_dynamodb_items_carry_change_time(self, mock_sections, dynamodb_client):
+        """Test DynamoDB items store their write time, and older items without one load with a fixed time"""
+        fake_client = dynamodb_client
+        repository = DynamoDBRepository("cv-data", client=fake_client)
+        repository.save_sections("me", mock_sections)
+        stored = repository.load_stored_sections("me", ["skills"])["skills"]
+        assert stored.updated_at.isoformat() == fake_client.items[("CV#me", "SECTION#skills")]["updated_at"]["S"]
+        
+        del fake_client.items[("CV#me", "SECTION#skills")]["updated_at"]
+        assert repository.load_stored_sections("me", ["skills"])["skills"].updated_at is None
+        service = DataService(repository=repository, cv_id="me")
+        assert service.get_last_modified(("skills",)) == UNKNOWN_UPDATED_AT
+
+
+class TestSnapshot:
+    """Test prebuilt data snapshots"""
+    
+    def test_snapshot_round_trip(self, tmp_path, mock_sections):
+        """Test a service restored from a snapshot serves the same data"""
+        from app.services.snapshot import save_snapshot
+        
+        path = str(tmp_path / "cv-snapshot.pickle")
+        save_snapshot(DataService(), path)
+        
+        service = DataService(snapshot_path=path)
+        assert service.export_sections() == mock_sections
+        assert service.get_versions(SECTIONS) == (1,) * len(SECTIONS)
+    
+    def test_snapshot_keeps_change_times(self, tmp_path, mock_sections):
+        """Test a restored snapshot reports when its data changed, not when it was restored"""
+        import asyncio
+        from app.services.snapshot import save_snapshot
+        
+        source = DataService()
+        asyncio.run(source.update_section("skills", mock_sections["skills"][:1]))
+        path = str(tmp_path / "cv-snapshot.pickle")
+        save_snapshot(source, path)
+        
+        service = DataService(snapshot_path=path)
+        assert service.get_last_modified(("skills",)) == source.get_last_modified(("skills",))
+        assert service.get_last_modified(("profile",)) == MOCK_DATA_UPDATED_AT
+    
+    def test_unknown_snapshot_format_rejected(self, tmp_path):
+        """Test snapshots from an incompatible build are refused"""
+        import pickle
+        from app.services.snapshot import load_snapshot
+        
+        path = tmp_path / "old.pickle"
+        path.write_bytes(pickle.dumps({"format": 0, "sections": {}}))
+        with pytest.raises(ValueError):
+            load_snapshot(str(path))
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.data_service import DataService
+from app.services.repository import InMemoryRepository, section_digest
+from app.services.tenants import Tenant, TenantNotFound, TenantStore, estimate_size, tenants
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(mock_sections):
+    """Repository holding the built-in mock CV under two handles"""
+    repository = InMemoryRepository()
+    repository.save_sections("alice", mock_sections)
+    bob = dict(mock_sections, profile={**mock_sections["profile"], "name": "Bob Example"})
+    repository.save_sections("bob", bob)
+    return repository
+
+
+@pytest.fixture
+def store(repository):
+    """Tenant store backed by the repository, holding at most one extra tenant"""
+    return TenantStore(Tenant("default", DataService()), repository, max_tenants=1)
+
+
+class TestTenantStore:
+    """Test lazy loading and eviction of tenants"""
+    
+    def test_tenants_load_lazily(self, store, repository):
+        """Test a tenant is only loaded when first requested"""
+        assert repository.load_calls == 0
+        tenant = asyncio.run(store.get("alice"))
+        assert tenant.service.cv_id == "alice"
+        assert "alice" in store
+        assert not tenant.service.is_loaded("skills")
+    
+    def test_unknown_handles(self, store):
+        """Test missing CVs and malformed handles are not found"""
+        with pytest.raises(TenantNotFound):
+            asyncio.run(store.get("nobody"))
+        with pytest.raises(TenantNotFound):
+            asyncio.run(store.get("../etc"))
+        assert len(store) == 0
+    
+    def test_least_recently_used_evicted(self, store):
+        """Test only max_tenants tenants are held"""
+        asyncio.run(store.get("alice"))
+        asyncio.run(store.get("bob"))
+        assert len(store) == 1
+        assert "bob" in store and "alice" not in store
+        assert asyncio.run(store.get("default")) is store.default
+    
+    def test_concurrent_first_requests_share_load(self, store):
+        """Test concurrent requests for a new tenant create it once"""
+        async def burst():
+            return await asyncio.gather(*(store.get("alice") for _ in range(5)))
+        
+        results = asyncio.run(burst())
+        assert all(tenant is results[0] for tenant in results)
+    
+    def test_memory_usage(self, store):
+        """Test memory usage is reported per tenant and in total"""
+        asyncio.run(store.get("alice"))
+        usage = store.memory_usage(per_tenant=True)
+        assert usage["loaded_tenants"] == 1
+        assert set(usage["per_tenant"]) == {"default", "alice"}
+        assert usage["per_tenant"]["alice"]["models"] > 0
+        assert usage["total_bytes"] >= sum(usage["per_tenant"]["default"].values())
+        assert estimate_size(["abc"]) > estimate_size([])
+
+
+class TestTenantRoutes:
+    """Test serving other CVs under /api/v1/{handle}"""
+    
+    def test_handle_routes(self, repository, monkeypatch):
+        """Test each handle gets its own CV"""
+        monkeypatch.setattr(tenants, "repository", repository)
+        try:
+            alice = client.get("/api/v1/alice/me")
+            bob = client.get("/api/v1/bob/me")
+            assert alice.status_code == 200
+            assert bob.json()["data"]["name"] == "Bob Example"
+            assert alice.json()["data"]["name"] != "Bob Example"
+            assert client.get("/api/v1/bob/summary").json()["data"]["profile"]["name"] == "Bob Example"
+        finally:
+            tenants.evict()
+    
+    def test_summary_loads_only_included_sections(self, repository, monkeypatch):
+        """Test include= keeps a lazily loaded tenant from fetching unused sections"""
+        monkeypatch.setattr(tenants, "repository", repository)
+        try:
+            response = client.get("/api/v1/alice/summary", params={"include": "profile,top_skills"})
+            assert set(response.json()["data"]) == {"profile", "top_skills"}
+            service = asyncio.run(tenants.get("alice")).service
+            assert service.is_loaded("skills")
+            assert not any(service.is_loaded(section) for section in ("experiences", "projects", "contact_info"))
+        finally:
+            tenants.evict()
+    
+    def test_conditional_put_on_lazy_tenant(self, repository, monkeypatch, admin_headers):
+        """Test If-Match writes to a tenant whose section isn't loaded yet are checked by the repository"""
+        monkeypatch.setattr(tenants, "repository", repository)
+        skills = repository.load_sections("alice", ["skills"])["skills"]
+        body = {"section": "skills", "data": skills[:1]}
+        try:
+            stale = client.put("/admin/alice/skills", json=body, headers={**admin_headers, "If-Match": '"outdated"'})
+            assert stale.status_code == 412
+            assert stale.headers["etag"] == f'"{section_digest(skills)}"'
+            headers = {**admin_headers, "If-Match": stale.headers["etag"]}
+            response = client.put("/admin/alice/skills", json=body, headers=headers)
+            assert response.status_code == 200
+            assert response.headers["etag"] == f'"{section_digest(skills[:1])}"'
+            assert repository.load_sections("alice", ["skills"])["skills"] == skills[:1]
+        finally:
+            tenants.evict()
+    
+    def test_unknown_handle_not_found(self):
+        """Test unknown handles return a 404 error response"""
+        response = client.get("/api/v1/nobody/me")
+        assert response.status_code == 404
+        assert response.json()["error_code"] == "TENANT_NOT_FOUND"
+    
+    def test_default_routes_unchanged(self):
+        """Test routes without a handle serve this deployment's CV"""
+        assert client.get("/api/v1/me").status_code == 200
+        assert client.get(f"/api/v1/{tenants.default.handle}/me").json()["data"] == client.get("/api/v1/me").json()["data"]
+    
+    def test_health_reports_memory(self):
+        """Test the health check reports memory held by loaded CVs"""
+        memory = client.get("/health").json()["memory"]
+        assert memory["total_bytes"] > 0
+        assert "loaded_tenants" in memory